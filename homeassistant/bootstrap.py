@@ -16,12 +16,15 @@ from homeassistant.components import persistent_notification
 import homeassistant.config as conf_util
 import homeassistant.core as core
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import (
+    COMPONENT_SETUP_TIMEOUT, async_setup_components)
 import homeassistant.loader as loader
 from homeassistant.util.logging import AsyncHandler
 from homeassistant.util.package import async_get_user_site, get_user_site
-from homeassistant.util.yaml import clear_secret_cache
+from homeassistant.util.yaml import (
+    clear_secret_cache, load_cache, save_cache)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import timeline
 from homeassistant.helpers.signal import async_register_signal_handling
 
 _LOGGER = logging.getLogger(__name__)
@@ -77,10 +80,13 @@ def async_from_config_dict(config: Dict[str, Any],
     This method is a coroutine.
     """
     start = time()
+    startup_timeline = timeline.async_get_timeline(hass)
     core_config = config.get(core.DOMAIN, {})
 
     try:
-        yield from conf_util.async_process_ha_core_config(hass, core_config)
+        with startup_timeline.span(core.DOMAIN, timeline.PHASE_CONFIG):
+            yield from conf_util.async_process_ha_core_config(
+                hass, core_config)
     except vol.Invalid as ex:
         conf_util.async_log_exception(ex, 'homeassistant', core_config, hass)
         return None
@@ -116,7 +122,8 @@ def async_from_config_dict(config: Dict[str, Any],
 
     # setup components
     # pylint: disable=not-an-iterable
-    res = yield from core_components.async_setup(hass, config)
+    with startup_timeline.span(core.DOMAIN, timeline.PHASE_SETUP):
+        res = yield from core_components.async_setup(hass, config)
     if not res:
         _LOGGER.error('Home Assistant core failed to initialize. '
                       'Further initialization aborted.')
@@ -126,25 +133,28 @@ def async_from_config_dict(config: Dict[str, Any],
 
     _LOGGER.info('Home Assistant core initialized')
 
-    # stage 1
-    for component in components:
-        if component not in FIRST_INIT_COMPONENT:
-            continue
-        hass.async_add_job(async_setup_component(hass, component, config))
+    yield from async_setup_components(
+        hass, sorted(components), config, first=FIRST_INIT_COMPONENT)
 
-    yield from hass.async_block_till_done()
-
-    # stage 2
-    for component in components:
-        if component in FIRST_INIT_COMPONENT:
-            continue
-        hass.async_add_job(async_setup_component(hass, component, config))
-
-    yield from hass.async_block_till_done()
+    # Jobs that components started during their setup are waited for at
+    # most COMPONENT_SETUP_TIMEOUT, so they do not hold back startup.
+    finished = yield from hass.async_block_till_done(COMPONENT_SETUP_TIMEOUT)
+    if not finished:
+        _LOGGER.warning(
+            "Jobs started during setup are taking longer than %s seconds. "
+            "Startup will proceed without waiting for them.",
+            COMPONENT_SETUP_TIMEOUT)
 
     stop = time()
     _LOGGER.info('Home Assistant initialized in %.2fs', stop-start)
 
+    startup_timeline.finish()
+    if enable_log:
+        hass.async_add_job(
+            timeline.save_timeline,
+            hass.config.path(timeline.TIMELINE_FILENAME),
+            startup_timeline.as_dict())
+
     async_register_signal_handling(hass)
     return hass
 
@@ -189,9 +199,16 @@ def async_from_config_file(config_path: str,
 
     async_enable_logging(hass, verbose, log_rotate_days)
 
+    def _load_hass_yaml_config():
+        """Load the configuration, parsed files are cached in config dir."""
+        cache_path = hass.config.path(conf_util.YAML_CACHE_FILE)
+        load_cache(cache_path)
+        conf = conf_util.load_yaml_config_file(config_path)
+        save_cache(cache_path)
+        return conf
+
     try:
-        config_dict = yield from hass.async_add_job(
-            conf_util.load_yaml_config_file, config_path)
+        config_dict = yield from hass.async_add_job(_load_hass_yaml_config)
     except HomeAssistantError as err:
         _LOGGER.error('Error loading %s: %s', config_path, err)
         return None
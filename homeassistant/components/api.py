@@ -5,6 +5,7 @@ For more details about the RESTful API, please refer to the documentation at
 https://home-assistant.io/developers/api/
 """
 import asyncio
+from collections import OrderedDict
 import json
 import logging
 
@@ -15,16 +16,17 @@ import homeassistant.core as ha
 import homeassistant.remote as rem
 from homeassistant.bootstrap import ERROR_LOG_FILENAME
 from homeassistant.const import (
+    ATTR_ENTITY_ID, ATTR_SERVICE_DATA, EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_STOP, EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST, HTTP_CREATED, HTTP_NOT_FOUND,
     MATCH_ALL, URL_API, URL_API_COMPONENTS,
     URL_API_CONFIG, URL_API_DISCOVERY_INFO, URL_API_ERROR_LOG,
-    URL_API_EVENTS, URL_API_SERVICES,
-    URL_API_STATES, URL_API_STATES_ENTITY, URL_API_STREAM, URL_API_TEMPLATE,
-    __version__)
+    URL_API_EVENTS, URL_API_SERVICES, URL_API_SERVICES_BATCH,
+    URL_API_STARTUP_TIMELINE, URL_API_STATES, URL_API_STATES_ENTITY,
+    URL_API_STREAM, URL_API_TEMPLATE, __version__)
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.state import AsyncTrackStates
-from homeassistant.helpers import template
+from homeassistant.helpers import template, timeline
 from homeassistant.components.http import HomeAssistantView
 
 DOMAIN = 'api'
@@ -32,6 +34,9 @@ DEPENDENCIES = ['http']
 
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_ENCODE_CACHE_SIZE = 64
+
+DATA_STREAM_ENCODER = 'api_stream_encoder'
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +53,9 @@ def setup(hass, config):
     hass.http.register_view(APIEventView)
     hass.http.register_view(APIServicesView)
     hass.http.register_view(APIDomainServicesView)
+    hass.http.register_view(APIServicesBatchView)
     hass.http.register_view(APIComponentsView)
+    hass.http.register_view(APIStartupTimelineView)
     hass.http.register_view(APITemplateView)
 
     hass.http.register_static_path(
@@ -82,34 +89,46 @@ class APIEventStream(HomeAssistantView):
         hass = request.app['hass']
         stop_obj = object()
         to_write = asyncio.Queue(loop=hass.loop)
+        encoder = hass.data.get(DATA_STREAM_ENCODER)
+
+        if encoder is None:
+            encoder = hass.data[DATA_STREAM_ENCODER] = StreamEventEncoder()
 
         restrict = request.query.get('restrict')
         if restrict:
-            restrict = restrict.split(',') + [EVENT_HOMEASSISTANT_STOP]
+            restrict = set(restrict.split(','))
+            restrict.add(EVENT_HOMEASSISTANT_STOP)
+
+        entity_ids = request.query.get('entity_id')
+        if entity_ids:
+            entity_ids = set(entity_ids.lower().split(','))
 
-        @asyncio.coroutine
+        @ha.callback
         def forward_events(event):
             """Forward events to the open request."""
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            if restrict and event.event_type not in restrict:
-                return
-
-            _LOGGER.debug('STREAM %s FORWARDING %s', id(stop_obj), event)
-
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
+            elif entity_ids and not _event_concerns(event, entity_ids):
+                return
             else:
-                data = json.dumps(event, cls=rem.JSONEncoder)
+                data = encoder.encode(event)
 
-            yield from to_write.put(data)
+            _LOGGER.debug('STREAM %s FORWARDING %s', id(stop_obj), event)
+
+            to_write.put_nowait(data)
 
         response = web.StreamResponse()
         response.content_type = 'text/event-stream'
         yield from response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        if restrict:
+            unsubs = [hass.bus.async_listen(event_type, forward_events)
+                      for event_type in restrict]
+        else:
+            unsubs = [hass.bus.async_listen(MATCH_ALL, forward_events)]
 
         try:
             _LOGGER.debug('STREAM %s ATTACHED', id(stop_obj))
@@ -139,7 +158,63 @@ class APIEventStream(HomeAssistantView):
 
         finally:
             _LOGGER.debug('STREAM %s RESPONSE CLOSED', id(stop_obj))
-            unsub_stream()
+            for unsub in unsubs:
+                unsub()
+
+
+def _event_concerns(event, entity_ids):
+    """Test if an event is about one of the entity ids.
+
+    The entity id can be a string or a list of strings. Service calls carry
+    it in their service data.
+    """
+    data = event.data
+    if event.event_type == EVENT_CALL_SERVICE:
+        data = data.get(ATTR_SERVICE_DATA)
+        if not isinstance(data, dict):
+            return False
+
+    event_entity_ids = data.get(ATTR_ENTITY_ID)
+
+    if isinstance(event_entity_ids, str):
+        return event_entity_ids in entity_ids
+
+    if isinstance(event_entity_ids, (list, tuple)):
+        return any(isinstance(entity_id, str) and entity_id in entity_ids
+                   for entity_id in event_entity_ids)
+
+    return False
+
+
+class StreamEventEncoder(object):
+    """Encode events for the event streams.
+
+    All open streams receive the same event instances, the JSON encoding of
+    the most recent events is therefore shared between them.
+    """
+
+    def __init__(self, size=STREAM_ENCODE_CACHE_SIZE):
+        """Initialize the encoder."""
+        self._size = size
+        self._cache = OrderedDict()
+
+    @ha.callback
+    def encode(self, event):
+        """Return the JSON encoding of an event."""
+        key = id(event)
+        cached = self._cache.get(key)
+
+        # Keeping a reference to the event guards against id reuse
+        if cached is not None and cached[0] is event:
+            return cached[1]
+
+        payload = json.dumps(event, cls=rem.JSONEncoder)
+        self._cache[key] = (event, payload)
+
+        if len(self._cache) > self._size:
+            self._cache.popitem(last=False)
+
+        return payload
 
 
 class APIConfigView(HomeAssistantView):
@@ -185,6 +260,67 @@ class APIStatesView(HomeAssistantView):
         """Get current states."""
         return self.json(request.app['hass'].states.async_all())
 
+    @asyncio.coroutine
+    def post(self, request):
+        """Update the state of multiple entities.
+
+        Returns a result for each item in the request.
+        """
+        hass = request.app['hass']
+        try:
+            data = yield from request.json()
+        except ValueError:
+            return self.json_message('Invalid JSON specified',
+                                     HTTP_BAD_REQUEST)
+
+        if not isinstance(data, list):
+            return self.json_message('Expected a list of states',
+                                     HTTP_BAD_REQUEST)
+
+        results = []
+
+        for item in data:
+            if not isinstance(item, dict):
+                results.append({'status': HTTP_BAD_REQUEST,
+                                'message': 'Invalid item specified'})
+                continue
+
+            entity_id = item.get('entity_id')
+            new_state = item.get('state')
+            attributes = item.get('attributes')
+
+            if not isinstance(entity_id, str) or \
+                    not ha.valid_entity_id(entity_id):
+                results.append({'entity_id': entity_id,
+                                'status': HTTP_BAD_REQUEST,
+                                'message': 'Invalid entity id specified'})
+                continue
+
+            if new_state is None:
+                results.append({'entity_id': entity_id,
+                                'status': HTTP_BAD_REQUEST,
+                                'message': 'No state specified'})
+                continue
+
+            if attributes is not None and not isinstance(attributes, dict):
+                results.append({'entity_id': entity_id,
+                                'status': HTTP_BAD_REQUEST,
+                                'message': 'Invalid attributes specified'})
+                continue
+
+            is_new_state = hass.states.get(entity_id) is None
+
+            hass.states.async_set(entity_id, new_state, attributes,
+                                  item.get('force_update', False))
+
+            results.append({
+                'entity_id': entity_id,
+                'status': HTTP_CREATED if is_new_state else 200,
+                'state': hass.states.get(entity_id),
+            })
+
+        return self.json(results)
+
 
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
@@ -316,6 +452,74 @@ class APIDomainServicesView(HomeAssistantView):
         return self.json(changed_states)
 
 
+class APIServicesBatchView(HomeAssistantView):
+    """View to handle multiple service calls in one request."""
+
+    url = URL_API_SERVICES_BATCH
+    name = "api:services-batch"
+
+    @asyncio.coroutine
+    def post(self, request):
+        """Call multiple services.
+
+        The calls are executed concurrently. Returns a result for each call
+        and a list of changed states.
+        """
+        hass = request.app['hass']
+        try:
+            data = yield from request.json()
+        except ValueError:
+            return self.json_message('Invalid JSON specified',
+                                     HTTP_BAD_REQUEST)
+
+        if not isinstance(data, list):
+            return self.json_message('Expected a list of service calls',
+                                     HTTP_BAD_REQUEST)
+
+        results = []
+        calls = []
+
+        for item in data:
+            result = {'success': False}
+            results.append(result)
+
+            if not isinstance(item, dict):
+                result['message'] = 'Invalid item specified'
+                continue
+
+            domain = item.get('domain')
+            service = item.get('service')
+            service_data = item.get('service_data')
+            result['domain'] = domain
+            result['service'] = service
+
+            if not isinstance(domain, str) or not isinstance(service, str):
+                result['message'] = 'No domain or service specified'
+            elif service_data is not None and \
+                    not isinstance(service_data, dict):
+                result['message'] = 'Service data should be a JSON object'
+            elif not hass.services.has_service(domain, service):
+                result['message'] = 'Service not found'
+            else:
+                calls.append((result, hass.services.async_call(
+                    domain, service, service_data, True)))
+
+        with AsyncTrackStates(hass) as changed_states:
+            if calls:
+                executed = yield from asyncio.gather(
+                    *(call for _, call in calls), loop=hass.loop)
+
+                for (result, _), success in zip(calls, executed):
+                    result['success'] = success
+                    if not success:
+                        result['message'] = 'Service call timed out'
+
+        return self.json({
+            'results': results,
+            'changed_states': changed_states,
+        })
+
+
 class APIComponentsView(HomeAssistantView):
     """View to handle Components requests."""
 
@@ -328,6 +532,19 @@ class APIComponentsView(HomeAssistantView):
         return self.json(request.app['hass'].config.components)
 
 
+class APIStartupTimelineView(HomeAssistantView):
+    """View to handle startup timeline requests."""
+
+    url = URL_API_STARTUP_TIMELINE
+    name = "api:startup-timeline"
+
+    @ha.callback
+    def get(self, request):
+        """Get the timeline of setting up components and platforms."""
+        return self.json(timeline.async_get_timeline(
+            request.app['hass']).as_dict())
+
+
 class APITemplateView(HomeAssistantView):
     """View to handle requests."""
 
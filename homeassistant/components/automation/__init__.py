@@ -8,21 +8,25 @@ import asyncio
 from functools import partial
 import logging
 import os
+import time
 
 import voluptuous as vol
 
 from homeassistant.setup import async_prepare_setup_platform
-from homeassistant.core import CoreState
+from homeassistant.core import CoreState, callback
 from homeassistant.loader import bind_hass
 from homeassistant import config as conf_util
 from homeassistant.const import (
     ATTR_ENTITY_ID, CONF_PLATFORM, STATE_ON, SERVICE_TURN_ON, SERVICE_TURN_OFF,
-    SERVICE_TOGGLE, SERVICE_RELOAD, EVENT_HOMEASSISTANT_START, CONF_ID)
+    SERVICE_TOGGLE, SERVICE_RELOAD, EVENT_HOMEASSISTANT_START, CONF_ID,
+    EVENT_STATE_CHANGED)
 from homeassistant.components import logbook
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import extract_domain_configs, script, condition
+from homeassistant.helpers import (
+    config_hash, extract_domain_configs, script, condition)
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.event import state_change_matcher
 from homeassistant.helpers.restore_state import async_get_last_state
 from homeassistant.loader import get_platform
 from homeassistant.util.dt import utcnow
@@ -52,7 +56,11 @@ DEFAULT_CONDITION_TYPE = CONDITION_TYPE_AND
 DEFAULT_HIDE_ENTITY = False
 DEFAULT_INITIAL_STATE = True
 
+DATA_TRIGGER_REGISTRY = 'automation_trigger_registry'
+
 ATTR_LAST_TRIGGERED = 'last_triggered'
+ATTR_LAST_RUN_DURATION = 'last_run_duration'
+ATTR_RUN_COUNT = 'run_count'
 ATTR_VARIABLES = 'variables'
 SERVICE_TRIGGER = 'trigger'
 
@@ -159,6 +167,249 @@ def async_reload(hass):
     return hass.services.async_call(DOMAIN, SERVICE_RELOAD)
 
 
+@callback
+def async_get_trigger_registry(hass):
+    """Return the trigger registry of a hass instance.
+
+    This method must be run in the event loop.
+    """
+    registry = hass.data.get(DATA_TRIGGER_REGISTRY)
+
+    if registry is None:
+        registry = hass.data[DATA_TRIGGER_REGISTRY] = TriggerRegistry(hass)
+
+    return registry
+
+
+class RegisteredTrigger(object):
+    """Representation of a trigger in the trigger registry."""
+
+    __slots__ = ['platform', 'key', 'action', 'state_matches',
+                 'evaluations', 'matches']
+
+    def __init__(self, platform, key, action, state_matches=None):
+        """Initialize a registered trigger."""
+        self.platform = platform
+        self.key = key
+        self.action = action
+        self.state_matches = state_matches
+        self.evaluations = 0
+        self.matches = 0
+
+    @callback
+    def async_evaluate(self, *args):
+        """Call the action of the trigger and count if it fired.
+
+        Errors are logged, so they do not stop the other triggers that share
+        the listener.
+        """
+        self.evaluations += 1
+
+        try:
+            fired = self.action(*args)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error evaluating %s trigger for %s",
+                              self.platform, self.key)
+            return
+
+        if fired:
+            self.matches += 1
+
+    def as_dict(self):
+        """Return a dictionary with the statistics of the trigger."""
+        return {
+            'platform': self.platform,
+            'key': self.key,
+            'evaluations': self.evaluations,
+            'matches': self.matches,
+        }
+
+
+class TriggerRegistry(object):
+    """Index automation triggers by entity id, event type and MQTT topic.
+
+    A single listener is shared by all triggers with the same key so that a
+    state change, event or MQTT message only evaluates the triggers that can
+    match it.
+
+    Actions are callbacks that return True when the trigger fired, which is
+    counted as a match.
+    """
+
+    def __init__(self, hass):
+        """Initialize the trigger registry."""
+        self.hass = hass
+        self._state_triggers = {}
+        self._state_unsub = None
+        self._event_triggers = {}
+        self._event_unsubs = {}
+        self._mqtt_triggers = {}
+        self._mqtt_unsubs = {}
+
+    @callback
+    def async_track_state_change(self, platform, entity_ids, action,
+                                 from_state=None, to_state=None):
+        """Register a trigger for state changes of entity_ids.
+
+        The action is called with entity_id, old_state and new_state when
+        the state matches from_state and to_state. Returns a function to
+        remove the trigger.
+        """
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+
+        entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
+        trigger = RegisteredTrigger(
+            platform, ', '.join(entity_ids), action,
+            state_change_matcher(from_state, to_state))
+
+        for entity_id in entity_ids:
+            self._state_triggers.setdefault(entity_id, []).append(trigger)
+
+        if self._state_unsub is None:
+            self._state_unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed)
+
+        @callback
+        def async_remove():
+            """Remove the trigger."""
+            for entity_id in entity_ids:
+                self._async_remove(self._state_triggers, entity_id, trigger)
+
+            if not self._state_triggers and self._state_unsub is not None:
+                self._state_unsub()
+                self._state_unsub = None
+
+        return async_remove
+
+    @callback
+    def async_track_event(self, platform, event_type, action):
+        """Register a trigger for events of event_type.
+
+        The action is called with the event. Returns a function to remove the
+        trigger.
+        """
+        trigger = RegisteredTrigger(platform, event_type, action)
+        triggers = self._event_triggers.get(event_type)
+
+        if triggers is None:
+            triggers = self._event_triggers[event_type] = []
+
+            @callback
+            def async_event_listener(event):
+                """Dispatch the event to the triggers."""
+                for registered in list(triggers):
+                    registered.async_evaluate(event)
+
+            self._event_unsubs[event_type] = self.hass.bus.async_listen(
+                event_type, async_event_listener)
+
+        triggers.append(trigger)
+
+        @callback
+        def async_remove():
+            """Remove the trigger."""
+            if self._async_remove(self._event_triggers, event_type, trigger):
+                self._event_unsubs.pop(event_type)()
+
+        return async_remove
+
+    @asyncio.coroutine
+    def async_track_mqtt(self, platform, topic, action):
+        """Register a trigger for MQTT messages on topic.
+
+        The action is called with topic, payload and qos. Returns a function
+        to remove the trigger.
+
+        This method is a coroutine.
+        """
+        import homeassistant.components.mqtt as mqtt
+
+        trigger = RegisteredTrigger(platform, topic, action)
+        triggers = self._mqtt_triggers.get(topic)
+        subscribe = triggers is None
+
+        if subscribe:
+            triggers = self._mqtt_triggers[topic] = []
+
+        triggers.append(trigger)
+
+        @callback
+        def async_remove():
+            """Remove the trigger."""
+            if self._async_remove(self._mqtt_triggers, topic, trigger):
+                unsub = self._mqtt_unsubs.pop(topic, None)
+                if unsub is not None:
+                    unsub()
+
+        if subscribe:
+            @callback
+            def async_mqtt_listener(msg_topic, payload, qos):
+                """Dispatch the message to the triggers."""
+                for registered in list(triggers):
+                    registered.async_evaluate(msg_topic, payload, qos)
+
+            unsub = yield from mqtt.async_subscribe(
+                self.hass, topic, async_mqtt_listener)
+
+            if self._mqtt_triggers.get(topic) is triggers:
+                self._mqtt_unsubs[topic] = unsub
+            else:
+                # All triggers were removed while subscribing
+                unsub()
+
+        return async_remove
+
+    @callback
+    def async_stats(self):
+        """Return the evaluation statistics of all registered triggers."""
+        triggers = set()
+
+        for index in (self._state_triggers, self._event_triggers,
+                      self._mqtt_triggers):
+            for registered in index.values():
+                triggers.update(registered)
+
+        return sorted((trigger.as_dict() for trigger in triggers),
+                      key=lambda stats: (stats['platform'], stats['key']))
+
+    @callback
+    def _async_state_changed(self, event):
+        """Dispatch a state change to the triggers of the entity."""
+        entity_id = event.data.get('entity_id')
+        triggers = self._state_triggers.get(entity_id)
+
+        if not triggers:
+            return
+
+        old_state = event.data.get('old_state')
+        new_state = event.data.get('new_state')
+        old_value = None if old_state is None else old_state.state
+        new_value = None if new_state is None else new_state.state
+
+        for trigger in list(triggers):
+            if trigger.state_matches(old_value, new_value):
+                trigger.async_evaluate(entity_id, old_state, new_state)
+            else:
+                trigger.evaluations += 1
+
+    @staticmethod
+    def _async_remove(index, key, trigger):
+        """Remove trigger from index, return True if key has no triggers."""
+        triggers = index.get(key)
+
+        if triggers is None or trigger not in triggers:
+            return False
+
+        triggers.remove(trigger)
+
+        if triggers:
+            return False
+
+        del index[key]
+        return True
+
+
 @asyncio.coroutine
 def async_setup(hass, config):
     """Set up the automation."""
@@ -209,11 +460,11 @@ def async_setup(hass, config):
 
     @asyncio.coroutine
     def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = yield from component.async_prepare_reload()
+        """Reload the automations that changed in the config."""
+        conf = yield from component.async_prepare_reload(reset=False)
         if conf is None:
             return
-        yield from _async_process_config(hass, conf, component)
+        yield from _async_reload_config(hass, conf, component)
 
     hass.services.async_register(
         DOMAIN, SERVICE_TRIGGER, trigger_service_handler,
@@ -242,6 +493,8 @@ def async_setup(hass, config):
 class AutomationEntity(ToggleEntity):
     """Entity to show status of entity."""
 
+    cache_static_attributes = True
+
     def __init__(self, automation_id, name, async_attach_triggers, cond_func,
                  async_action, hidden, initial_state):
         """Initialize an automation entity."""
@@ -254,6 +507,9 @@ class AutomationEntity(ToggleEntity):
         self._last_triggered = None
         self._hidden = hidden
         self._initial_state = initial_state
+        self._traces = script.TraceBuffer()
+        self.config_key = None
+        self.config_hash = None
 
     @property
     def name(self):
@@ -269,7 +525,9 @@ class AutomationEntity(ToggleEntity):
     def state_attributes(self):
         """Return the entity state attributes."""
         return {
-            ATTR_LAST_TRIGGERED: self._last_triggered
+            ATTR_LAST_TRIGGERED: self._last_triggered,
+            ATTR_RUN_COUNT: self._traces.run_count,
+            ATTR_LAST_RUN_DURATION: self._traces.last_duration,
         }
 
     @property
@@ -285,6 +543,8 @@ class AutomationEntity(ToggleEntity):
     @asyncio.coroutine
     def async_added_to_hass(self) -> None:
         """Startup with initial state or previous state."""
+        script.async_get_traces(self.hass)[self.entity_id] = self._traces
+
         if self._initial_state is not None:
             enable_automation = self._initial_state
             _LOGGER.debug("Automation %s initial state %s from config "
@@ -344,15 +604,26 @@ class AutomationEntity(ToggleEntity):
 
         This method is a coroutine.
         """
-        if skip_condition or self._cond_func(variables):
-            yield from self._async_action(self.entity_id, variables)
-            self._last_triggered = utcnow()
-            yield from self.async_update_ha_state()
+        trace = self._traces.async_start()
+
+        if not skip_condition:
+            start = time.monotonic()
+            check = self._cond_func(variables)
+            trace.async_set_condition_time(start)
+
+            if not check:
+                trace.async_finish(script.RESULT_CONDITION_FAILED)
+                return
+
+        yield from self._async_action(self.entity_id, variables, trace)
+        self._last_triggered = utcnow()
+        yield from self.async_update_ha_state()
 
     @asyncio.coroutine
     def async_remove(self):
         """Remove automation from HASS."""
         yield from self.async_turn_off()
+        script.async_get_traces(self.hass).pop(self.entity_id, None)
         yield from super().async_remove()
 
     @asyncio.coroutine
@@ -387,42 +658,102 @@ def _async_process_config(hass, config, component):
     """
     entities = []
 
+    for key, block_hash, name, config_block in _async_config_blocks(config):
+        entity = _async_create_entity(
+            hass, config, key, block_hash, name, config_block)
+
+        if entity is not None:
+            entities.append(entity)
+
+    if entities:
+        yield from component.async_add_entities(entities)
+
+
+@asyncio.coroutine
+def _async_reload_config(hass, config, component):
+    """Rebuild the automations that were added, changed or removed.
+
+    Automations are matched by their id, or their name if they have none,
+    and the hash of their config.
+
+    This method is a coroutine.
+    """
+    current = {entity.config_key: entity
+               for entity in component.entities.values()}
+    entities = []
+
+    for key, block_hash, name, config_block in _async_config_blocks(config):
+        entity = current.get(key)
+
+        if entity is not None and entity.config_hash == block_hash:
+            current.pop(key)
+            continue
+
+        entity = _async_create_entity(
+            hass, config, key, block_hash, name, config_block)
+
+        if entity is not None:
+            entities.append(entity)
+
+    if current:
+        yield from asyncio.wait([
+            component.async_remove_entity(entity.entity_id)
+            for entity in current.values()], loop=hass.loop)
+
+    if entities:
+        yield from component.async_add_entities(entities)
+
+    _LOGGER.info("Reloaded automations: %d removed or changed, %d added",
+                 len(current), len(entities))
+
+
+def _async_config_blocks(config):
+    """Return key, hash, name and config of each automation in config."""
+    keys = set()
+
     for config_key in extract_domain_configs(config, DOMAIN):
         conf = config[config_key]
 
         for list_no, config_block in enumerate(conf):
-            automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or "{} {}".format(config_key,
                                                                   list_no)
+            key = config_block.get(CONF_ID) or name
 
-            hidden = config_block[CONF_HIDE_ENTITY]
-            initial_state = config_block.get(CONF_INITIAL_STATE)
+            if key in keys:
+                key = "{} {}".format(key, list_no)
+            keys.add(key)
 
-            action = _async_get_action(hass, config_block.get(CONF_ACTION, {}),
-                                       name)
+            yield key, config_hash(config_block), name, config_block
 
-            if CONF_CONDITION in config_block:
-                cond_func = _async_process_if(hass, config, config_block)
 
-                if cond_func is None:
-                    continue
-            else:
-                def cond_func(variables):
-                    """Condition will always pass."""
-                    return True
-
-            async_attach_triggers = partial(
-                _async_process_trigger, hass, config,
-                config_block.get(CONF_TRIGGER, []), name
-            )
-            entity = AutomationEntity(
-                automation_id, name, async_attach_triggers, cond_func, action,
-                hidden, initial_state)
+def _async_create_entity(hass, config, key, block_hash, name, config_block):
+    """Create an automation entity, return None if config is invalid."""
+    automation_id = config_block.get(CONF_ID)
+    hidden = config_block[CONF_HIDE_ENTITY]
+    initial_state = config_block.get(CONF_INITIAL_STATE)
 
-            entities.append(entity)
+    action = _async_get_action(hass, config_block.get(CONF_ACTION, {}), name)
 
-    if entities:
-        yield from component.async_add_entities(entities)
+    if CONF_CONDITION in config_block:
+        cond_func = _async_process_if(hass, config, config_block)
+
+        if cond_func is None:
+            return None
+    else:
+        def cond_func(variables):
+            """Condition will always pass."""
+            return True
+
+    async_attach_triggers = partial(
+        _async_process_trigger, hass, config,
+        config_block.get(CONF_TRIGGER, []), name
+    )
+    entity = AutomationEntity(
+        automation_id, name, async_attach_triggers, cond_func, action,
+        hidden, initial_state)
+    entity.config_key = key
+    entity.config_hash = block_hash
+    return entity
 
 
 def _async_get_action(hass, config, name):
@@ -430,12 +761,12 @@ def _async_get_action(hass, config, name):
     script_obj = script.Script(hass, config, name)
 
     @asyncio.coroutine
-    def action(entity_id, variables):
+    def action(entity_id, variables, trace=None):
         """Execute an action."""
         _LOGGER.info('Executing %s', name)
         logbook.async_log_entry(
             hass, name, 'has been triggered', DOMAIN, entity_id)
-        yield from script_obj.async_run(variables)
+        yield from script_obj.async_run(variables, trace)
 
     return action
 
@@ -444,13 +775,11 @@ def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config.get(CONF_CONDITION)
 
-    checks = []
-    for if_config in if_configs:
-        try:
-            checks.append(condition.async_from_config(if_config, False))
-        except HomeAssistantError as ex:
-            _LOGGER.warning('Invalid condition: %s', ex)
-            return None
+    try:
+        checks = condition.async_from_config_sorted(if_configs, False)
+    except HomeAssistantError as ex:
+        _LOGGER.warning('Invalid condition: %s', ex)
+        return None
 
     def if_action(variables=None):
         """AND all conditions."""
@@ -9,6 +9,7 @@ import logging
 
 import voluptuous as vol
 
+from homeassistant.components import automation
 from homeassistant.core import callback
 from homeassistant.const import CONF_PLATFORM
 from homeassistant.helpers import config_validation as cv
@@ -42,5 +43,7 @@ def async_trigger(hass, config, action):
                     'event': event,
                 },
             })
+            return True
 
-    return hass.bus.async_listen(event_type, handle_event)
+    return automation.async_get_trigger_registry(hass).async_track_event(
+        'event', event_type, handle_event)
@@ -9,6 +9,7 @@ import json
 
 import voluptuous as vol
 
+from homeassistant.components import automation
 from homeassistant.core import callback
 import homeassistant.components.mqtt as mqtt
 from homeassistant.const import (CONF_PLATFORM, CONF_PAYLOAD)
@@ -50,7 +51,8 @@ def async_trigger(hass, config, action):
             hass.async_run_job(action, {
                 'trigger': data
             })
+            return True
 
-    remove = yield from mqtt.async_subscribe(
-        hass, topic, mqtt_automation_listener)
+    remove = yield from automation.async_get_trigger_registry(
+        hass).async_track_mqtt('mqtt', topic, mqtt_automation_listener)
     return remove
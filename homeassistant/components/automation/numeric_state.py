@@ -9,11 +9,11 @@ import logging
 
 import voluptuous as vol
 
+from homeassistant.components import automation
 from homeassistant.core import callback
 from homeassistant.const import (
     CONF_VALUE_TEMPLATE, CONF_PLATFORM, CONF_ENTITY_ID,
     CONF_BELOW, CONF_ABOVE)
-from homeassistant.helpers.event import async_track_state_change
 from homeassistant.helpers import condition, config_validation as cv
 
 TRIGGER_SCHEMA = vol.All(vol.Schema({
@@ -67,5 +67,8 @@ def async_trigger(hass, config, action):
         variables['trigger']['to_state'] = to_s
 
         hass.async_run_job(action, variables)
+        return True
 
-    return async_track_state_change(hass, entity_id, state_automation_listener)
+    registry = automation.async_get_trigger_registry(hass)
+    return registry.async_track_state_change(
+        'numeric_state', entity_id, state_automation_listener)
@@ -7,11 +7,11 @@ at https://home-assistant.io/docs/automation/trigger/#state-trigger
 import asyncio
 import voluptuous as vol
 
+from homeassistant.components import automation
 from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
 from homeassistant.const import MATCH_ALL, CONF_PLATFORM
-from homeassistant.helpers.event import (
-    async_track_state_change, async_track_point_in_utc_time)
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.deprecation import get_deprecated
 import homeassistant.helpers.config_validation as cv
 
@@ -46,6 +46,7 @@ def async_trigger(hass, config, action):
     async_remove_state_for_cancel = None
     async_remove_state_for_listener = None
     match_all = (from_state == MATCH_ALL and to_state == MATCH_ALL)
+    registry = automation.async_get_trigger_registry(hass)
 
     @callback
     def clear_listener():
@@ -84,7 +85,7 @@ def async_trigger(hass, config, action):
 
         if time_delta is None:
             call_action()
-            return
+            return True
 
         @callback
         def state_for_listener(now):
@@ -107,11 +108,13 @@ def async_trigger(hass, config, action):
         async_remove_state_for_listener = async_track_point_in_utc_time(
             hass, state_for_listener, dt_util.utcnow() + time_delta)
 
-        async_remove_state_for_cancel = async_track_state_change(
-            hass, entity, state_for_cancel_listener)
+        async_remove_state_for_cancel = registry.async_track_state_change(
+            'state', entity, state_for_cancel_listener)
+
+        return True
 
-    unsub = async_track_state_change(
-        hass, entity_id, state_automation_listener, from_state, to_state)
+    unsub = registry.async_track_state_change(
+        'state', entity_id, state_automation_listener, from_state, to_state)
 
     @callback
     def async_remove():
@@ -7,10 +7,10 @@ at https://home-assistant.io/docs/automation/trigger/#zone-trigger
 import asyncio
 import voluptuous as vol
 
+from homeassistant.components import automation
 from homeassistant.core import callback
 from homeassistant.const import (
     CONF_EVENT, CONF_ENTITY_ID, CONF_ZONE, MATCH_ALL, CONF_PLATFORM)
-from homeassistant.helpers.event import async_track_state_change
 from homeassistant.helpers import (
     condition, config_validation as cv, location)
 
@@ -61,6 +61,8 @@ def async_trigger(hass, config, action):
                     'event': event,
                 },
             })
+            return True
 
-    return async_track_state_change(hass, entity_id, zone_automation_listener,
-                                    MATCH_ALL, MATCH_ALL)
+    registry = automation.async_get_trigger_registry(hass)
+    return registry.async_track_state_change(
+        'zone', entity_id, zone_automation_listener, MATCH_ALL, MATCH_ALL)
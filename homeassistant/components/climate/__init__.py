@@ -226,24 +226,6 @@ def async_setup(hass, config):
         load_yaml_config_file,
         os.path.join(os.path.dirname(__file__), 'services.yaml'))
 
-    @asyncio.coroutine
-    def _async_update_climate(target_climate):
-        """Update climate entity after service stuff."""
-        update_tasks = []
-        for climate in target_climate:
-            if not climate.should_poll:
-                continue
-
-            update_coro = hass.async_add_job(
-                climate.async_update_ha_state(True))
-            if hasattr(climate, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
-
     @asyncio.coroutine
     def async_away_mode_set_service(service):
         """Set away mode on target climate devices."""
@@ -251,13 +233,13 @@ def async_setup(hass, config):
 
         away_mode = service.data.get(ATTR_AWAY_MODE)
 
-        for climate in target_climate:
-            if away_mode:
-                yield from climate.async_turn_away_mode_on()
-            else:
-                yield from climate.async_turn_away_mode_off()
+        if away_mode:
+            method = 'async_turn_away_mode_on'
+        else:
+            method = 'async_turn_away_mode_off'
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, method)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AWAY_MODE, async_away_mode_set_service,
@@ -271,10 +253,8 @@ def async_setup(hass, config):
 
         hold_mode = service.data.get(ATTR_HOLD_MODE)
 
-        for climate in target_climate:
-            yield from climate.async_set_hold_mode(hold_mode)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, 'async_set_hold_mode', hold_mode)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_HOLD_MODE, async_hold_mode_set_service,
@@ -288,13 +268,13 @@ def async_setup(hass, config):
 
         aux_heat = service.data.get(ATTR_AUX_HEAT)
 
-        for climate in target_climate:
-            if aux_heat:
-                yield from climate.async_turn_aux_heat_on()
-            else:
-                yield from climate.async_turn_aux_heat_off()
+        if aux_heat:
+            method = 'async_turn_aux_heat_on'
+        else:
+            method = 'async_turn_aux_heat_off'
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, method)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_AUX_HEAT, async_aux_heat_set_service,
@@ -306,7 +286,8 @@ def async_setup(hass, config):
         """Set temperature on the target climate devices."""
         target_climate = component.async_extract_from_service(service)
 
-        for climate in target_climate:
+        def async_set_temperature(climate):
+            """Set the temperature converted to the unit of climate."""
             kwargs = {}
             for value, temp in service.data.items():
                 if value in CONVERTIBLE_ATTRIBUTE:
@@ -318,9 +299,10 @@ def async_setup(hass, config):
                 else:
                     kwargs[value] = temp
 
-            yield from climate.async_set_temperature(**kwargs)
+            return climate.async_set_temperature(**kwargs)
 
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, async_set_temperature)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_TEMPERATURE, async_temperature_set_service,
@@ -334,10 +316,8 @@ def async_setup(hass, config):
 
         humidity = service.data.get(ATTR_HUMIDITY)
 
-        for climate in target_climate:
-            yield from climate.async_set_humidity(humidity)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, 'async_set_humidity', humidity)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_HUMIDITY, async_humidity_set_service,
@@ -351,10 +331,8 @@ def async_setup(hass, config):
 
         fan = service.data.get(ATTR_FAN_MODE)
 
-        for climate in target_climate:
-            yield from climate.async_set_fan_mode(fan)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, 'async_set_fan_mode', fan)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_FAN_MODE, async_fan_mode_set_service,
@@ -368,10 +346,8 @@ def async_setup(hass, config):
 
         operation_mode = service.data.get(ATTR_OPERATION_MODE)
 
-        for climate in target_climate:
-            yield from climate.async_set_operation_mode(operation_mode)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, 'async_set_operation_mode', operation_mode)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_OPERATION_MODE, async_operation_set_service,
@@ -385,10 +361,8 @@ def async_setup(hass, config):
 
         swing_mode = service.data.get(ATTR_SWING_MODE)
 
-        for climate in target_climate:
-            yield from climate.async_set_swing_mode(swing_mode)
-
-        yield from _async_update_climate(target_climate)
+        yield from component.async_call_entity_service(
+            target_climate, 'async_set_swing_mode', swing_mode)
 
     hass.services.async_register(
         DOMAIN, SERVICE_SET_SWING_MODE, async_swing_set_service,
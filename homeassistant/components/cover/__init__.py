@@ -168,25 +168,8 @@ def async_setup(hass, config):
         params = service.data.copy()
         params.pop(ATTR_ENTITY_ID, None)
 
-        # call method
-        for cover in covers:
-            yield from getattr(cover, method['method'])(**params)
-
-        update_tasks = []
-
-        for cover in covers:
-            if not cover.should_poll:
-                continue
-
-            update_coro = hass.async_add_job(
-                cover.async_update_ha_state(True))
-            if hasattr(cover, 'async_update'):
-                update_tasks.append(update_coro)
-            else:
-                yield from update_coro
-
-        if update_tasks:
-            yield from asyncio.wait(update_tasks, loop=hass.loop)
+        yield from component.async_call_entity_service(
+            covers, method['method'], **params)
 
     descriptions = yield from hass.async_add_job(
         load_yaml_config_file, os.path.join(
@@ -185,7 +185,7 @@ def setup(hass, config):
                                    os.path.join(STATIC_PATH, sw_path), False)
     hass.http.register_static_path("/robots.txt",
                                    os.path.join(STATIC_PATH, "robots.txt"))
-    hass.http.register_static_path("/static", STATIC_PATH)
+    hass.http.register_static_path("/static", STATIC_PATH, preload=True)
 
     local = hass.config.path('www')
     if os.path.isdir(local):
@@ -27,6 +27,9 @@ from homeassistant.util.async import run_coroutine_threadsafe
 DOMAIN = 'group'
 
 ENTITY_ID_FORMAT = DOMAIN + '.{}'
+ENTITY_ID_PREFIX = DOMAIN + '.'
+
+DATA_EXPAND_CACHE = 'group_expand_cache'
 
 CONF_ENTITIES = 'entities'
 CONF_VIEW = 'view'
@@ -194,6 +197,7 @@ def expand_entity_ids(hass, entity_ids):
     Async friendly.
     """
     found_ids = []
+    seen = set()
     for entity_id in entity_ids:
         if not isinstance(entity_id, str):
             continue
@@ -205,26 +209,95 @@ def expand_entity_ids(hass, entity_ids):
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id for ent_id
-                    in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids)
-
+                members = _expand_group(hass, entity_id)
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                members = (entity_id,)
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
-            pass
+            continue
+
+        for ent_id in members:
+            if ent_id not in seen:
+                seen.add(ent_id)
+                found_ids.append(ent_id)
 
     return found_ids
 
 
+def _expand_group(hass, entity_id):
+    """Return the flattened members of a group, memoized per group.
+
+    A cached expansion stays valid as long as the member lists of all the
+    groups it was built from are unchanged, so only the groups themselves
+    are looked up instead of walking and deduplicating every member.
+    """
+    cache = hass.data.get(DATA_EXPAND_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_EXPAND_CACHE] = {}
+
+    cached = cache.get(entity_id)
+    if cached is not None and _members_unchanged(hass, cached[0]):
+        return cached[1]
+
+    sources = []
+    found_ids = []
+    _collect_group_members(
+        hass, entity_id, sources, found_ids, set(), {entity_id})
+
+    expanded = tuple(found_ids)
+    cache[entity_id] = (tuple(sources), expanded)
+    return expanded
+
+
+def _collect_group_members(hass, entity_id, sources, found_ids, seen,
+                           groups):
+    """Add the members of a group and its nested groups to found_ids."""
+    members = get_entity_ids(hass, entity_id)
+    sources.append((entity_id, members))
+
+    for ent_id in members:
+        if not isinstance(ent_id, str):
+            continue
+
+        ent_id = ent_id.lower()
+
+        if ent_id.startswith(ENTITY_ID_PREFIX):
+            # Each group is expanded once, which also breaks cycles
+            if ent_id not in groups:
+                groups.add(ent_id)
+                _collect_group_members(
+                    hass, ent_id, sources, found_ids, seen, groups)
+
+        elif ent_id not in seen:
+            seen.add(ent_id)
+            found_ids.append(ent_id)
+
+
+@callback
+def _async_evict_expansions(hass, entity_id):
+    """Remove the cached expansions that were built from a group.
+
+    This method must be run in the event loop.
+    """
+    cache = hass.data.get(DATA_EXPAND_CACHE)
+    if not cache:
+        return
+
+    for cached_id, (sources, _) in list(cache.items()):
+        if any(source_id == entity_id for source_id, _ in sources):
+            cache.pop(cached_id, None)
+
+
+def _members_unchanged(hass, sources):
+    """Test if the member lists an expansion was built from are current."""
+    for entity_id, members in sources:
+        current = get_entity_ids(hass, entity_id)
+        if current is not members and current != members:
+            return False
+    return True
+
+
 @bind_hass
 def get_entity_ids(hass, entity_id, domain_filter=None):
     """Get members of this group.
@@ -265,6 +338,7 @@ def async_setup(hass, config):
         conf = yield from component.async_prepare_reload()
         if conf is None:
             return
+        hass.data.pop(DATA_EXPAND_CACHE, None)
         yield from _async_process_config(hass, conf, component)
 
     hass.services.async_register(
@@ -418,6 +492,8 @@ class Group(Entity):
         self._user_defined = user_defined
         self._order = order
         self._assumed_state = False
+        self._on_members = set()
+        self._assumed_members = set()
         self._async_unsub_state_changed = None
 
     @staticmethod
@@ -576,6 +652,8 @@ class Group(Entity):
             self._async_unsub_state_changed()
             self._async_unsub_state_changed = None
 
+        _async_evict_expansions(self.hass, self.entity_id)
+
         return super().async_remove()
 
     @asyncio.coroutine
@@ -588,7 +666,7 @@ class Group(Entity):
         if self._async_unsub_state_changed is None:
             return
 
-        self._async_update_group_state(new_state)
+        self._async_update_group_state(new_state, entity_id)
         yield from self.async_update_ha_state()
 
     @property
@@ -605,20 +683,25 @@ class Group(Entity):
         return states
 
     @callback
-    def _async_update_group_state(self, tr_state=None):
+    def _async_update_group_state(self, tr_state=None, tr_entity_id=None):
         """Update group state.
 
         Optionally you can provide the only state changed since last update
-        allowing this method to take shortcuts.
+        allowing this method to only update the members that are on or have
+        an assumed state instead of rescanning all of them. Pass just the
+        entity id if that member was removed.
 
         This method must be run in the event loop.
         """
         # To store current states of group entities. Might not be needed.
         states = None
-        gr_state = self._state
         gr_on = self.group_on
         gr_off = self.group_off
 
+        if tr_state is not None:
+            tr_entity_id = tr_state.entity_id
+        incremental = tr_entity_id is not None
+
         # We have not determined type of group yet
         if gr_on is None:
             if tr_state is None:
@@ -634,33 +717,39 @@ class Group(Entity):
 
             if gr_on is not None:
                 self.group_on, self.group_off = gr_on, gr_off
+                # Members have not been counted for this group type yet
+                incremental = False
 
         # We cannot determine state of the group
         if gr_on is None:
             return
 
-        if tr_state is None or ((gr_state == gr_on and
-                                 tr_state.state == gr_off) or
-                                tr_state.state not in (gr_on, gr_off)):
+        if incremental:
+            _update_member(
+                self._on_members, tr_entity_id,
+                tr_state is not None and tr_state.state == gr_on)
+            _update_member(
+                self._assumed_members, tr_entity_id,
+                tr_state is not None and
+                tr_state.attributes.get(ATTR_ASSUMED_STATE))
+
+        else:
             if states is None:
                 states = self._tracking_states
 
-            if any(state.state == gr_on for state in states):
-                self._state = gr_on
-            else:
-                self._state = gr_off
-
-        elif tr_state.state in (gr_on, gr_off):
-            self._state = tr_state.state
+            self._on_members = set(
+                state.entity_id for state in states if state.state == gr_on)
+            self._assumed_members = set(
+                state.entity_id for state in states
+                if state.attributes.get(ATTR_ASSUMED_STATE))
 
-        if tr_state is None or self._assumed_state and \
-           not tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            if states is None:
-                states = self._tracking_states
+        self._state = gr_on if self._on_members else gr_off
+        self._assumed_state = bool(self._assumed_members)
 
-            self._assumed_state = any(
-                state.attributes.get(ATTR_ASSUMED_STATE) for state
-                in states)
 
-        elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
-            self._assumed_state = True
+def _update_member(members, entity_id, include):
+    """Add or discard a member from a set of members."""
+    if include:
+        members.add(entity_id)
+    else:
+        members.discard(entity_id)
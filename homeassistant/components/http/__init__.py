@@ -31,7 +31,8 @@ from .const import (
     KEY_BANS_ENABLED, KEY_LOGIN_THRESHOLD,
     KEY_DEVELOPMENT, KEY_AUTHENTICATED)
 from .static import (
-    staticresource_middleware, CachingFileResponse, CachingStaticResource)
+    staticresource_middleware, CachingFileResponse, CachingStaticResource,
+    StaticAssetCache)
 from .util import get_real_ip
 
 REQUIREMENTS = ['aiohttp_cors==0.5.3']
@@ -255,15 +256,27 @@ class HomeAssistantWSGI(object):
 
         self.app.router.add_route('GET', url, redirect)
 
-    def register_static_path(self, url_path, path, cache_headers=True):
-        """Register a folder or file to serve as a static path."""
+    def register_static_path(self, url_path, path, cache_headers=True,
+                             preload=False):
+        """Register a folder or file to serve as a static path.
+
+        If preload is set, the files of a folder are loaded into memory
+        together with their gzip variant so that they can be served without
+        hitting the disk. This is skipped in development mode. Building the
+        cache does I/O so this method must then not be run in the event loop.
+        """
         if os.path.isdir(path):
-            if cache_headers:
-                resource = CachingStaticResource
+            if not cache_headers:
+                resource = web.StaticResource(url_path, path)
+            elif preload and not self.development:
+                asset_cache = StaticAssetCache(path)
+                asset_cache.build()
+                resource = CachingStaticResource(
+                    url_path, path, asset_cache=asset_cache)
             else:
-                resource = web.StaticResource
+                resource = CachingStaticResource(url_path, path)
 
-            self.app.router.register_resource(resource(url_path, path))
+            self.app.router.register_resource(resource)
             return
 
         if cache_headers:
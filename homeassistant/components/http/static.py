@@ -1,24 +1,220 @@
 """Static file handling for HTTP component."""
 import asyncio
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
 import re
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Response
 from aiohttp.web_exceptions import HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from yarl import unquote
 
 from .const import KEY_DEVELOPMENT
 
+_LOGGER = logging.getLogger(__name__)
+
 _FINGERPRINT = re.compile(r'^(.+)-[a-z0-9]{32}\.(\w+)$', re.IGNORECASE)
 
+CACHE_TIME = 31 * 86400  # = 1 month
+CACHE_HEADER = "public, max-age={}".format(CACHE_TIME)
+
+# Limits for the in-memory asset cache
+DEFAULT_CACHE_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_CACHE_MAX_FILE_SIZE = 4 * 1024 * 1024
+
+COMPRESSIBLE_EXTENSIONS = (
+    '.css', '.html', '.js', '.json', '.map', '.svg', '.txt')
+
+
+class CachedAsset(object):
+    """Representation of a static file held in memory."""
+
+    __slots__ = ['body', 'gzip_body', 'etag', 'content_type']
+
+    def __init__(self, body, gzip_body, etag, content_type):
+        """Initialize the cached asset."""
+        self.body = body
+        self.gzip_body = gzip_body
+        self.etag = etag
+        self.content_type = content_type
+
+
+class StaticAssetCache(object):
+    """Bounded in-memory cache of the files in a static directory.
+
+    The cache is built once at startup. Each asset is stored together with
+    a gzip compressed variant (if worth it) and a strong ETag so that
+    requests can be answered without touching the disk.
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_CACHE_MAX_SIZE,
+                 max_file_size=DEFAULT_CACHE_MAX_FILE_SIZE):
+        """Initialize the asset cache."""
+        self.directory = directory
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.size = 0
+        self._assets = {}
+
+    def __len__(self):
+        """Return the number of cached assets."""
+        return len(self._assets)
+
+    def get(self, filename):
+        """Return the cached asset for a relative filename or None."""
+        return self._assets.get(filename)
+
+    def build(self):
+        """Load all eligible files from the directory.
+
+        This method must not be run in the event loop.
+        """
+        for root, dirs, files in os.walk(self.directory):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith('.gz'):
+                    continue
+
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.directory).replace(
+                    os.sep, '/')
+
+                try:
+                    if os.path.getsize(path) > self.max_file_size:
+                        continue
+                    asset = self._load(path)
+                except OSError as err:
+                    _LOGGER.warning("Unable to cache %s: %s", path, err)
+                    continue
+
+                asset_size = len(asset.body) + len(asset.gzip_body or b'')
+
+                if self.size + asset_size > self.max_size:
+                    _LOGGER.debug("Static cache for %s full, serving %s "
+                                  "from disk", self.directory, filename)
+                    continue
+
+                self._assets[filename] = asset
+                self.size += asset_size
+
+        _LOGGER.debug("Cached %d static assets (%d bytes) from %s",
+                      len(self._assets), self.size, self.directory)
+
+    @staticmethod
+    def _load(path):
+        """Read a file and compute its variants."""
+        with open(path, 'rb') as fil:
+            body = fil.read()
+
+        gzip_body = None
+
+        if path.endswith(COMPRESSIBLE_EXTENSIONS):
+            gz_path = path + '.gz'
+
+            if os.path.isfile(gz_path) and \
+                    os.path.getmtime(gz_path) >= os.path.getmtime(path):
+                with open(gz_path, 'rb') as fil:
+                    gzip_body = fil.read()
+            else:
+                gzip_body = gzip.compress(body, 9)
+
+            if len(gzip_body) >= len(body):
+                gzip_body = None
+
+        content_type = mimetypes.guess_type(path)[0] or \
+            'application/octet-stream'
+        etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+
+        return CachedAsset(body, gzip_body, etag, content_type)
+
+
+def _etag_matches(request, etag):
+    """Return if the If-None-Match header of the request matches etag."""
+    header = request.headers.get(hdrs.IF_NONE_MATCH)
+
+    if header is None:
+        return False
+
+    for value in header.split(','):
+        value = value.strip()
+        if value == '*' or value == etag:
+            return True
+
+    return False
+
+
+def _accepts_gzip(request):
+    """Return if the Accept-Encoding header of the request allows gzip.
+
+    Codings with a quality value of 0 are not acceptable, a wildcard
+    applies to gzip if it is not listed itself.
+    """
+    qualities = {}
+
+    for coding in request.headers.get(hdrs.ACCEPT_ENCODING, '').split(','):
+        name, *params = coding.split(';')
+        quality = 1.0
+
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[name.strip().lower()] = quality
+
+    for name in ('gzip', 'x-gzip', '*'):
+        if name in qualities:
+            return qualities[name] > 0
+
+    return False
+
+
+def cached_asset_response(request, asset):
+    """Return a response for a cached asset."""
+    headers = {
+        hdrs.CACHE_CONTROL: CACHE_HEADER,
+        hdrs.ETAG: asset.etag,
+    }
+
+    if _etag_matches(request, asset.etag):
+        return Response(status=304, headers=headers)
+
+    body = asset.body
+
+    if asset.gzip_body is not None:
+        headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if _accepts_gzip(request):
+            headers[hdrs.CONTENT_ENCODING] = 'gzip'
+            body = asset.gzip_body
+
+    return Response(
+        body=body, content_type=asset.content_type, headers=headers)
+
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
+    def __init__(self, *args, asset_cache=None, **kwargs):
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        self._asset_cache = asset_cache
+
     @asyncio.coroutine
     def _handle(self, request):
         filename = unquote(request.match_info['filename'])
+
+        if self._asset_cache is not None:
+            asset = self._asset_cache.get(filename)
+            if asset is not None:
+                return cached_asset_response(request, asset)
+
         try:
             # PyLint is wrong about resolve not being a member.
             # pylint: disable=no-member
@@ -54,9 +250,7 @@ class CachingFileResponse(FileResponse):
         def sendfile(request, fobj, count):
             """Sendfile that includes a cache header."""
             if not request.app[KEY_DEVELOPMENT]:
-                cache_time = 31 * 86400  # = 1 month
-                self.headers[hdrs.CACHE_CONTROL] = "public, max-age={}".format(
-                    cache_time)
+                self.headers[hdrs.CACHE_CONTROL] = CACHE_HEADER
 
             yield from orig_sendfile(request, fobj, count)
 
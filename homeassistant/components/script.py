@@ -19,9 +19,10 @@ from homeassistant.core import split_entity_id
 from homeassistant.loader import bind_hass
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers import config_hash
 import homeassistant.helpers.config_validation as cv
 
-from homeassistant.helpers.script import Script
+from homeassistant.helpers.script import Script, async_get_traces
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +32,8 @@ DEPENDENCIES = ['group']
 ATTR_CAN_CANCEL = 'can_cancel'
 ATTR_LAST_ACTION = 'last_action'
 ATTR_LAST_TRIGGERED = 'last_triggered'
+ATTR_LAST_RUN_DURATION = 'last_run_duration'
+ATTR_RUN_COUNT = 'run_count'
 ATTR_VARIABLES = 'variables'
 
 CONF_SEQUENCE = 'sequence'
@@ -99,7 +102,7 @@ def async_setup(hass, config):
     @asyncio.coroutine
     def reload_service(service):
         """Call a service to reload scripts."""
-        conf = yield from component.async_prepare_reload()
+        conf = yield from component.async_prepare_reload(reset=False)
         if conf is None:
             return
 
@@ -142,7 +145,11 @@ def async_setup(hass, config):
 
 @asyncio.coroutine
 def _async_process_config(hass, config, component):
-    """Process group configuration."""
+    """Process script configuration.
+
+    Scripts that are already running with the same config are kept, the
+    others are removed and created from the new config.
+    """
     @asyncio.coroutine
     def service_handler(service):
         """Execute a service call to script.<script name>."""
@@ -153,14 +160,31 @@ def _async_process_config(hass, config, component):
             return
         yield from script.async_turn_on(variables=service.data)
 
+    current = dict(component.entities)
     scripts = []
 
     for object_id, cfg in config[DOMAIN].items():
+        cfg_hash = config_hash(cfg)
+        script = current.get(ENTITY_ID_FORMAT.format(object_id))
+
+        if script is not None and script.config_hash == cfg_hash:
+            current.pop(script.entity_id)
+            continue
+
         alias = cfg.get(CONF_ALIAS, object_id)
         script = ScriptEntity(hass, object_id, alias, cfg[CONF_SEQUENCE])
+        script.config_hash = cfg_hash
         scripts.append(script)
+
+    if current:
+        yield from asyncio.wait([
+            component.async_remove_entity(entity_id)
+            for entity_id in current], loop=hass.loop)
+
+    for script in scripts:
         hass.services.async_register(
-            DOMAIN, object_id, service_handler, schema=SCRIPT_SERVICE_SCHEMA)
+            DOMAIN, script.object_id, service_handler,
+            schema=SCRIPT_SERVICE_SCHEMA)
 
     yield from component.async_add_entities(scripts)
 
@@ -168,11 +192,14 @@ def _async_process_config(hass, config, component):
 class ScriptEntity(ToggleEntity):
     """Representation of a script entity."""
 
+    cache_static_attributes = True
+
     def __init__(self, hass, object_id, name, sequence):
         """Initialize the script."""
         self.object_id = object_id
         self.entity_id = ENTITY_ID_FORMAT.format(object_id)
         self.script = Script(hass, sequence, name, self.async_update_ha_state)
+        self.config_hash = None
 
     @property
     def should_poll(self):
@@ -189,6 +216,8 @@ class ScriptEntity(ToggleEntity):
         """Return the state attributes."""
         attrs = {}
         attrs[ATTR_LAST_TRIGGERED] = self.script.last_triggered
+        attrs[ATTR_RUN_COUNT] = self.script.traces.run_count
+        attrs[ATTR_LAST_RUN_DURATION] = self.script.traces.last_duration
         if self.script.can_cancel:
             attrs[ATTR_CAN_CANCEL] = self.script.can_cancel
         if self.script.last_action:
@@ -200,6 +229,11 @@ class ScriptEntity(ToggleEntity):
         """Return true if script is on."""
         return self.script.is_running
 
+    @asyncio.coroutine
+    def async_added_to_hass(self):
+        """Make the traces of the script available."""
+        async_get_traces(self.hass)[self.entity_id] = self.script.traces
+
     @asyncio.coroutine
     def async_turn_on(self, **kwargs):
         """Turn the script on."""
@@ -220,5 +254,6 @@ class ScriptEntity(ToggleEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.object_id)
+        async_get_traces(self.hass).pop(self.entity_id, None)
 
         return super().async_remove()
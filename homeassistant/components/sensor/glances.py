@@ -4,6 +4,7 @@ Support gathering system information of hosts which are running glances.
 For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/sensor.glances/
 """
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -15,8 +16,10 @@ from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_HOST, CONF_PORT, STATE_UNKNOWN, CONF_NAME, CONF_RESOURCES,
     TEMP_CELSIUS)
+from homeassistant.core import callback
+from homeassistant.exceptions import UpdateFailed
 from homeassistant.helpers.entity import Entity
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 _RESOURCE = 'api/2/all'
@@ -63,12 +66,20 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     url = 'http://{}:{}/{}'.format(host, port, _RESOURCE)
     var_conf = config.get(CONF_RESOURCES)
 
-    rest = GlancesData(url)
-    rest.update()
+    def fetch_data():
+        """Get the latest data from the Glances REST API."""
+        try:
+            return requests.get(url, timeout=10).json()
+        except requests.exceptions.ConnectionError:
+            raise UpdateFailed("Connection error: {}".format(url))
+
+    coordinator = DataUpdateCoordinator(
+        hass, _LOGGER, name, fetch_data, MIN_TIME_BETWEEN_UPDATES)
+    coordinator.refresh()
 
     dev = []
     for resource in var_conf:
-        dev.append(GlancesSensor(rest, name, resource))
+        dev.append(GlancesSensor(coordinator, name, resource))
 
     add_devices(dev, True)
 
@@ -76,9 +87,11 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
 class GlancesSensor(Entity):
     """Implementation of a Glances sensor."""
 
-    def __init__(self, rest, name, sensor_type):
+    cache_static_attributes = True
+
+    def __init__(self, coordinator, name, sensor_type):
         """Initialize the sensor."""
-        self.rest = rest
+        self.coordinator = coordinator
         self._name = name
         self.type = sensor_type
         self._state = STATE_UNKNOWN
@@ -96,20 +109,34 @@ class GlancesSensor(Entity):
         """Return the unit the value is expressed in."""
         return self._unit_of_measurement
 
+    @property
+    def should_poll(self):
+        """No polling needed, the coordinator notifies about new data."""
+        return False
+
     @property
     def available(self):
         """Could the device be accessed during the last update call."""
-        return self.rest.data is not None
+        return self.coordinator.last_update_success
 
     @property
     def state(self):
         """Return the state of the resources."""
         return self._state
 
+    @asyncio.coroutine
+    def async_added_to_hass(self):
+        """Update the sensor when the coordinator fetched new data."""
+        self.coordinator.async_add_listener(self._async_data_updated)
+
+    @callback
+    def _async_data_updated(self):
+        """Schedule an update of the state from the new data."""
+        self.async_schedule_update_ha_state(True)
+
     def update(self):
-        """Get the latest data from REST API."""
-        self.rest.update()
-        value = self.rest.data
+        """Update the state from the data of the coordinator."""
+        value = self.coordinator.data
 
         if value is not None:
             if self.type == 'disk_use_percent':
@@ -153,22 +180,3 @@ class GlancesSensor(Entity):
                     if sensor['label'] == 'CPU':
                         self._state = sensor['value']
                 self._state = None
-
-
-class GlancesData(object):
-    """The class for handling the data retrieval."""
-
-    def __init__(self, resource):
-        """Initialize the data object."""
-        self._resource = resource
-        self.data = dict()
-
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    def update(self):
-        """Get the latest data from the Glances REST API."""
-        try:
-            response = requests.get(self._resource, timeout=10)
-            self.data = response.json()
-        except requests.exceptions.ConnectionError:
-            _LOGGER.error("Connection error: %s", self._resource)
-            self.data = None
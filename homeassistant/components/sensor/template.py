@@ -5,6 +5,7 @@ For more details about this platform, please refer to the documentation at
 https://home-assistant.io/components/sensor.template/
 """
 import asyncio
+from datetime import timedelta
 import logging
 
 import voluptuous as vol
@@ -14,15 +15,17 @@ from homeassistant.components.sensor import ENTITY_ID_FORMAT, PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_FRIENDLY_NAME, ATTR_UNIT_OF_MEASUREMENT, CONF_VALUE_TEMPLATE,
     CONF_ICON_TEMPLATE, ATTR_ENTITY_ID, CONF_SENSORS,
-    EVENT_HOMEASSISTANT_START)
-from homeassistant.exceptions import TemplateError
+    EVENT_HOMEASSISTANT_START, EVENT_STATE_CHANGED)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import (
+    async_track_state_change, RateLimitedJob, DEFAULT_TEMPLATE_RATE_LIMIT)
 from homeassistant.helpers.restore_state import async_get_last_state
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_RATE_LIMIT = 'rate_limit'
+
 SENSOR_SCHEMA = vol.Schema({
     vol.Required(CONF_VALUE_TEMPLATE): cv.template,
     vol.Optional(CONF_ICON_TEMPLATE): cv.template,
@@ -33,6 +36,8 @@ SENSOR_SCHEMA = vol.Schema({
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_SENSORS): vol.Schema({cv.slug: SENSOR_SCHEMA}),
+    vol.Optional(CONF_RATE_LIMIT):
+        vol.All(cv.time_period, cv.positive_timedelta),
 })
 
 
@@ -41,12 +46,12 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
     """Set up the template sensors."""
     sensors = []
+    rate_limit = config.get(CONF_RATE_LIMIT)
 
     for device, device_config in config[CONF_SENSORS].items():
         state_template = device_config[CONF_VALUE_TEMPLATE]
         icon_template = device_config.get(CONF_ICON_TEMPLATE)
-        entity_ids = (device_config.get(ATTR_ENTITY_ID) or
-                      state_template.extract_entities())
+        entity_ids = device_config.get(ATTR_ENTITY_ID)
         friendly_name = device_config.get(ATTR_FRIENDLY_NAME, device)
         unit_of_measurement = device_config.get(ATTR_UNIT_OF_MEASUREMENT)
 
@@ -63,7 +68,8 @@ def async_setup_platform(hass, config, async_add_devices, discovery_info=None):
                 unit_of_measurement,
                 state_template,
                 icon_template,
-                entity_ids)
+                entity_ids,
+                rate_limit)
             )
     if not sensors:
         _LOGGER.error("No sensors added")
@@ -77,7 +83,8 @@ class SensorTemplate(Entity):
     """Representation of a Template Sensor."""
 
     def __init__(self, hass, device_id, friendly_name, unit_of_measurement,
-                 state_template, icon_template, entity_ids):
+                 state_template, icon_template, entity_ids,
+                 rate_limit=None):
         """Initialize the sensor."""
         self.hass = hass
         self.entity_id = async_generate_entity_id(ENTITY_ID_FORMAT, device_id,
@@ -89,6 +96,10 @@ class SensorTemplate(Entity):
         self._icon_template = icon_template
         self._icon = None
         self._entities = entity_ids
+        self._render_infos = []
+        self._rate_limit = rate_limit
+        self._update_job = None
+        self._unsubs = []
 
     @asyncio.coroutine
     def async_added_to_hass(self):
@@ -97,21 +108,68 @@ class SensorTemplate(Entity):
         if state:
             self._state = state.state
 
+        @asyncio.coroutine
+        def template_sensor_update():
+            """Render the templates and write the state."""
+            yield from self.async_update_ha_state(True)
+
+        update_job = self._update_job = RateLimitedJob(
+            self.hass, template_sensor_update,
+            self._rate_limit or timedelta(0))
+
         @callback
         def template_sensor_state_listener(entity, old_state, new_state):
             """Handle device state changes."""
-            self.hass.async_add_job(self.async_update_ha_state(True))
+            update_job.async_schedule()
+
+        @callback
+        def template_sensor_event_listener(event):
+            """Handle state changes of states read by the templates."""
+            entity_id = event.data.get('entity_id')
+            infos = [info for info in self._render_infos
+                     if info.filter(entity_id)]
+
+            if not infos:
+                return
+
+            if self._rate_limit is None and \
+                    any(info.is_broad for info in infos):
+                update_job.async_schedule(DEFAULT_TEMPLATE_RATE_LIMIT)
+            else:
+                update_job.async_schedule()
 
         @callback
         def template_sensor_startup(event):
             """Update template on startup."""
-            async_track_state_change(
-                self.hass, self._entities, template_sensor_state_listener)
+            self._unsubs.remove(unsub_startup)
+
+            if self._entities is not None:
+                self._unsubs.append(async_track_state_change(
+                    self.hass, self._entities,
+                    template_sensor_state_listener))
+            else:
+                self._unsubs.append(self.hass.bus.async_listen(
+                    EVENT_STATE_CHANGED, template_sensor_event_listener))
 
             self.hass.async_add_job(self.async_update_ha_state(True))
 
-        self.hass.bus.async_listen_once(
+        unsub_startup = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_START, template_sensor_startup)
+        self._unsubs.append(unsub_startup)
+
+    @asyncio.coroutine
+    def async_remove(self):
+        """Stop tracking states and cancel a pending update.
+
+        This method is a coroutine.
+        """
+        while self._unsubs:
+            self._unsubs.pop()()
+
+        if self._update_job is not None:
+            self._update_job.async_cancel()
+
+        yield from super().async_remove()
 
     @property
     def name(self):
@@ -140,10 +198,20 @@ class SensorTemplate(Entity):
 
     @asyncio.coroutine
     def async_update(self):
-        """Update the state from the template."""
-        try:
-            self._state = self._template.async_render()
-        except TemplateError as ex:
+        """Update the state from the template.
+
+        The states read while rendering are tracked to know when the
+        templates need to be rendered again.
+        """
+        render_infos = self._render_infos = []
+
+        info = self._template.async_render_to_info()
+        render_infos.append(info)
+
+        if info.exception is None:
+            self._state = info.result
+        else:
+            ex = info.exception
             if ex.args and ex.args[0].startswith(
                     "UndefinedError: 'None' has no attribute"):
                 # Common during HA startup - so just a warning
@@ -154,9 +222,13 @@ class SensorTemplate(Entity):
             _LOGGER.error('Could not render template %s: %s', self._name, ex)
 
         if self._icon_template is not None:
-            try:
-                self._icon = self._icon_template.async_render()
-            except TemplateError as ex:
+            info = self._icon_template.async_render_to_info()
+            render_infos.append(info)
+
+            if info.exception is None:
+                self._icon = info.result
+            else:
+                ex = info.exception
                 if ex.args and ex.args[0].startswith(
                         "UndefinedError: 'None' has no attribute"):
                     # Common during HA startup - so just a warning
@@ -21,6 +21,8 @@ from homeassistant.components import frontend
 from homeassistant.core import callback
 from homeassistant.remote import JSONEncoder
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.entity_component import async_polling_stats
+from homeassistant.helpers.script import async_get_traces
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.http.auth import validate_password
 from homeassistant.components.http.const import KEY_AUTHENTICATED
@@ -45,8 +47,11 @@ TYPE_CALL_SERVICE = 'call_service'
 TYPE_EVENT = 'event'
 TYPE_GET_CONFIG = 'get_config'
 TYPE_GET_PANELS = 'get_panels'
+TYPE_GET_POLLING_STATS = 'get_polling_stats'
 TYPE_GET_SERVICES = 'get_services'
 TYPE_GET_STATES = 'get_states'
+TYPE_GET_TRACES = 'get_traces'
+TYPE_GET_TRIGGER_STATS = 'get_trigger_stats'
 TYPE_PING = 'ping'
 TYPE_PONG = 'pong'
 TYPE_RESULT = 'result'
@@ -102,6 +107,22 @@ GET_PANELS_MESSAGE_SCHEMA = vol.Schema({
     vol.Required('type'): TYPE_GET_PANELS,
 })
 
+GET_TRACES_MESSAGE_SCHEMA = vol.Schema({
+    vol.Required('id'): cv.positive_int,
+    vol.Required('type'): TYPE_GET_TRACES,
+    vol.Optional('entity_id'): cv.entity_ids,
+})
+
+GET_POLLING_STATS_MESSAGE_SCHEMA = vol.Schema({
+    vol.Required('id'): cv.positive_int,
+    vol.Required('type'): TYPE_GET_POLLING_STATS,
+})
+
+GET_TRIGGER_STATS_MESSAGE_SCHEMA = vol.Schema({
+    vol.Required('id'): cv.positive_int,
+    vol.Required('type'): TYPE_GET_TRIGGER_STATS,
+})
+
 PING_MESSAGE_SCHEMA = vol.Schema({
     vol.Required('id'): cv.positive_int,
     vol.Required('type'): TYPE_PING,
@@ -116,6 +137,9 @@ BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({
                                   TYPE_GET_SERVICES,
                                   TYPE_GET_CONFIG,
                                   TYPE_GET_PANELS,
+                                  TYPE_GET_POLLING_STATS,
+                                  TYPE_GET_TRACES,
+                                  TYPE_GET_TRIGGER_STATS,
                                   TYPE_PING)
 }, extra=vol.ALLOW_EXTRA)
 
@@ -487,6 +511,43 @@ class ActiveConnection:
         self.to_write.put_nowait(result_message(
             msg['id'], self.hass.data[frontend.DATA_PANELS]))
 
+    def handle_get_polling_stats(self, msg):
+        """Handle get polling stats command.
+
+        Async friendly.
+        """
+        msg = GET_POLLING_STATS_MESSAGE_SCHEMA(msg)
+
+        self.to_write.put_nowait(result_message(
+            msg['id'], async_polling_stats(self.hass)))
+
+    def handle_get_traces(self, msg):
+        """Handle get traces command.
+
+        Async friendly.
+        """
+        msg = GET_TRACES_MESSAGE_SCHEMA(msg)
+        traces = async_get_traces(self.hass)
+        entity_ids = msg.get('entity_id', traces)
+
+        self.to_write.put_nowait(result_message(msg['id'], {
+            entity_id: traces[entity_id].as_dict()
+            for entity_id in entity_ids if entity_id in traces
+        }))
+
+    def handle_get_trigger_stats(self, msg):
+        """Handle get trigger stats command.
+
+        Async friendly.
+        """
+        import homeassistant.components.automation as automation
+
+        msg = GET_TRIGGER_STATS_MESSAGE_SCHEMA(msg)
+        registry = automation.async_get_trigger_registry(self.hass)
+
+        self.to_write.put_nowait(result_message(
+            msg['id'], registry.async_stats()))
+
     def handle_ping(self, msg):
         """Handle ping command.
 
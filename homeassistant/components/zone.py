@@ -65,9 +65,9 @@ def async_active_zone(hass, latitude, longitude, radius=0):
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (hass.states.get(entity_id) for entity_id
-             in sorted(hass.states.async_entity_ids(DOMAIN)))
+    # Sorted by entity ID so that we are deterministic if equal distance to
+    # 2 zones
+    zones = hass.states.async_sorted(DOMAIN)
 
     min_dist = None
     closest = None
@@ -114,12 +114,14 @@ CONF_MAC = 'mac'
 CONF_METHOD = 'method'
 CONF_MINIMUM = 'minimum'
 CONF_MAXIMUM = 'maximum'
+CONF_MAX_SCAN_INTERVAL = 'max_scan_interval'
 CONF_MONITORED_CONDITIONS = 'monitored_conditions'
 CONF_MONITORED_VARIABLES = 'monitored_variables'
 CONF_NAME = 'name'
 CONF_OFFSET = 'offset'
 CONF_OPTIMISTIC = 'optimistic'
 CONF_PACKAGES = 'packages'
+CONF_PARALLEL_UPDATES = 'parallel_updates'
 CONF_PASSWORD = 'password'
 CONF_PATH = 'path'
 CONF_PAYLOAD = 'payload'
@@ -374,10 +376,12 @@ URL_API_EVENTS = '/api/events'
 URL_API_EVENTS_EVENT = '/api/events/{}'
 URL_API_SERVICES = '/api/services'
 URL_API_SERVICES_SERVICE = '/api/services/{}/{}'
+URL_API_SERVICES_BATCH = '/api/services/batch'
 URL_API_COMPONENTS = '/api/components'
 URL_API_ERROR_LOG = '/api/error_log'
 URL_API_LOG_OUT = '/api/log_out'
 URL_API_TEMPLATE = '/api/template'
+URL_API_STARTUP_TIMELINE = '/api/startup_timeline'
 
 HTTP_OK = 200
 HTTP_CREATED = 201
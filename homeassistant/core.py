@@ -6,6 +6,7 @@ of entities and react to changes.
 """
 # pylint: disable=unused-import, too-many-lines
 import asyncio
+from bisect import bisect_left, insort
 from concurrent.futures import ThreadPoolExecutor
 import enum
 import logging
@@ -254,20 +255,39 @@ class HomeAssistant(object):
             self.async_block_till_done(), loop=self.loop).result()
 
     @asyncio.coroutine
-    def async_block_till_done(self):
-        """Block till all pending work is done."""
+    def async_block_till_done(self, wait_timeout=None):
+        """Block till all pending work is done.
+
+        With wait_timeout, stop waiting after that many seconds. The tasks
+        that are still running then are no longer tracked, so later calls
+        do not wait for them either. Returns False if that happened.
+
+        This method is a coroutine.
+        """
         # To flush out any call_soon_threadsafe
         yield from asyncio.sleep(0, loop=self.loop)
 
+        deadline = None
+        if wait_timeout is not None:
+            deadline = self.loop.time() + wait_timeout
+
         while self._pending_tasks:
             pending = [task for task in self._pending_tasks
                        if not task.done()]
             self._pending_tasks.clear()
             if pending:
-                yield from asyncio.wait(pending, loop=self.loop)
+                remaining = None
+                if deadline is not None:
+                    remaining = max(deadline - self.loop.time(), 0)
+                _, still_pending = yield from asyncio.wait(
+                    pending, loop=self.loop, timeout=remaining)
+                if still_pending:
+                    return False
             else:
                 yield from asyncio.sleep(0, loop=self.loop)
 
+        return True
+
     def stop(self) -> None:
         """Stop Home Assistant and shuts down all threads."""
         fire_coroutine_threadsafe(self.async_stop(), self.loop)
@@ -609,6 +629,8 @@ class StateMachine(object):
     def __init__(self, bus, loop):
         """Initialize state machine."""
         self._states = {}
+        # Domain -> sorted list of entity ids
+        self._domain_index = {}
         self._bus = bus
         self._loop = loop
 
@@ -628,10 +650,15 @@ class StateMachine(object):
         if domain_filter is None:
             return list(self._states.keys())
 
-        domain_filter = domain_filter.lower()
+        return list(self._domain_index.get(domain_filter.lower(), ()))
+
+    @callback
+    def async_domains(self):
+        """Return a sorted list of the domains that have states.
 
-        return [state.entity_id for state in self._states.values()
-                if state.domain == domain_filter]
+        This method must be run in the event loop.
+        """
+        return sorted(self._domain_index)
 
     def all(self):
         """Create a list of all states."""
@@ -645,6 +672,25 @@ class StateMachine(object):
         """
         return list(self._states.values())
 
+    @callback
+    def async_sorted(self, domain_filter=None):
+        """Create a list of states sorted by entity id.
+
+        Pass in a domain to only return the states of that domain.
+
+        This method must be run in the event loop.
+        """
+        states = self._states
+
+        if domain_filter is not None:
+            return [states[entity_id] for entity_id
+                    in self._domain_index.get(domain_filter.lower(), ())]
+
+        # Domains only contain characters that sort after the '.' so
+        # concatenating the sorted domains gives sorted entity ids.
+        return [states[entity_id] for domain in sorted(self._domain_index)
+                for entity_id in self._domain_index[domain]]
+
     def get(self, entity_id):
         """Retrieve state of entity_id or None if not found.
 
@@ -691,6 +737,11 @@ class StateMachine(object):
         if old_state is None:
             return False
 
+        domain_entity_ids = self._domain_index[old_state.domain]
+        del domain_entity_ids[bisect_left(domain_entity_ids, entity_id)]
+        if not domain_entity_ids:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
@@ -738,6 +789,10 @@ class StateMachine(object):
         last_changed = old_state.last_changed if same_state else None
         state = State(entity_id, new_state, attributes, last_changed)
         self._states[entity_id] = state
+
+        if not is_existing:
+            insort(self._domain_index.setdefault(state.domain, []), entity_id)
+
         self._bus.async_fire(EVENT_STATE_CHANGED, {
             'entity_id': entity_id,
             'old_state': old_state,
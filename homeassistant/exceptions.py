@@ -32,3 +32,9 @@ class PlatformNotReady(HomeAssistantError):
     """Error to indicate that platform is not ready."""
 
     pass
+
+
+class UpdateFailed(HomeAssistantError):
+    """Error to indicate that fetching data for an update failed."""
+
+    pass
@@ -1,4 +1,6 @@
 """Helper methods for components within Home Assistant."""
+import hashlib
+import json
 import re
 
 from typing import Any, Iterable, Tuple, Sequence, Dict
@@ -46,3 +48,13 @@ def extract_domain_configs(config: ConfigType, domain: str) -> Sequence[str]:
     """
     pattern = re.compile(r'^{}(| .+)$'.format(domain))
     return [key for key in config.keys() if pattern.match(key)]
+
+
+def config_hash(config: Any) -> str:
+    """Return a hash of a validated config block.
+
+    Objects created by validation, like templates and time periods, are
+    hashed by their representation. Async friendly.
+    """
+    return hashlib.sha1(json.dumps(
+        config, sort_keys=True, default=repr).encode('utf-8')).hexdigest()
@@ -23,6 +23,17 @@ from homeassistant.util.async import run_callback_threadsafe
 FROM_CONFIG_FORMAT = '{}_from_config'
 ASYNC_FROM_CONFIG_FORMAT = 'async_{}_from_config'
 
+# Estimated relative cost to evaluate each type of condition
+CONDITION_COSTS = {
+    'state': 1,
+    'time': 1,
+    'zone': 2,
+    'numeric_state': 2,
+    'sun': 4,
+    'template': 10,
+}
+DEFAULT_CONDITION_COST = 5
+
 _LOGGER = logging.getLogger(__name__)
 
 # PyLint does not like the use of _threaded_factory
@@ -70,21 +81,41 @@ def async_from_config(config: ConfigType, config_validation: bool=True):
 from_config = _threaded_factory(async_from_config)
 
 
+def condition_cost(config: ConfigType) -> int:
+    """Return the estimated cost to evaluate a condition configuration."""
+    condition = config.get(CONF_CONDITION)
+
+    if condition in ('and', 'or'):
+        return sum(condition_cost(entry) for entry in config['conditions'])
+
+    cost = CONDITION_COSTS.get(condition, DEFAULT_CONDITION_COST)
+
+    if condition == 'numeric_state' and \
+            config.get(CONF_VALUE_TEMPLATE) is not None:
+        cost += CONDITION_COSTS['template']
+
+    return cost
+
+
+def async_from_config_sorted(configs, config_validation: bool=True):
+    """Turn a list of condition configurations into methods.
+
+    The methods are ordered by estimated cost, cheapest first, so that
+    cheap checks can short circuit the evaluation of expensive ones.
+    """
+    return [async_from_config(entry, config_validation) for entry
+            in sorted(configs, key=condition_cost)]
+
+
 def async_and_from_config(config: ConfigType, config_validation: bool=True):
     """Create multi condition matcher using 'AND'."""
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
-    checks = None
+    checks = async_from_config_sorted(config['conditions'], False)
 
     def if_and_condition(hass: HomeAssistant,
                          variables=None) -> bool:
         """Test and condition."""
-        nonlocal checks
-
-        if checks is None:
-            checks = [async_from_config(entry, False) for entry
-                      in config['conditions']]
-
         try:
             for check in checks:
                 if not check(hass, variables):
@@ -105,17 +136,11 @@ def async_or_from_config(config: ConfigType, config_validation: bool=True):
     """Create multi condition matcher using 'OR'."""
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
-    checks = None
+    checks = async_from_config_sorted(config['conditions'], False)
 
     def if_or_condition(hass: HomeAssistant,
                         variables=None) -> bool:
-        """Test and condition."""
-        nonlocal checks
-
-        if checks is None:
-            checks = [async_from_config(entry, False) for entry
-                      in config['conditions']]
-
+        """Test or condition."""
         try:
             for check in checks:
                 if check(hass, variables):
@@ -12,7 +12,8 @@ import voluptuous as vol
 from homeassistant.loader import get_platform
 from homeassistant.const import (
     CONF_PLATFORM, CONF_SCAN_INTERVAL, TEMP_CELSIUS, TEMP_FAHRENHEIT,
-    CONF_ALIAS, CONF_ENTITY_ID, CONF_VALUE_TEMPLATE, WEEKDAYS,
+    CONF_PARALLEL_UPDATES, CONF_MAX_SCAN_INTERVAL, CONF_ALIAS, CONF_ENTITY_ID,
+    CONF_VALUE_TEMPLATE, WEEKDAYS,
     CONF_CONDITION, CONF_BELOW, CONF_ABOVE, CONF_TIMEOUT, SUN_EVENT_SUNSET,
     SUN_EVENT_SUNRISE, CONF_UNIT_SYSTEM_IMPERIAL, CONF_UNIT_SYSTEM_METRIC)
 from homeassistant.core import valid_entity_id
@@ -399,7 +400,10 @@ def key_dependency(key, dependency):
 
 PLATFORM_SCHEMA = vol.Schema({
     vol.Required(CONF_PLATFORM): string,
-    vol.Optional(CONF_SCAN_INTERVAL): time_period
+    vol.Optional(CONF_SCAN_INTERVAL): time_period,
+    vol.Optional(CONF_MAX_SCAN_INTERVAL): time_period,
+    vol.Optional(CONF_PARALLEL_UPDATES): vol.All(
+        vol.Coerce(int), vol.Range(min=1)),
 }, extra=vol.ALLOW_EXTRA)
 
 EVENT_SCHEMA = vol.Schema({
@@ -415,6 +419,7 @@ SERVICE_SCHEMA = vol.All(vol.Schema({
     vol.Optional('data'): dict,
     vol.Optional('data_template'): {match_all: template_complex},
     vol.Optional(CONF_ENTITY_ID): entity_ids,
+    vol.Optional('blocking'): boolean,
 }), has_at_least_one_key('service', 'service_template'))
 
 NUMERIC_STATE_CONDITION_SCHEMA = vol.All(vol.Schema({
@@ -506,8 +511,15 @@ _SCRIPT_WAIT_TEMPLATE_SCHEMA = vol.Schema({
     vol.Optional(CONF_TIMEOUT): vol.All(time_period, positive_timedelta),
 })
 
+_SCRIPT_PARALLEL_SCHEMA = vol.Schema({
+    vol.Optional(CONF_ALIAS): string,
+    vol.Required("parallel"): vol.All(
+        ensure_list, [vol.Any(SERVICE_SCHEMA, EVENT_SCHEMA)]),
+})
+
 SCRIPT_SCHEMA = vol.All(
     ensure_list,
     [vol.Any(SERVICE_SCHEMA, _SCRIPT_DELAY_SCHEMA,
-             _SCRIPT_WAIT_TEMPLATE_SCHEMA, EVENT_SCHEMA, CONDITION_SCHEMA)],
+             _SCRIPT_WAIT_TEMPLATE_SCHEMA, _SCRIPT_PARALLEL_SCHEMA,
+             EVENT_SCHEMA, CONDITION_SCHEMA)],
 )
@@ -68,12 +68,24 @@ class Entity(object):
     # Owning hass instance. Will be set by EntityComponent
     hass = None  # type: Optional[HomeAssistant]
 
+    # Set to True if name, icon, entity picture, unit of measurement,
+    # hidden, assumed state, supported features and device class never
+    # change. They are then read once until invalidate_static_attributes
+    # is called.
+    cache_static_attributes = False
+
     # If we reported if this entity was slow
     _slow_reported = False
 
     # protect for multible updates
     _update_warn = None
 
+    # Cached static attributes and customize they were built with
+    _static_attributes = None
+
+    # State, attributes and state object of the last write
+    _last_written = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -243,22 +255,15 @@ class Entity(object):
             else:
                 state = str(state)
 
-            attr = self.state_attributes or {}
+            attr = dict(self.state_attributes or {})
             device_attr = self.device_state_attributes
             if device_attr is not None:
                 attr.update(device_attr)
 
-        self._attr_setter('unit_of_measurement', str, ATTR_UNIT_OF_MEASUREMENT,
-                          attr)
-
-        self._attr_setter('name', str, ATTR_FRIENDLY_NAME, attr)
-        self._attr_setter('icon', str, ATTR_ICON, attr)
-        self._attr_setter('entity_picture', str, ATTR_ENTITY_PICTURE, attr)
-        self._attr_setter('hidden', bool, ATTR_HIDDEN, attr)
-        self._attr_setter('assumed_state', bool, ATTR_ASSUMED_STATE, attr)
-        self._attr_setter('supported_features', int, ATTR_SUPPORTED_FEATURES,
-                          attr)
-        self._attr_setter('device_class', str, ATTR_DEVICE_CLASS, attr)
+        if self.cache_static_attributes:
+            static_attr = self._async_cached_static_attributes()
+        else:
+            static_attr = self._async_build_static_attributes()
 
         end = timer()
 
@@ -269,9 +274,22 @@ class Entity(object):
                             "https://goo.gl/Nvioub", self.entity_id,
                             end - start)
 
+        # Nothing changed since the last write of this entity
+        last = self._last_written
+        if last is not None and not self.force_update and \
+                last[0] == state and last[1] == attr and \
+                last[2] == static_attr and \
+                self.hass.states.get(self.entity_id) is last[3]:
+            return
+
+        written = (state, dict(attr), static_attr)
+        attributes, customize = static_attr
+
+        for key, value in attributes.items():
+            attr.setdefault(key, value)
+
         # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        attr.update(customize)
 
         # Remove hidden property if false so it won't show up.
         if not attr.get(ATTR_HIDDEN, True):
@@ -294,6 +312,9 @@ class Entity(object):
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update)
 
+        self._last_written = written + (
+            self.hass.states.get(self.entity_id),)
+
     def schedule_update_ha_state(self, force_refresh=False):
         """Schedule a update ha state change task.
 
@@ -315,6 +336,43 @@ class Entity(object):
         """
         self.hass.states.async_remove(self.entity_id)
 
+    def invalidate_static_attributes(self):
+        """Read the static attributes again on the next state write."""
+        self._static_attributes = None
+
+    def _async_cached_static_attributes(self):
+        """Return the static attributes, build them if needed."""
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        cached = self._static_attributes
+
+        if cached is None or cached[0] is not customize:
+            cached = self._static_attributes = (
+                customize, self._async_build_static_attributes())
+
+        return cached[1]
+
+    def _async_build_static_attributes(self):
+        """Return the attributes from properties and the customizations."""
+        attr = {}
+
+        self._attr_setter('unit_of_measurement', str, ATTR_UNIT_OF_MEASUREMENT,
+                          attr)
+
+        self._attr_setter('name', str, ATTR_FRIENDLY_NAME, attr)
+        self._attr_setter('icon', str, ATTR_ICON, attr)
+        self._attr_setter('entity_picture', str, ATTR_ENTITY_PICTURE, attr)
+        self._attr_setter('hidden', bool, ATTR_HIDDEN, attr)
+        self._attr_setter('assumed_state', bool, ATTR_ASSUMED_STATE, attr)
+        self._attr_setter('supported_features', int, ATTR_SUPPORTED_FEATURES,
+                          attr)
+        self._attr_setter('device_class', str, ATTR_DEVICE_CLASS, attr)
+
+        customize = {}
+        if DATA_CUSTOMIZE in self.hass.data:
+            customize = self.hass.data[DATA_CUSTOMIZE].get(self.entity_id)
+
+        return attr, customize
+
     def _attr_setter(self, name, typ, attr, attrs):
         """Populate attributes based on properties."""
         if attr in attrs:
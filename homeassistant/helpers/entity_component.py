@@ -1,19 +1,23 @@
 """Helpers for components that manage entities."""
 import asyncio
+from collections import OrderedDict
 from datetime import timedelta
+import random
+from timeit import default_timer as timer
 
 from homeassistant import config as conf_util
 from homeassistant.setup import async_prepare_setup_platform
 from homeassistant.const import (
     ATTR_ENTITY_ID, CONF_SCAN_INTERVAL, CONF_ENTITY_NAMESPACE,
-    DEVICE_DEFAULT_NAME)
+    CONF_PARALLEL_UPDATES, CONF_MAX_SCAN_INTERVAL, DEVICE_DEFAULT_NAME)
 from homeassistant.core import callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.loader import get_component
-from homeassistant.helpers import config_per_platform, discovery
+from homeassistant.helpers import config_per_platform, discovery, timeline
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.event import (
-    async_track_time_interval, async_track_point_in_time)
+    async_track_time_interval, async_track_point_in_time,
+    async_track_point_in_utc_time)
 from homeassistant.helpers.service import extract_entity_ids
 from homeassistant.util import slugify
 from homeassistant.util.async import (
@@ -21,10 +25,23 @@ from homeassistant.util.async import (
 import homeassistant.util.dt as dt_util
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
+DEFAULT_PARALLEL_UPDATES = 1
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 PLATFORM_NOT_READY_RETRIES = 10
 
+DATA_ENTITY_COMPONENTS = 'entity_components'
+
+
+@callback
+def async_polling_stats(hass):
+    """Return the polling statistics of the entity components by domain.
+
+    This method must be run in the event loop.
+    """
+    return {domain: component.async_scan_stats() for domain, component
+            in hass.data.get(DATA_ENTITY_COMPONENTS, {}).items()}
+
 
 class EntityComponent(object):
     """Helper class that will help a component manage its entities."""
@@ -43,12 +60,15 @@ class EntityComponent(object):
         self.entities = {}
         self.config = None
 
+        self._entity_platforms = {}
         self._platforms = {
             'core': EntityPlatform(self, domain, self.scan_interval, None),
         }
         self.async_add_entities = self._platforms['core'].async_add_entities
         self.add_entities = self._platforms['core'].add_entities
 
+        hass.data.setdefault(DATA_ENTITY_COMPONENTS, {})[domain] = self
+
     def setup(self, config):
         """Set up a full entity component.
 
@@ -114,6 +134,74 @@ class EntityComponent(object):
                 if entity_id in self.entities and
                 self.entities[entity_id].available]
 
+    @asyncio.coroutine
+    def async_call_entity_service(self, entities, method, *args, **kwargs):
+        """Call a method on entities concurrently and update them after.
+
+        method is the name of an entity method that returns a coroutine or
+        a function that is called with the entity and the arguments and
+        returns a coroutine. A platform can handle a method for all of its
+        target entities at once by offering a batch version, for example
+        async_batch_turn_on(hass, entities, **kwargs) for async_turn_on.
+
+        Entities without async_update are called at most parallel_updates
+        at the same time per platform. Errors are collected and reported
+        once all entities are done.
+
+        This method must be run in the event loop.
+        """
+        core = self._platforms['core']
+        by_platform = OrderedDict()
+
+        for entity in entities:
+            platform = self._entity_platforms.get(entity.entity_id, core)
+            by_platform.setdefault(platform, []).append(entity)
+
+        if not by_platform:
+            return
+
+        results = yield from asyncio.gather(*[
+            platform.async_call_service(platform_entities, method, args,
+                                        kwargs)
+            for platform, platform_entities in by_platform.items()
+        ], loop=self.hass.loop)
+
+        errors = [error for platform_errors in results
+                  for error in platform_errors]
+        failed = set(entity for failed_entities, _ in errors
+                     for entity in failed_entities)
+
+        update_tasks = []
+
+        for platform, platform_entities in by_platform.items():
+            for entity in platform_entities:
+                if not entity.should_poll or entity in failed:
+                    continue
+
+                update_coro = entity.async_update_ha_state(True)
+                if hasattr(entity, 'async_update'):
+                    update_tasks.append(self.hass.async_add_job(update_coro))
+                else:
+                    # pylint: disable=protected-access
+                    update_tasks.append(
+                        platform._async_update_sync_entity(update_coro))
+
+        if update_tasks:
+            yield from asyncio.wait(update_tasks, loop=self.hass.loop)
+
+        if not errors:
+            return
+
+        details = []
+        for failed_entities, err in errors:
+            details.append('{}: {}'.format(', '.join(
+                entity.entity_id for entity in failed_entities), err))
+
+        self.logger.error(
+            "Error calling %s on %d of %d entities: %s",
+            getattr(method, '__name__', method), len(failed),
+            len(entities), '; '.join(details))
+
     @asyncio.coroutine
     def _async_setup_platform(self, platform_type, platform_config,
                               discovery_info=None, tries=0):
@@ -132,15 +220,25 @@ class EntityComponent(object):
                          getattr(platform, 'SCAN_INTERVAL', None) or
                          self.scan_interval)
         entity_namespace = platform_config.get(CONF_ENTITY_NAMESPACE)
+        parallel_updates = (platform_config.get(CONF_PARALLEL_UPDATES) or
+                            getattr(platform, 'PARALLEL_UPDATES', None) or
+                            DEFAULT_PARALLEL_UPDATES)
+        max_scan_interval = (platform_config.get(CONF_MAX_SCAN_INTERVAL) or
+                             getattr(platform, 'MAX_SCAN_INTERVAL', None))
 
-        key = (platform_type, scan_interval, entity_namespace)
+        key = (platform_type, scan_interval, entity_namespace,
+               parallel_updates, max_scan_interval)
 
         if key not in self._platforms:
             self._platforms[key] = EntityPlatform(
-                self, platform_type, scan_interval, entity_namespace)
+                self, platform_type, scan_interval, entity_namespace,
+                parallel_updates, max_scan_interval, platform)
         entity_platform = self._platforms[key]
 
         self.logger.info("Setting up %s.%s", self.domain, platform_type)
+        startup_timeline = timeline.async_get_timeline(self.hass)
+        platform_path = '{}.{}'.format(self.domain, platform_type)
+        start = timer()
         warn_task = self.hass.loop.call_later(
             SLOW_SETUP_WARNING, self.logger.warning,
             "Setup of platform %s is taking over %s seconds.", platform_type,
@@ -162,9 +260,12 @@ class EntityComponent(object):
             yield from asyncio.wait_for(
                 asyncio.shield(task, loop=self.hass.loop),
                 SLOW_SETUP_MAX_WAIT, loop=self.hass.loop)
-            yield from entity_platform.async_block_entities_done()
-            self.hass.config.components.add(
-                '{}.{}'.format(self.domain, platform_type))
+            startup_timeline.add(platform_path, timeline.PHASE_SETUP, start)
+
+            with startup_timeline.span(platform_path,
+                                       timeline.PHASE_ADD_ENTITIES):
+                yield from entity_platform.async_block_entities_done()
+            self.hass.config.components.add(platform_path)
         except PlatformNotReady:
             tries += 1
             wait_time = min(tries, 6) * 30
@@ -231,6 +332,8 @@ class EntityComponent(object):
                 'Invalid entity id: {}'.format(entity.entity_id))
 
         self.entities[entity.entity_id] = entity
+        self._entity_platforms[entity.entity_id] = \
+            platform or self._platforms['core']
 
         if hasattr(entity, 'async_added_to_hass'):
             yield from entity.async_added_to_hass()
@@ -279,6 +382,7 @@ class EntityComponent(object):
             'core': self._platforms['core']
         }
         self.entities = {}
+        self._entity_platforms = {}
         self.config = None
 
         if self.group_name is not None:
@@ -290,10 +394,44 @@ class EntityComponent(object):
         return run_coroutine_threadsafe(
             self.async_prepare_reload(), loop=self.hass.loop).result()
 
+    @callback
+    def async_scan_stats(self):
+        """Return the polling statistics of the platforms.
+
+        This method must be run in the event loop.
+        """
+        return [platform.async_scan_stats() for platform
+                in self._platforms.values() if platform.scan_count]
+
+    @asyncio.coroutine
+    def async_remove_entity(self, entity_id):
+        """Remove an entity from the component.
+
+        This method must be run in the event loop.
+        """
+        entity = self.entities.pop(entity_id, None)
+
+        if entity is None:
+            return
+
+        self._entity_platforms.pop(entity_id, None)
+
+        for platform in self._platforms.values():
+            if entity in platform.platform_entities:
+                platform.platform_entities.remove(entity)
+                # pylint: disable=protected-access
+                platform._poll_scans.pop(entity_id, None)
+
+        yield from entity.async_remove()
+        self.async_update_group()
+
     @asyncio.coroutine
-    def async_prepare_reload(self):
+    def async_prepare_reload(self, reset=True):
         """Prepare reloading this entity component.
 
+        Pass reset=False to keep the current entities, for components that
+        update their entities from the new config themselves.
+
         This method must be run in the event loop.
         """
         try:
@@ -309,23 +447,45 @@ class EntityComponent(object):
         if conf is None:
             return None
 
-        yield from self.async_reset()
+        if reset:
+            yield from self.async_reset()
         return conf
 
 
 class EntityPlatform(object):
-    """Keep track of entities for a single platform and stay in loop."""
-
-    def __init__(self, component, platform, scan_interval, entity_namespace):
+    """Keep track of entities for a single platform and stay in loop.
+
+    With a max_scan_interval the platform polls adaptively: polling starts
+    at a random offset and every entity that is unavailable or did not
+    change is polled half as often, up to max_scan_interval. An entity
+    that changed is polled every scan_interval again. Only the state and
+    attributes count as a change, so entities with force_update back off
+    too.
+    """
+
+    def __init__(self, component, platform, scan_interval, entity_namespace,
+                 parallel_updates=DEFAULT_PARALLEL_UPDATES,
+                 max_scan_interval=None, platform_module=None):
         """Initialize the entity platform."""
         self.component = component
         self.platform = platform
+        self.platform_module = platform_module
         self.scan_interval = scan_interval
         self.entity_namespace = entity_namespace
+        self.parallel_updates = parallel_updates
+        self.max_scan_interval = max_scan_interval
         self.platform_entities = []
+        self.scan_count = 0
+        self.skipped_scans = 0
+        self.last_scan_duration = None
+        self.max_scan_duration = None
         self._tasks = []
         self._async_unsub_polling = None
         self._process_updates = asyncio.Lock(loop=component.hass.loop)
+        self._update_semaphore = asyncio.Semaphore(
+            parallel_updates, loop=component.hass.loop)
+        # entity_id: [interval, scans left until next poll] in scans
+        self._poll_scans = {}
 
     @asyncio.coroutine
     def async_block_entities_done(self):
@@ -393,10 +553,34 @@ class EntityPlatform(object):
                    in self.platform_entities):
             return
 
+        if self.max_scan_interval is not None:
+            self._async_start_adaptive_polling()
+            return
+
         self._async_unsub_polling = async_track_time_interval(
             self.component.hass, self._update_entity_states, self.scan_interval
         )
 
+    @callback
+    def _async_start_adaptive_polling(self):
+        """Start polling after a random part of the scan interval.
+
+        This spreads the polling of platforms with the same scan interval.
+        """
+        hass = self.component.hass
+        jitter = random.uniform(0, self.scan_interval.total_seconds())
+
+        @callback
+        def async_start_polling(now):
+            """Poll now and every scan interval."""
+            hass.async_add_job(self._update_entity_states(now))
+            self._async_unsub_polling = async_track_time_interval(
+                hass, self._update_entity_states, self.scan_interval)
+
+        self._async_unsub_polling = async_track_point_in_utc_time(
+            hass, async_start_polling,
+            dt_util.utcnow() + timedelta(seconds=jitter))
+
     @asyncio.coroutine
     def async_reset(self):
         """Remove all entities and reset data.
@@ -414,16 +598,40 @@ class EntityPlatform(object):
             self._async_unsub_polling()
             self._async_unsub_polling = None
 
+        self._poll_scans.clear()
+
+    @callback
+    def async_poll_intervals(self):
+        """Return the effective poll interval in seconds by entity id."""
+        seconds = self.scan_interval.total_seconds()
+        return {entity_id: poll[0] * seconds
+                for entity_id, poll in self._poll_scans.items()}
+
+    @callback
+    def async_scan_stats(self):
+        """Return the polling statistics of the platform."""
+        return {
+            'platform': self.platform,
+            'scan_interval': self.scan_interval.total_seconds(),
+            'parallel_updates': self.parallel_updates,
+            'scan_count': self.scan_count,
+            'skipped_scans': self.skipped_scans,
+            'last_scan_duration': self.last_scan_duration,
+            'max_scan_duration': self.max_scan_duration,
+            'poll_intervals': self.async_poll_intervals(),
+        }
+
     @asyncio.coroutine
     def _update_entity_states(self, now):
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        To protect from flooding the executor, async entities are updated
+        in parallel and at most parallel_updates other entities at once.
 
         This method must be run in the event loop.
         """
         if self._process_updates.locked():
+            self.skipped_scans += 1
             self.component.logger.warning(
                 "Updating %s %s took longer than the scheduled update "
                 "interval %s", self.platform, self.component.domain,
@@ -431,27 +639,130 @@ class EntityPlatform(object):
             return
 
         with (yield from self._process_updates):
+            hass = self.component.hass
+            start = hass.loop.time()
             tasks = []
-            to_update = []
 
             for entity in self.platform_entities:
                 if not entity.should_poll:
                     continue
 
-                update_coro = entity.async_update_ha_state(True)
-                if hasattr(entity, 'async_update'):
-                    tasks.append(
-                        self.component.hass.async_add_job(update_coro))
+                if self.max_scan_interval is None:
+                    update_coro = entity.async_update_ha_state(True)
+                elif self._async_poll_due(entity):
+                    update_coro = self._async_update_adaptive(entity)
                 else:
-                    to_update.append(update_coro)
+                    continue
 
-            for update_coro in to_update:
-                try:
-                    yield from update_coro
-                except Exception:  # pylint: disable=broad-except
-                    self.component.logger.exception(
-                        "Error while update entity from %s in %s",
-                        self.platform, self.component.domain)
+                if hasattr(entity, 'async_update'):
+                    tasks.append(hass.async_add_job(update_coro))
+                else:
+                    tasks.append(self._async_update_sync_entity(update_coro))
 
             if tasks:
-                yield from asyncio.wait(tasks, loop=self.component.hass.loop)
+                yield from asyncio.wait(tasks, loop=hass.loop)
+
+            duration = hass.loop.time() - start
+            self.scan_count += 1
+            self.last_scan_duration = duration
+            self.max_scan_duration = max(self.max_scan_duration or 0,
+                                         duration)
+
+    @asyncio.coroutine
+    def _async_update_sync_entity(self, update_coro):
+        """Update a sync entity when the platform has an update slot.
+
+        This method must be run in the event loop.
+        """
+        with (yield from self._update_semaphore):
+            try:
+                yield from update_coro
+            except Exception:  # pylint: disable=broad-except
+                self.component.logger.exception(
+                    "Error while update entity from %s in %s",
+                    self.platform, self.component.domain)
+
+    @asyncio.coroutine
+    def async_call_service(self, entities, method, args, kwargs):
+        """Call a method on entities of this platform.
+
+        Return a list of (entities, exception) tuples for the calls that
+        failed.
+
+        This method must be run in the event loop.
+        """
+        hass = self.component.hass
+        batch = None
+
+        if isinstance(method, str) and method.startswith('async_'):
+            batch = getattr(self.platform_module,
+                            'async_batch_' + method[len('async_'):], None)
+
+        if batch is not None:
+            try:
+                yield from batch(hass, entities, *args, **kwargs)
+            except Exception as err:  # pylint: disable=broad-except
+                return [(entities, err)]
+            return []
+
+        @asyncio.coroutine
+        def async_call(entity):
+            """Call the method on a single entity."""
+            if isinstance(method, str):
+                target, target_args = getattr(entity, method), args
+            else:
+                target, target_args = method, (entity,) + args
+
+            if hasattr(entity, 'async_update'):
+                yield from target(*target_args, **kwargs)
+                return
+
+            with (yield from self._update_semaphore):
+                yield from target(*target_args, **kwargs)
+
+        results = yield from asyncio.gather(
+            *[async_call(entity) for entity in entities],
+            loop=hass.loop, return_exceptions=True)
+
+        return [([entity], result) for entity, result
+                in zip(entities, results) if isinstance(result, Exception)]
+
+    @callback
+    def _async_poll_due(self, entity):
+        """Count down the scans of entity, return True if it is due."""
+        poll = self._poll_scans.get(entity.entity_id)
+
+        if poll is None:
+            return True
+
+        poll[1] -= 1
+        return poll[1] <= 0
+
+    @asyncio.coroutine
+    def _async_update_adaptive(self, entity):
+        """Update entity and adapt its poll interval to the result.
+
+        This method must be run in the event loop.
+        """
+        states = self.component.hass.states
+        old_state = states.get(entity.entity_id)
+        changed = False
+
+        try:
+            yield from entity.async_update_ha_state(True)
+            new_state = states.get(entity.entity_id)
+            # force_update writes a new state object even without a change
+            changed = entity.available and new_state is not None and (
+                old_state is None or new_state.state != old_state.state or
+                new_state.attributes != old_state.attributes)
+        finally:
+            interval = self._poll_scans.get(entity.entity_id, [1])[0]
+            max_interval = max(
+                1, int(self.max_scan_interval / self.scan_interval))
+
+            if changed:
+                interval = 1
+            else:
+                interval = min(interval * 2, max_interval)
+
+            self._poll_scans[entity.entity_id] = [interval, interval]
@@ -1,13 +1,21 @@
 """Helpers for listening to events."""
+import asyncio
+from datetime import timedelta
 import functools as ft
+import logging
 
 from homeassistant.helpers.sun import get_astral_event_next
-from ..core import HomeAssistant, callback
+from ..core import HomeAssistant, callback, is_callback
 from ..const import (
     ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL)
 from ..util import dt as dt_util
 from ..util.async import run_callback_threadsafe
 
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum time between renders of templates that depend on many states
+DEFAULT_TEMPLATE_RATE_LIMIT = timedelta(seconds=1)
+
 # PyLint does not like the use of threaded_listener_factory
 # pylint: disable=invalid-name
 
@@ -34,6 +42,25 @@ def threaded_listener_factory(async_factory):
     return factory
 
 
+def state_change_matcher(from_state=None, to_state=None):
+    """Return a function that tests if a state change matches.
+
+    from_state and to_state can be a string, a list or MATCH_ALL. The
+    returned function is called with the old and new state values.
+
+    Async friendly.
+    """
+    from_state = _process_state_match(from_state)
+    to_state = _process_state_match(to_state)
+
+    def matches(old_state, new_state):
+        """Return True if the state change matches."""
+        return (_matcher(old_state, from_state) and
+                _matcher(new_state, to_state))
+
+    return matches
+
+
 @callback
 def async_track_state_change(hass, entity_ids, action, from_state=None,
                              to_state=None):
@@ -46,8 +73,7 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
 
     Must be run within the event loop.
     """
-    from_state = _process_state_match(from_state)
-    to_state = _process_state_match(to_state)
+    matches = state_change_matcher(from_state, to_state)
 
     # Ensure it is a lowercase list with entity ids we want to match on
     if entity_ids == MATCH_ALL:
@@ -74,7 +100,7 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
         else:
             new_state = None
 
-        if _matcher(old_state, from_state) and _matcher(new_state, to_state):
+        if matches(old_state, new_state):
             hass.async_run_job(action, event.data.get('entity_id'),
                                event.data.get('old_state'),
                                event.data.get('new_state'))
@@ -85,29 +111,158 @@ def async_track_state_change(hass, entity_ids, action, from_state=None,
 track_state_change = threaded_listener_factory(async_track_state_change)
 
 
-@callback
-def async_track_template(hass, template, action, variables=None):
-    """Add a listener that track state changes with template condition."""
-    from . import condition
+class RateLimitedJob(object):
+    """Run a job at most once per interval.
 
+    Requests to run the job while a run is already pending are collapsed
+    into that run.
+    """
+
+    def __init__(self, hass, job, min_interval=timedelta(0)):
+        """Initialize the rate limited job.
+
+        The job is a callback or a coroutine function without arguments.
+        """
+        self.hass = hass
+        self.min_interval = min_interval
+        self._job = job
+        self._last_run = None
+        self._pending = False
+        self._timer = None
+
+    @callback
+    def async_schedule(self, min_interval=None):
+        """Request a run of the job.
+
+        Runs right away if the job did not run within the minimum interval,
+        otherwise as soon as the interval has passed.
+        """
+        if self._pending:
+            return
+
+        self._pending = True
+
+        if min_interval is None:
+            min_interval = self.min_interval
+
+        delay = 0
+        if self._last_run is not None:
+            delay = (self._last_run + min_interval.total_seconds() -
+                     self.hass.loop.time())
+
+        if delay > 0:
+            self._timer = self.hass.loop.call_later(delay, self._async_start)
+        else:
+            self._async_start()
+
+    @callback
+    def async_cancel(self):
+        """Cancel a pending run."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = False
+
+    @callback
+    def _async_start(self):
+        """Start the job."""
+        self._timer = None
+
+        if is_callback(self._job):
+            self._async_mark_run()
+            self._job()
+        else:
+            self.hass.async_add_job(self._async_run())
+
+    @callback
+    def _async_mark_run(self):
+        """Mark the job as running, new requests schedule another run."""
+        self._pending = False
+        self._last_run = self.hass.loop.time()
+
+    @asyncio.coroutine
+    def _async_run(self):
+        """Run a coroutine job."""
+        self._async_mark_run()
+        yield from self._job()
+
+
+@callback
+def async_track_template(hass, template, action, variables=None,
+                         rate_limit=None):
+    """Add a listener that track state changes with template condition.
+
+    Only state changes of the entities and domains that were read during
+    the last render of the template are tracked. Templates that read many
+    states are rendered at most once per rate_limit, which defaults to
+    DEFAULT_TEMPLATE_RATE_LIMIT for them. State changes in between are
+    collapsed into a single render.
+    """
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
+    render_info = None
+    last_event = None
 
     @callback
-    def template_condition_listener(entity_id, from_s, to_s):
+    def async_render():
+        """Render the template and return if the condition is true."""
+        nonlocal render_info
+        render_info = template.async_render_to_info(variables)
+
+        if render_info.exception is not None:
+            _LOGGER.error("Error during template condition: %s",
+                          render_info.exception)
+            return False
+
+        return render_info.result.lower() == 'true'
+
+    @callback
+    def async_evaluate():
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+        template_result = async_render()
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(action, last_event.data.get('entity_id'),
+                               last_event.data.get('old_state'),
+                               last_event.data.get('new_state'))
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(), template_condition_listener)
+    job = RateLimitedJob(hass, async_evaluate)
+
+    @callback
+    def template_condition_listener(event):
+        """Schedule a render if the state change can change the result."""
+        nonlocal last_event
+
+        if not render_info.filter(event.data.get('entity_id')):
+            return
+
+        last_event = event
+
+        if rate_limit is not None:
+            job.async_schedule(rate_limit)
+        elif render_info.is_broad:
+            job.async_schedule(DEFAULT_TEMPLATE_RATE_LIMIT)
+        else:
+            job.async_schedule()
+
+    template.hass = hass
+    async_render()
+
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, template_condition_listener)
+
+    @callback
+    def async_remove():
+        """Remove the listener and cancel pending renders."""
+        unsub()
+        job.async_cancel()
+
+    return async_remove
 
 
 track_template = threaded_listener_factory(async_track_template)
@@ -1,7 +1,9 @@
 """Helpers to execute scripts."""
 import asyncio
+from collections import deque
 import logging
 from itertools import islice
+import time
 from typing import Optional, Sequence
 
 import voluptuous as vol
@@ -27,6 +29,17 @@ CONF_EVENT = 'event'
 CONF_EVENT_DATA = 'event_data'
 CONF_DELAY = 'delay'
 CONF_WAIT_TEMPLATE = 'wait_template'
+CONF_PARALLEL = 'parallel'
+CONF_BLOCKING = 'blocking'
+
+DATA_TRACES = 'script_traces'
+DEFAULT_TRACE_LENGTH = 5
+
+RESULT_CONDITION_FAILED = 'condition_failed'
+RESULT_CONTINUED = 'continued'
+RESULT_ERROR = 'error'
+RESULT_FINISHED = 'finished'
+RESULT_STOPPED = 'stopped'
 
 
 def call_from_config(hass: HomeAssistant, config: ConfigType,
@@ -35,11 +48,112 @@ def call_from_config(hass: HomeAssistant, config: ConfigType,
     Script(hass, cv.SCRIPT_SCHEMA(config)).run(variables)
 
 
+@callback
+def async_get_traces(hass):
+    """Return the trace buffers of automations and scripts by entity id.
+
+    This method must be run in the event loop.
+    """
+    traces = hass.data.get(DATA_TRACES)
+
+    if traces is None:
+        traces = hass.data[DATA_TRACES] = {}
+
+    return traces
+
+
+class RunTrace(object):
+    """Timing information of a single run of an automation or script."""
+
+    def __init__(self):
+        """Initialize the trace, the run is triggered now."""
+        self.triggered = date_util.utcnow()
+        self.condition_time = None
+        self.action_latency = None
+        self.duration = None
+        self.result = None
+        self.steps = []
+        self._start = time.monotonic()
+
+    @callback
+    def async_set_condition_time(self, start):
+        """Record the conditions that were evaluated since start."""
+        self.condition_time = time.monotonic() - start
+
+    @callback
+    def async_action_started(self):
+        """Record the latency between the trigger and the action."""
+        if self.action_latency is None:
+            self.action_latency = time.monotonic() - self._start
+
+    @callback
+    def async_add_step(self, index, step_type, alias, start):
+        """Record a step of the action that was started at start."""
+        self.steps.append({
+            'index': index,
+            'type': step_type,
+            'alias': alias,
+            'duration': time.monotonic() - start,
+        })
+
+    @callback
+    def async_finish(self, result):
+        """Mark the run as finished."""
+        if self.result is None:
+            self.duration = time.monotonic() - self._start
+            self.result = result
+
+    def as_dict(self):
+        """Return a dictionary representation of the trace."""
+        return {
+            'triggered': self.triggered,
+            'condition_time': self.condition_time,
+            'action_latency': self.action_latency,
+            'duration': self.duration,
+            'result': self.result,
+            'steps': list(self.steps),
+        }
+
+
+class TraceBuffer(object):
+    """Keep the traces of the last runs of an automation or script."""
+
+    def __init__(self, maxlen=DEFAULT_TRACE_LENGTH):
+        """Initialize the trace buffer."""
+        self.traces = deque(maxlen=maxlen)
+        self.run_count = 0
+
+    @property
+    def last_duration(self):
+        """Return the duration of the last finished run."""
+        for trace in reversed(self.traces):
+            if trace.duration is not None:
+                return round(trace.duration, 3)
+
+        return None
+
+    @callback
+    def async_start(self):
+        """Start and return the trace of a new run."""
+        trace = RunTrace()
+        self.traces.append(trace)
+        self.run_count += 1
+        return trace
+
+    def as_dict(self):
+        """Return a dictionary representation of the buffer."""
+        return {
+            'run_count': self.run_count,
+            'traces': [trace.as_dict() for trace in self.traces],
+        }
+
+
 class Script():
     """Representation of a script."""
 
     def __init__(self, hass: HomeAssistant, sequence, name: str=None,
-                 change_listener=None) -> None:
+                 change_listener=None,
+                 trace_length: int=DEFAULT_TRACE_LENGTH) -> None:
         """Initialize the script."""
         self.hass = hass
         self.sequence = sequence
@@ -54,6 +168,9 @@ class Script():
         self._async_listener = []
         self._template_cache = {}
         self._config_cache = {}
+        self.traces = TraceBuffer(trace_length)
+        self._trace = None
+        self._pending_step = None
 
     @property
     def is_running(self) -> bool:
@@ -66,21 +183,37 @@ class Script():
             self.async_run(variables), self.hass.loop).result()
 
     @asyncio.coroutine
-    def async_run(self, variables: Optional[Sequence]=None) -> None:
+    def async_run(self, variables: Optional[Sequence]=None,
+                  trace: Optional[RunTrace]=None) -> None:
         """Run script.
 
+        A trace can be passed in to record the run in the trace of the
+        caller, otherwise the run is recorded in the traces of the script.
+
         This method is a coroutine.
         """
         self.last_triggered = date_util.utcnow()
         if self._cur == -1:
             self._log('Running script')
             self._cur = 0
+            self._trace = trace if trace is not None else \
+                self.traces.async_start()
+            self._trace.async_action_started()
+        elif trace is not None:
+            # The trigger continues the run that is waiting
+            trace.async_action_started()
+            trace.async_finish(RESULT_CONTINUED)
+
+        self._async_finish_pending_step()
 
         # Unregister callback if we were in a delay or wait but turn on is
         # called again. In that case we just continue execution.
         self._async_remove_listener()
 
+        result = RESULT_FINISHED
+
         for cur, action in islice(enumerate(self.sequence), self._cur, None):
+            start = time.monotonic()
 
             if CONF_DELAY in action:
                 # Call ourselves in the future to continue work
@@ -106,6 +239,7 @@ class Script():
                     date_util.utcnow() + delay
                 )
                 self._async_listener.append(unsub)
+                self._pending_step = (cur, CONF_DELAY, action, start)
 
                 self._cur = cur + 1
                 if self._change_listener:
@@ -120,6 +254,8 @@ class Script():
                 # check if condition allready okay
                 if condition.async_template(
                         self.hass, wait_template, variables):
+                    self._async_add_step(
+                        cur, CONF_WAIT_TEMPLATE, action, start)
                     continue
 
                 @callback
@@ -130,6 +266,7 @@ class Script():
 
                 self._async_listener.append(async_track_template(
                     self.hass, wait_template, async_script_wait))
+                self._pending_step = (cur, CONF_WAIT_TEMPLATE, action, start)
 
                 self._cur = cur + 1
                 if self._change_listener:
@@ -141,17 +278,34 @@ class Script():
                 return
 
             elif CONF_CONDITION in action:
-                if not self._async_check_condition(action, variables):
+                check = self._async_check_condition(action, variables)
+                self._async_add_step(cur, CONF_CONDITION, action, start)
+
+                if not check:
+                    result = RESULT_CONDITION_FAILED
                     break
 
             elif CONF_EVENT in action:
                 self._async_fire_event(action)
+                self._async_add_step(cur, CONF_EVENT, action, start)
+
+            elif CONF_PARALLEL in action:
+                yield from self._async_run_parallel(action, variables)
+                self._async_add_step(cur, CONF_PARALLEL, action, start)
 
             else:
-                yield from self._async_call_service(action, variables)
+                try:
+                    yield from self._async_call_service(action, variables)
+                except Exception:
+                    self._async_add_step(cur, CONF_SERVICE, action, start)
+                    self._async_finish_trace(RESULT_ERROR)
+                    raise
+
+                self._async_add_step(cur, CONF_SERVICE, action, start)
 
         self._cur = -1
         self.last_action = None
+        self._async_finish_trace(result)
         if self._change_listener:
             self.hass.async_add_job(self._change_listener)
 
@@ -166,6 +320,8 @@ class Script():
 
         self._cur = -1
         self._async_remove_listener()
+        self._async_finish_pending_step()
+        self._async_finish_trace(RESULT_STOPPED)
         if self._change_listener:
             self.hass.async_add_job(self._change_listener)
 
@@ -178,7 +334,45 @@ class Script():
         self.last_action = action.get(CONF_ALIAS, 'call service')
         self._log("Executing step %s" % self.last_action)
         yield from service.async_call_from_config(
-            self.hass, action, True, variables, validate_config=False)
+            self.hass, action, action.get(CONF_BLOCKING, True), variables,
+            validate_config=False)
+
+    @asyncio.coroutine
+    def _async_run_parallel(self, action, variables):
+        """Run the steps of a parallel block concurrently.
+
+        Errors of the steps are logged and do not stop the script.
+
+        This method is a coroutine.
+        """
+        self.last_action = action.get(CONF_ALIAS, 'parallel')
+        self._log("Executing step %s" % self.last_action)
+        steps = action[CONF_PARALLEL]
+
+        results = yield from asyncio.gather(*[
+            self._async_run_parallel_step(step, variables) for step in steps
+        ], loop=self.hass.loop, return_exceptions=True)
+
+        for step, result in zip(steps, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error executing step %s of %s: %s",
+                              step.get(CONF_ALIAS, 'call service'),
+                              self.last_action, result)
+
+    @asyncio.coroutine
+    def _async_run_parallel_step(self, action, variables):
+        """Run a single step of a parallel block.
+
+        This method is a coroutine.
+        """
+        if CONF_EVENT in action:
+            self.hass.bus.async_fire(action[CONF_EVENT],
+                                     action.get(CONF_EVENT_DATA))
+            return
+
+        yield from service.async_call_from_config(
+            self.hass, action, action.get(CONF_BLOCKING, True), variables,
+            validate_config=False)
 
     def _async_fire_event(self, action):
         """Fire an event."""
@@ -218,6 +412,24 @@ class Script():
         )
         self._async_listener.append(unsub)
 
+    def _async_add_step(self, index, step_type, action, start):
+        """Record a step of the current run in its trace."""
+        if self._trace is not None:
+            self._trace.async_add_step(
+                index, step_type, action.get(CONF_ALIAS), start)
+
+    def _async_finish_pending_step(self):
+        """Record the delay or wait the script was waiting for."""
+        if self._pending_step is not None:
+            self._async_add_step(*self._pending_step)
+            self._pending_step = None
+
+    def _async_finish_trace(self, result):
+        """Finish the trace of the current run."""
+        if self._trace is not None:
+            self._trace.async_finish(result)
+            self._trace = None
+
     def _async_remove_listener(self):
         """Remove point in time listener, if any."""
         for unsub in self._async_listener:
@@ -5,6 +5,10 @@ from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 
 DATA_LOCATION_CACHE = 'astral_location_cache'
+DATA_EVENT_DATE_CACHE = 'astral_event_date_cache'
+
+# Number of calculated event dates to keep
+EVENT_DATE_CACHE_SIZE = 64
 
 
 @callback
@@ -57,7 +61,10 @@ def get_astral_event_next(hass, event, utc_point_in_time=None, offset=None):
 
 @callback
 def get_astral_event_date(hass, event, date=None):
-    """Calculate the astral event time for the specified date."""
+    """Calculate the astral event time for the specified date.
+
+    The result only depends on the location and the date so it is cached.
+    """
     import astral
 
     location = get_astral_location(hass)
@@ -68,11 +75,28 @@ def get_astral_event_date(hass, event, date=None):
     if isinstance(date, datetime.datetime):
         date = dt_util.as_local(date).date()
 
+    cache = hass.data.get(DATA_EVENT_DATE_CACHE)
+
+    if cache is None:
+        cache = hass.data[DATA_EVENT_DATE_CACHE] = {}
+
+    key = (location, event, date)
+
+    if key in cache:
+        return cache[key]
+
     try:
-        return getattr(location, event)(date, local=False)
+        result = getattr(location, event)(date, local=False)
     except astral.AstralError:
         # Event never occurs for specified date.
-        return None
+        result = None
+
+    if len(cache) >= EVENT_DATE_CACHE_SIZE:
+        cache.clear()
+
+    cache[key] = result
+
+    return result
 
 
 @callback
@@ -1,5 +1,7 @@
 """Template helper methods for rendering strings with Home Assistant data."""
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 import random
@@ -22,6 +24,13 @@ _LOGGER = logging.getLogger(__name__)
 _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+DATA_TEMPLATE_GLOBALS = 'template_globals'
+DATA_TEMPLATE_CACHE = 'template_cache'
+DATA_RENDER_INFO = 'template_render_info'
+
+# Number of compiled templates kept around
+COMPILE_CACHE_SIZE = 512
+
 _RE_NONE_ENTITIES = re.compile(r"distance\(|closest\(", re.I | re.M)
 _RE_GET_ENTITIES = re.compile(
     r"(?:(?:states\.|(?:is_state|is_state_attr|states)\(.)([\w]+\.[\w]+))",
@@ -41,6 +50,136 @@ def attach(hass, obj):
         obj.hass = hass
 
 
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def _compile_code(template):
+    """Compile a template source to code.
+
+    Code objects are immutable so the result is shared by all templates
+    with the same source.
+    """
+    return ENV.compile(template)
+
+
+def _async_template_globals(hass):
+    """Return the template globals of a hass instance.
+
+    This method must be run in the event loop.
+    """
+    global_vars = hass.data.get(DATA_TEMPLATE_GLOBALS)
+
+    if global_vars is None:
+        location_methods = LocationMethods(hass)
+
+        def is_state(entity_id, state):
+            """Test if entity exists and is specified state."""
+            _collect_entity(hass, entity_id)
+            return hass.states.is_state(entity_id, state)
+
+        def is_state_attr(entity_id, name, value):
+            """Test if entity exists and has a state attribute set to value."""
+            _collect_entity(hass, entity_id)
+            return hass.states.is_state_attr(entity_id, name, value)
+
+        global_vars = hass.data[DATA_TEMPLATE_GLOBALS] = ENV.make_globals({
+            'closest': location_methods.closest,
+            'distance': location_methods.distance,
+            'is_state': is_state,
+            'is_state_attr': is_state_attr,
+            'states': AllStates(hass),
+        })
+
+    return global_vars
+
+
+def _async_get_compiled(hass, template, code):
+    """Return the bound jinja2 template for a template source.
+
+    Templates are shared per hass instance in a bounded LRU cache.
+
+    This method must be run in the event loop.
+    """
+    cache = hass.data.get(DATA_TEMPLATE_CACHE)
+
+    if cache is None:
+        cache = hass.data[DATA_TEMPLATE_CACHE] = OrderedDict()
+
+    compiled = cache.pop(template, None)
+
+    if compiled is None:
+        compiled = jinja2.Template.from_code(
+            ENV, code, _async_template_globals(hass), None)
+
+    cache[template] = compiled
+
+    if len(cache) > COMPILE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    return compiled
+
+
+def _collect_entity(hass, entity_id):
+    """Record that the template being rendered read an entity."""
+    render_info = hass.data.get(DATA_RENDER_INFO)
+
+    if render_info is not None and isinstance(entity_id, str):
+        render_info.entities.add(entity_id.lower())
+
+
+def _collect_domain(hass, domain):
+    """Record that the template being rendered read a whole domain."""
+    render_info = hass.data.get(DATA_RENDER_INFO)
+
+    if render_info is not None:
+        render_info.domains.add(domain)
+
+
+def _collect_all_states(hass):
+    """Record that the template being rendered read all states."""
+    render_info = hass.data.get(DATA_RENDER_INFO)
+
+    if render_info is not None:
+        render_info.all_states = True
+
+
+class RenderInfo(object):
+    """Result of a template render and the states that were read by it."""
+
+    def __init__(self, template):
+        """Initialize the render info."""
+        self.template = template
+        self.result = None
+        self.exception = None
+        self.all_states = False
+        self.domains = set()
+        self.entities = set()
+
+    def filter(self, entity_id):
+        """Return if a state change of entity_id can change the result.
+
+        Templates that did not read any state (for example because they only
+        depend on the time) are rendered again on every state change.
+        """
+        if self.all_states or entity_id in self.entities:
+            return True
+
+        if not self.entities and not self.domains:
+            return True
+
+        return entity_id.split('.', 1)[0] in self.domains
+
+    @property
+    def is_broad(self):
+        """Return if the render depends on a large set of states."""
+        return (self.all_states or bool(self.domains) or
+                not self.entities)
+
+    def __repr__(self):
+        """Return the representation."""
+        return "<RenderInfo {}: all_states={} domains={} entities={}>".format(
+            self.template, self.all_states, sorted(self.domains),
+            sorted(self.entities))
+
+
 def extract_entities(template):
     """Extract all entities for state_changed listener from template string."""
     if template is None or _RE_NONE_ENTITIES.search(template):
@@ -71,7 +210,7 @@ class Template(object):
             return
 
         try:
-            self._compiled_code = ENV.compile(self.template)
+            self._compiled_code = _compile_code(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
@@ -102,6 +241,30 @@ class Template(object):
         except jinja2.TemplateError as err:
             raise TemplateError(err)
 
+    def async_render_to_info(self, variables=None, **kwargs):
+        """Render given template and record which states it read.
+
+        Returns a RenderInfo instance, errors are stored on it instead of
+        being raised.
+
+        This method must be run in the event loop.
+        """
+        render_info = RenderInfo(self)
+
+        assert self.hass is not None, 'hass variable not set on template'
+
+        previous = self.hass.data.get(DATA_RENDER_INFO)
+        self.hass.data[DATA_RENDER_INFO] = render_info
+
+        try:
+            render_info.result = self.async_render(variables, **kwargs)
+        except TemplateError as ex:
+            render_info.exception = ex
+        finally:
+            self.hass.data[DATA_RENDER_INFO] = previous
+
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -146,21 +309,15 @@ class Template(object):
 
         assert self.hass is not None, 'hass variable not set on template'
 
-        location_methods = LocationMethods(self.hass)
-
-        global_vars = ENV.make_globals({
-            'closest': location_methods.closest,
-            'distance': location_methods.distance,
-            'is_state': self.hass.states.is_state,
-            'is_state_attr': self.hass.states.is_state_attr,
-            'states': AllStates(self.hass),
-        })
-
-        self._compiled = jinja2.Template.from_code(
-            ENV, self._compiled_code, global_vars, None)
+        self._compiled = _async_get_compiled(
+            self.hass, self.template, self._compiled_code)
 
         return self._compiled
 
+    def __repr__(self):
+        """Return the representation."""
+        return "Template({!r})".format(self.template)
+
     def __eq__(self, other):
         """Compare template with another."""
         return (self.__class__ == other.__class__ and
@@ -181,11 +338,12 @@ class AllStates(object):
 
     def __iter__(self):
         """Return all states."""
-        return iter(sorted(self._hass.states.async_all(),
-                           key=lambda state: state.entity_id))
+        _collect_all_states(self._hass)
+        return iter(self._hass.states.async_sorted())
 
     def __call__(self, entity_id):
         """Return the states."""
+        _collect_entity(self._hass, entity_id)
         state = self._hass.states.get(entity_id)
         return STATE_UNKNOWN if state is None else state.state
 
@@ -200,14 +358,14 @@ class DomainStates(object):
 
     def __getattr__(self, name):
         """Return the states."""
-        return self._hass.states.get('{}.{}'.format(self._domain, name))
+        entity_id = '{}.{}'.format(self._domain, name)
+        _collect_entity(self._hass, entity_id)
+        return self._hass.states.get(entity_id)
 
     def __iter__(self):
         """Return the iteration over all the states."""
-        return iter(sorted(
-            (state for state in self._hass.states.async_all()
-             if state.domain == self._domain),
-            key=lambda state: state.entity_id))
+        _collect_domain(self._hass, self._domain)
+        return iter(self._hass.states.async_sorted(self._domain))
 
 
 class LocationMethods(object):
@@ -275,7 +433,12 @@ class LocationMethods(object):
 
             group = get_component('group')
 
-            states = [self._hass.states.get(entity_id) for entity_id
+            _collect_entity(self._hass, gr_entity_id)
+            if gr_entity_id.startswith('group.'):
+                # Changes to nested groups change the members
+                _collect_domain(self._hass, 'group')
+
+            states = [self._resolve_state(entity_id) for entity_id
                       in group.expand_entity_ids(self._hass, [gr_entity_id])]
 
         return loc_helper.closest(latitude, longitude, states)
@@ -333,6 +496,7 @@ class LocationMethods(object):
         if isinstance(entity_id_or_state, State):
             return entity_id_or_state
         elif isinstance(entity_id_or_state, str):
+            _collect_entity(self._hass, entity_id_or_state)
             return self._hass.states.get(entity_id_or_state)
         return None
 
@@ -0,0 +1,102 @@
+"""Record a timeline of the phases of setting up Home Assistant."""
+from collections import deque
+from contextlib import contextmanager
+import json
+import logging
+from timeit import default_timer as timer
+
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TIMELINE = 'startup_timeline'
+TIMELINE_FILENAME = 'startup_timeline.json'
+
+# Reloads and discovery keep adding spans after startup, the oldest spans
+# are dropped
+MAX_SPANS = 1000
+
+PHASE_IMPORT = 'import'
+PHASE_REQUIREMENTS = 'requirements'
+PHASE_CONFIG = 'config'
+# Waiting for the components that are set up first at startup
+PHASE_FIRST = 'first'
+PHASE_DEPENDENCIES = 'dependencies'
+PHASE_SETUP = 'setup'
+PHASE_ADD_ENTITIES = 'add_entities'
+
+
+class Timeline(object):
+    """Spans of the phases of setting up components and platforms."""
+
+    def __init__(self):
+        """Initialize the timeline."""
+        self.start = timer()
+        self.finished = None
+        self.spans = deque(maxlen=MAX_SPANS)
+
+    @contextmanager
+    def span(self, name, phase):
+        """Record how long the body of the with statement takes."""
+        start = timer()
+        try:
+            yield
+        finally:
+            self.add(name, phase, start)
+
+    def add(self, name, phase, start, end=None):
+        """Add a span that started at start, a default_timer value."""
+        if end is None:
+            end = timer()
+        self.spans.append({
+            'name': name,
+            'phase': phase,
+            'start': round(start - self.start, 3),
+            'duration': round(end - start, 3),
+        })
+
+    def finish(self):
+        """Mark the end of the startup."""
+        self.finished = timer()
+
+    def as_dict(self):
+        """Return the timeline as a dictionary."""
+        if self.finished is None:
+            duration = None
+        else:
+            duration = round(self.finished - self.start, 3)
+
+        return {
+            'duration': duration,
+            'spans': sorted(self.spans, key=lambda span: span['start']),
+        }
+
+
+@callback
+def async_get_timeline(hass):
+    """Return the startup timeline of hass, creating it on first use.
+
+    This method must be run in the event loop.
+    """
+    timeline = hass.data.get(DATA_TIMELINE)
+
+    if timeline is None:
+        timeline = hass.data[DATA_TIMELINE] = Timeline()
+
+    return timeline
+
+
+def save_timeline(path, data):
+    """Write a startup timeline as returned by Timeline.as_dict."""
+    try:
+        with open(path, 'w') as fil:
+            json.dump(data, fil, indent=1)
+    except OSError as err:
+        _LOGGER.error("Unable to write startup timeline to %s: %s",
+                      path, err)
+
+
+def load_timeline(path):
+    """Load a startup timeline written by save_timeline."""
+    with open(path) as fil:
+        return json.load(fil)
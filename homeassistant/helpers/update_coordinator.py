@@ -0,0 +1,156 @@
+"""Helpers to coordinate fetching data shared by several entities."""
+import asyncio
+
+from homeassistant.core import callback
+from homeassistant.exceptions import UpdateFailed
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util.async import run_coroutine_threadsafe
+import homeassistant.util.dt as dt_util
+
+DEFAULT_MAX_BACKOFF_FACTOR = 8
+
+
+class DataUpdateCoordinator(object):
+    """Fetch the data of a platform once per interval for all its entities.
+
+    Entities add a listener and are notified together after every fetch.
+    Refreshes that are requested while a fetch is in progress wait for that
+    fetch instead of starting another one. Failed fetches are retried with
+    an exponential backoff, up to max_backoff.
+
+    The update method is either a coroutine function or a function that is
+    run in the executor. It returns the new data or raises UpdateFailed.
+    """
+
+    def __init__(self, hass, logger, name, update_method, update_interval,
+                 max_backoff=None):
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_method = update_method
+        self.update_interval = update_interval
+        self.max_backoff = max_backoff or \
+            update_interval * DEFAULT_MAX_BACKOFF_FACTOR
+
+        self.data = None
+        self.last_update_success = True
+        self.last_exception = None
+        self.failures = 0
+
+        self._listeners = []
+        self._unsub_refresh = None
+        self._refresh_task = None
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """Listen for data updates, return a function to stop listening.
+
+        Fetching is scheduled while there are listeners. The listener is
+        called without arguments and must be a callback.
+        """
+        schedule = not self._listeners
+        self._listeners.append(update_callback)
+
+        if schedule:
+            self._async_schedule_refresh()
+
+        @callback
+        def async_remove_listener():
+            """Stop listening for data updates."""
+            self.async_remove_listener(update_callback)
+
+        return async_remove_listener
+
+    @callback
+    def async_remove_listener(self, update_callback):
+        """Stop calling update_callback for data updates."""
+        if update_callback in self._listeners:
+            self._listeners.remove(update_callback)
+
+        if not self._listeners and self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    def refresh(self):
+        """Fetch the data now and notify the listeners."""
+        run_coroutine_threadsafe(
+            self.async_refresh(), self.hass.loop).result()
+
+    @asyncio.coroutine
+    def async_refresh(self):
+        """Fetch the data now and notify the listeners.
+
+        Waits for the fetch in progress if there is one.
+
+        This method is a coroutine.
+        """
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_add_job(self._async_fetch())
+
+        yield from asyncio.shield(self._refresh_task, loop=self.hass.loop)
+
+    @callback
+    def _async_schedule_refresh(self):
+        """Schedule the next fetch, backing off after failures."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+
+        interval = self.update_interval
+        if self.failures:
+            interval = min(interval * 2 ** self.failures, self.max_backoff)
+
+        self._unsub_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_handle_refresh_interval,
+            dt_util.utcnow() + interval)
+
+    @asyncio.coroutine
+    def _async_handle_refresh_interval(self, now):
+        """Fetch the data when the interval has passed."""
+        self._unsub_refresh = None
+        yield from self.async_refresh()
+
+    @asyncio.coroutine
+    def _async_fetch(self):
+        """Fetch the data, schedule the next fetch and notify listeners.
+
+        This method is a coroutine.
+        """
+        try:
+            data = yield from self.hass.async_add_job(self.update_method)
+
+        except UpdateFailed as err:
+            self._async_set_failed(err)
+            if self.failures == 1:
+                self.logger.error(
+                    "Error fetching %s data: %s", self.name, err)
+
+        except Exception as err:  # pylint: disable=broad-except
+            self._async_set_failed(err)
+            self.logger.exception(
+                "Unexpected error fetching %s data", self.name)
+
+        else:
+            if not self.last_update_success:
+                self.logger.info("Fetching %s data recovered", self.name)
+
+            self.data = data
+            self.last_update_success = True
+            self.last_exception = None
+            self.failures = 0
+
+        finally:
+            self._refresh_task = None
+
+        if self._listeners:
+            self._async_schedule_refresh()
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _async_set_failed(self, err):
+        """Record a failed fetch."""
+        self.last_update_success = False
+        self.last_exception = err
+        self.failures += 1
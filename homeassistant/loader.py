@@ -10,16 +10,18 @@ call get_component('switch.your_platform'). In both cases the config directory
 is checked to see if it contains a user provided version. If not available it
 will check the built-in components and platforms.
 """
+from collections import OrderedDict
 import functools as ft
 import importlib
 import logging
 import os
 import pkgutil
 import sys
+from timeit import default_timer as timer
 
 from types import ModuleType
 # pylint: disable=unused-import
-from typing import Optional, Sequence, Set, Dict  # NOQA
+from typing import Optional, Sequence, Set, Dict, Iterable, List, Tuple  # NOQA
 
 from homeassistant.const import PLATFORM_FORMAT
 from homeassistant.util import OrderedSet
@@ -39,6 +41,9 @@ AVAILABLE_COMPONENTS = []  # type: List[str]
 # Dict of loaded components mapped name => module
 _COMPONENT_CACHE = {}  # type: Dict[str, ModuleType]
 
+# Start and end of the first import of components, see pop_import_times
+_IMPORT_TIMES = {}  # type: Dict[str, Tuple[float, float]]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -117,6 +122,8 @@ def get_component(comp_name) -> Optional[ModuleType]:
 
     _check_prepared()
 
+    start = timer()
+
     # If we ie. try to load custom_components.switch.wemo but the parent
     # custom_components.switch does not exist, importing it will trigger
     # an exception because it will try to import the parent.
@@ -155,6 +162,7 @@ def get_component(comp_name) -> Optional[ModuleType]:
             _LOGGER.info("Loaded %s from %s", comp_name, path)
 
             _COMPONENT_CACHE[comp_name] = module
+            _IMPORT_TIMES[comp_name] = (start, timer())
 
             return module
 
@@ -171,6 +179,19 @@ def get_component(comp_name) -> Optional[ModuleType]:
     return None
 
 
+def pop_import_times() -> Dict[str, Tuple[float, float]]:
+    """Return when components imported since the last call were loaded.
+
+    Maps component names to the default_timer values at the start and
+    end of the import.
+
+    Async friendly.
+    """
+    times = dict(_IMPORT_TIMES)
+    _IMPORT_TIMES.clear()
+    return times
+
+
 class Components:
     """Helper to load components."""
 
@@ -225,6 +246,38 @@ def load_order_component(comp_name: str) -> OrderedSet:
     return _load_order_component(comp_name, OrderedSet(), set())
 
 
+def dependency_graph(comp_names: Iterable[str]) -> Dict[str, List[str]]:
+    """Return the components with their dependencies in order of loading.
+
+    The graph contains the given components and all their dependencies,
+    each mapped to the components it directly depends on. Components that
+    cannot be resolved are included without dependencies, setting them up
+    will report the error. Blacklisted dependencies are left out.
+
+    Async friendly.
+    """
+    graph = OrderedDict()  # type: Dict[str, List[str]]
+
+    for comp_name in comp_names:
+        load_order = load_order_component(comp_name)
+
+        if not load_order:
+            graph.setdefault(comp_name, [])
+            continue
+
+        for name in load_order:
+            if name in graph or (name != comp_name and
+                                 name in DEPENDENCY_BLACKLIST):
+                continue
+
+            component = get_component(name)
+            graph[name] = [dep for dep
+                           in getattr(component, 'DEPENDENCIES', [])
+                           if dep in graph]
+
+    return graph
+
+
 def _load_order_component(comp_name: str, load_order: OrderedSet,
                           loading: Set) -> OrderedSet:
     """Recursive function to get load order of components.
@@ -7,6 +7,7 @@ HomeAssistantError will be raised.
 For more details about the Python API, please refer to the documentation at
 https://home-assistant.io/developers/python_api/
 """
+import asyncio
 from datetime import datetime
 import enum
 import json
@@ -21,7 +22,8 @@ from homeassistant import core as ha
 from homeassistant.const import (
     HTTP_HEADER_HA_AUTH, SERVER_PORT, URL_API,
     URL_API_EVENTS, URL_API_EVENTS_EVENT, URL_API_SERVICES, URL_API_CONFIG,
-    URL_API_SERVICES_SERVICE, URL_API_STATES, URL_API_STATES_ENTITY,
+    URL_API_SERVICES_SERVICE, URL_API_SERVICES_BATCH, URL_API_STATES,
+    URL_API_STATES_ENTITY,
     HTTP_HEADER_CONTENT_TYPE, CONTENT_TYPE_JSON)
 from homeassistant.exceptions import HomeAssistantError
 
@@ -31,6 +33,8 @@ METHOD_GET = 'get'
 METHOD_POST = 'post'
 METHOD_DELETE = 'delete'
 
+DEFAULT_POOL_SIZE = 10
+
 
 class APIStatus(enum.Enum):
     """Representation of an API status."""
@@ -50,11 +54,14 @@ class API(object):
     """Object to pass around Home Assistant API location and credentials."""
 
     def __init__(self, host: str, api_password: Optional[str]=None,
-                 port: Optional[int]=SERVER_PORT, use_ssl: bool=False) -> None:
+                 port: Optional[int]=SERVER_PORT, use_ssl: bool=False,
+                 pool_size: int=DEFAULT_POOL_SIZE) -> None:
         """Init the API."""
         self.host = host
         self.port = port
         self.api_password = api_password
+        self.pool_size = pool_size
+        self._session = None
 
         if host.startswith(("http://", "https://")):
             self.base_url = host
@@ -81,6 +88,30 @@ class API(object):
 
         return self.status == APIStatus.OK
 
+    @property
+    def session(self) -> requests.Session:
+        """Return the session used to talk to the API.
+
+        The session keeps connections alive so that consecutive calls do
+        not need to set up a new connection.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(self._headers)
+            self._session = session
+
+        return self._session
+
+    def close(self) -> None:
+        """Close the connections of the session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def __call__(self, method, path, data=None, timeout=5):
         """Make a call to the Home Assistant API."""
         if data is not None:
@@ -90,12 +121,10 @@ class API(object):
 
         try:
             if method == METHOD_GET:
-                return requests.get(
-                    url, params=data, timeout=timeout, headers=self._headers)
+                return self.session.get(url, params=data, timeout=timeout)
 
-            return requests.request(
-                method, url, data=data, timeout=timeout,
-                headers=self._headers)
+            return self.session.request(
+                method, url, data=data, timeout=timeout)
 
         except requests.exceptions.ConnectionError:
             _LOGGER.exception("Error connecting to server")
@@ -106,6 +135,48 @@ class API(object):
             _LOGGER.exception(error)
             raise HomeAssistantError(error)
 
+    @asyncio.coroutine
+    def async_call(self, hass, method, path, data=None, timeout=5):
+        """Make a call to the Home Assistant API from within the event loop.
+
+        Uses the shared aiohttp client session of hass. The body of the
+        returned response has already been read.
+
+        This method is a coroutine.
+        """
+        import aiohttp
+        import async_timeout
+        from homeassistant.helpers.aiohttp_client import (
+            async_get_clientsession)
+
+        if data is not None:
+            data = json.dumps(data, cls=JSONEncoder)
+
+        url = urllib.parse.urljoin(self.base_url, path)
+        websession = async_get_clientsession(hass)
+
+        try:
+            with async_timeout.timeout(timeout, loop=hass.loop):
+                if method == METHOD_GET:
+                    req = yield from websession.get(
+                        url, params=data, headers=self._headers)
+                else:
+                    req = yield from websession.request(
+                        method, url, data=data, headers=self._headers)
+
+                yield from req.read()
+
+            return req
+
+        except aiohttp.ClientError:
+            _LOGGER.exception("Error connecting to server")
+            raise HomeAssistantError("Error connecting to server")
+
+        except asyncio.TimeoutError:
+            error = "Timeout when talking to {}".format(self.host)
+            _LOGGER.exception(error)
+            raise HomeAssistantError(error)
+
     def __repr__(self) -> str:
         """Return the representation of the API."""
         return "<API({}, password: {})>".format(
@@ -267,6 +338,37 @@ def set_state(api, entity_id, new_state, attributes=None, force_update=False):
         return False
 
 
+def set_states(api, states):
+    """Tell API to update the state of multiple entities in one request.
+
+    States is a list of dictionaries with the keys entity_id, state and
+    optionally attributes and force_update.
+
+    Return a list with for each state if it was set successfully.
+    """
+    data = [{'entity_id': item['entity_id'],
+             'state': item['state'],
+             'attributes': item.get('attributes') or {},
+             'force_update': item.get('force_update', False)}
+            for item in states]
+
+    try:
+        req = api(METHOD_POST, URL_API_STATES, data)
+
+        if req.status_code != 200:
+            _LOGGER.error("Error changing states: %d - %s",
+                          req.status_code, req.text)
+            return [False] * len(data)
+
+        return [result.get('status') in (200, 201) for result in req.json()]
+
+    except (HomeAssistantError, ValueError):
+        # ValueError if req.json() can't parse the json
+        _LOGGER.exception("Error setting states")
+
+        return [False] * len(data)
+
+
 def is_state(api, entity_id, state):
     """Query API to see if entity_id is specified state."""
     cur_state = get_state(api, entity_id)
@@ -306,6 +408,31 @@ def call_service(api, domain, service, service_data=None, timeout=5):
         _LOGGER.exception("Error calling service")
 
 
+def call_services(api, calls, timeout=5):
+    """Call multiple services at the remote API in one request.
+
+    Calls is a list of dictionaries with the keys domain, service and
+    optionally service_data.
+
+    Return a list with for each call if it was executed successfully.
+    """
+    try:
+        req = api(METHOD_POST, URL_API_SERVICES_BATCH, calls, timeout=timeout)
+
+        if req.status_code != 200:
+            _LOGGER.error("Error calling services: %d - %s",
+                          req.status_code, req.text)
+            return [False] * len(calls)
+
+        return [result['success'] for result in req.json()['results']]
+
+    except (HomeAssistantError, ValueError, KeyError):
+        # ValueError if req.json() can't parse the json
+        _LOGGER.exception("Error calling services")
+
+        return [False] * len(calls)
+
+
 def get_config(api):
     """Return configuration."""
     try:
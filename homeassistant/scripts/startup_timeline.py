@@ -0,0 +1,65 @@
+"""Script to show the timeline of the last startup."""
+import argparse
+import os
+
+import homeassistant.config as config_util
+from homeassistant.helpers.timeline import TIMELINE_FILENAME, load_timeline
+
+BAR_WIDTH = 40
+
+
+def run(args):
+    """Handle startup timeline commandline script."""
+    parser = argparse.ArgumentParser(
+        description=("Show how long setting up each component and platform "
+                     "took during the last startup."))
+    parser.add_argument(
+        '-c', '--config',
+        metavar='path_to_config_dir',
+        default=config_util.get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration")
+    parser.add_argument(
+        '--slowest', type=int, metavar='N', default=None,
+        help="Only show the N slowest spans")
+    parser.add_argument(
+        '--script',
+        choices=['startup_timeline'])
+
+    args = parser.parse_args()
+
+    path = os.path.join(os.getcwd(), args.config, TIMELINE_FILENAME)
+
+    if not os.path.isfile(path):
+        print('No startup timeline found at', path)
+        return 1
+
+    data = load_timeline(path)
+    spans = data['spans']
+
+    if args.slowest is not None:
+        spans = sorted(spans, key=lambda span: span['duration'],
+                       reverse=True)[:args.slowest]
+        spans.sort(key=lambda span: span['start'])
+
+    print('\n'.join(format_timeline(spans, data['duration'])))
+    return 0
+
+
+def format_timeline(spans, duration):
+    """Return the lines of a waterfall of the spans."""
+    total = duration or max(
+        (span['start'] + span['duration'] for span in spans), default=0)
+    scale = BAR_WIDTH / total if total else 0
+    name_width = max([len(span['name']) for span in spans] + [4])
+
+    lines = ['Startup took {:.2f}s'.format(total), '']
+
+    for span in spans:
+        offset = int(span['start'] * scale)
+        width = max(1, int(span['duration'] * scale))
+        bar = (' ' * offset + '#' * width).ljust(BAR_WIDTH)
+        lines.append('{} {:<12} {:>8.3f}s {:>8.3f}s |{}|'.format(
+            span['name'].ljust(name_width), span['phase'], span['start'],
+            span['duration'], bar[:BAR_WIDTH]))
+
+    return lines
@@ -13,6 +13,7 @@ from homeassistant.config import async_notify_setup_error
 import homeassistant.core as core
 import homeassistant.loader as loader
 import homeassistant.util.package as pkg_util
+from homeassistant.helpers import timeline
 from homeassistant.util.async import run_coroutine_threadsafe
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED, PLATFORM_FORMAT, CONSTRAINT_FILE)
@@ -23,8 +24,12 @@ ATTR_COMPONENT = 'component'
 
 DATA_SETUP = 'setup_tasks'
 DATA_PIP_LOCK = 'pip_lock'
+DATA_REQUIREMENTS = 'satisfied_requirements'
+
+REQUIREMENTS_MANIFEST = '.satisfied_requirements.json'
 
 SLOW_SETUP_WARNING = 10
+COMPONENT_SETUP_TIMEOUT = 60
 
 
 def setup_component(hass: core.HomeAssistant, domain: str,
@@ -44,21 +49,132 @@ def async_setup_component(hass: core.HomeAssistant, domain: str,
     if domain in hass.config.components:
         return True
 
-    setup_tasks = hass.data.get(DATA_SETUP)
+    return (yield from _async_setup_task(hass, domain, config))
+
+
+@asyncio.coroutine
+def async_setup_components(hass: core.HomeAssistant, domains, config: Dict,
+                           first=()) -> None:
+    """Set up components as soon as their dependencies are set up.
+
+    The components in first and their dependencies are set up before the
+    other components. A component that takes longer than
+    COMPONENT_SETUP_TIMEOUT to set up is not waited for, it continues to
+    set up in the background together with the components depending on it.
+
+    This method is a coroutine.
+    """
+    graph = loader.dependency_graph(domains)
+    startup_timeline = timeline.async_get_timeline(hass)
+    _async_record_imports(hass)
+
+    early = set()
+    to_process = [domain for domain in first if domain in graph]
+    while to_process:
+        domain = to_process.pop()
+        if domain not in early:
+            early.add(domain)
+            to_process.extend(graph[domain])
+
+    setups = {}
+    waiters = {}
+    early_waiters = []
+
+    @asyncio.coroutine
+    def async_setup(domain, barrier):
+        """Set up domain once its dependencies are done."""
+        if barrier:
+            with startup_timeline.span(domain, timeline.PHASE_FIRST):
+                yield from asyncio.wait(barrier, loop=hass.loop)
+
+        dependencies = [setups[dep] for dep in graph[domain]]
+        if dependencies:
+            with startup_timeline.span(domain, timeline.PHASE_DEPENDENCIES):
+                yield from asyncio.wait(dependencies, loop=hass.loop)
+
+        if domain in hass.config.components:
+            return True
+
+        # Not tracked, a slow component should not block startup
+        return (yield from _async_setup_task(
+            hass, domain, config, tracked=False))
+
+    @asyncio.coroutine
+    def async_wait(domain, barrier):
+        """Wait for domain, at most the timeout after it could start."""
+        if barrier:
+            yield from asyncio.wait(barrier, loop=hass.loop)
+
+        dependencies = [waiters[dep] for dep in graph[domain]]
+        if dependencies:
+            yield from asyncio.wait(dependencies, loop=hass.loop)
+
+        if not all(setups[dep].done() for dep in graph[domain]):
+            # A dependency is still being set up in the background
+            return
+
+        try:
+            yield from asyncio.wait_for(
+                asyncio.shield(setups[domain], loop=hass.loop),
+                COMPONENT_SETUP_TIMEOUT, loop=hass.loop)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Setup of %s is taking longer than %s seconds. Startup will "
+                "proceed without waiting any longer.", domain,
+                COMPONENT_SETUP_TIMEOUT)
+
+    order = [domain for domain in graph if domain in early]
+    order.extend(domain for domain in graph if domain not in early)
+
+    # The scheduler tasks are not tracked either, they wait for the setups
+    for domain in order:
+        barrier = [] if domain in early else early_waiters
+        setups[domain] = hass.loop.create_task(async_setup(domain, barrier))
+        waiters[domain] = hass.loop.create_task(async_wait(domain, barrier))
+
+        if domain in early:
+            early_waiters.append(waiters[domain])
+
+    if waiters:
+        yield from asyncio.wait(waiters.values(), loop=hass.loop)
+
+
+@core.callback
+def _async_record_imports(hass: core.HomeAssistant) -> None:
+    """Add the components imported since the last call to the timeline.
+
+    This method must be run in the event loop.
+    """
+    startup_timeline = timeline.async_get_timeline(hass)
 
-    if setup_tasks is not None and domain in setup_tasks:
-        return (yield from setup_tasks[domain])
+    for name, (start, end) in loader.pop_import_times().items():
+        startup_timeline.add(name, timeline.PHASE_IMPORT, start, end)
 
-    if config is None:
-        config = {}
+
+@core.callback
+def _async_setup_task(hass: core.HomeAssistant, domain: str,
+                      config: Optional[Dict], tracked: bool=True):
+    """Return the task setting up domain, create it if not started yet.
+
+    An untracked setup, and the executor job of a sync component, is not
+    waited for by hass.async_block_till_done.
+
+    This method must be run in the event loop.
+    """
+    setup_tasks = hass.data.get(DATA_SETUP)
 
     if setup_tasks is None:
         setup_tasks = hass.data[DATA_SETUP] = {}
 
-    task = setup_tasks[domain] = hass.async_add_job(
-        _async_setup_component(hass, domain, config))
+    if domain not in setup_tasks:
+        setup_coro = _async_setup_component(
+            hass, domain, config or {}, tracked)
+        if tracked:
+            setup_tasks[domain] = hass.async_add_job(setup_coro)
+        else:
+            setup_tasks[domain] = hass.loop.create_task(setup_coro)
 
-    return (yield from task)
+    return setup_tasks[domain]
 
 
 @asyncio.coroutine
@@ -71,6 +187,12 @@ def _async_process_requirements(hass: core.HomeAssistant, name: str,
     if hass.config.skip_pip:
         return True
 
+    satisfied = yield from _async_get_satisfied_requirements(hass)
+    missing = [req for req in requirements if req not in satisfied]
+
+    if not missing:
+        return True
+
     pip_lock = hass.data.get(DATA_PIP_LOCK)
     if pip_lock is None:
         pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock(loop=hass.loop)
@@ -87,7 +209,10 @@ def _async_process_requirements(hass: core.HomeAssistant, name: str,
                 os.path.dirname(__file__), CONSTRAINT_FILE))
 
     with (yield from pip_lock):
-        for req in requirements:
+        for req in missing:
+            if req in satisfied:
+                continue
+
             ret = yield from hass.async_add_job(pip_install, req)
             if not ret:
                 _LOGGER.error("Not initializing %s because could not install "
@@ -95,9 +220,33 @@ def _async_process_requirements(hass: core.HomeAssistant, name: str,
                 async_notify_setup_error(hass, name)
                 return False
 
+            satisfied.add(req)
+
+        yield from hass.async_add_job(
+            pkg_util.save_satisfied_requirements,
+            hass.config.path(REQUIREMENTS_MANIFEST), list(satisfied))
+
     return True
 
 
+@asyncio.coroutine
+def _async_get_satisfied_requirements(hass: core.HomeAssistant):
+    """Return the set of requirements known to be satisfied.
+
+    The set is loaded once from the manifest in the config dir.
+
+    This method is a coroutine.
+    """
+    task = hass.data.get(DATA_REQUIREMENTS)
+
+    if task is None:
+        task = hass.data[DATA_REQUIREMENTS] = hass.async_add_job(
+            pkg_util.load_satisfied_requirements,
+            hass.config.path(REQUIREMENTS_MANIFEST))
+
+    return (yield from task)
+
+
 @asyncio.coroutine
 def _async_process_dependencies(hass, config, name, dependencies):
     """Ensure all dependencies are set up."""
@@ -132,7 +281,7 @@ def _async_process_dependencies(hass, config, name, dependencies):
 
 @asyncio.coroutine
 def _async_setup_component(hass: core.HomeAssistant,
-                           domain: str, config) -> bool:
+                           domain: str, config, tracked: bool=True) -> bool:
     """Set up a component for Home Assistant.
 
     This method is a coroutine.
@@ -142,7 +291,10 @@ def _async_setup_component(hass: core.HomeAssistant,
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
+    startup_timeline = timeline.async_get_timeline(hass)
+
     component = loader.get_component(domain)
+    _async_record_imports(hass)
 
     if not component:
         log_error("Component not found.", False)
@@ -156,23 +308,32 @@ def _async_setup_component(hass: core.HomeAssistant,
         log_error("Unable to resolve component or dependencies.")
         return False
 
-    processed_config = \
-        conf_util.async_process_component_config(hass, config, domain)
+    with startup_timeline.span(domain, timeline.PHASE_CONFIG):
+        processed_config = \
+            conf_util.async_process_component_config(hass, config, domain)
 
     if processed_config is None:
         log_error("Invalid config.")
         return False
 
     if not hass.config.skip_pip and hasattr(component, 'REQUIREMENTS'):
-        req_success = yield from _async_process_requirements(
-            hass, domain, component.REQUIREMENTS)
+        with startup_timeline.span(domain, timeline.PHASE_REQUIREMENTS):
+            req_success = yield from _async_process_requirements(
+                hass, domain, component.REQUIREMENTS)
         if not req_success:
             log_error("Could not install all requirements.")
             return False
 
     if hasattr(component, 'DEPENDENCIES'):
+        # Only record waiting for dependencies that are not set up yet
+        waiting = any(dep not in hass.config.components
+                      for dep in component.DEPENDENCIES)
+        deps_start = timer()
         dep_success = yield from _async_process_dependencies(
             hass, config, domain, component.DEPENDENCIES)
+        if waiting:
+            startup_timeline.add(
+                domain, timeline.PHASE_DEPENDENCIES, deps_start)
 
         if not dep_success:
             log_error("Could not setup all dependencies.")
@@ -189,9 +350,12 @@ def _async_setup_component(hass: core.HomeAssistant,
     try:
         if async_comp:
             result = yield from component.async_setup(hass, processed_config)
-        else:
+        elif tracked:
             result = yield from hass.async_add_job(
                 component.setup, hass, processed_config)
+        else:
+            result = yield from hass.loop.run_in_executor(
+                None, component.setup, hass, processed_config)
     except Exception:  # pylint: disable=broad-except
         _LOGGER.exception("Error during setup of component %s", domain)
         async_notify_setup_error(hass, domain, True)
@@ -199,6 +363,7 @@ def _async_setup_component(hass: core.HomeAssistant,
     finally:
         end = timer()
         warn_task.cancel()
+        startup_timeline.add(domain, timeline.PHASE_SETUP, start, end)
     _LOGGER.info("Setup of domain %s took %.1f seconds.", domain, end - start)
 
     if result is False:
@@ -239,7 +404,10 @@ def async_prepare_setup_platform(hass: core.HomeAssistant, config, domain: str,
                       platform_path, msg)
         async_notify_setup_error(hass, platform_path)
 
+    startup_timeline = timeline.async_get_timeline(hass)
+
     platform = loader.get_platform(domain, platform_name)
+    _async_record_imports(hass)
 
     # Not found
     if platform is None:
@@ -252,16 +420,20 @@ def async_prepare_setup_platform(hass: core.HomeAssistant, config, domain: str,
 
     # Load dependencies
     if hasattr(platform, 'DEPENDENCIES'):
-        dep_success = yield from _async_process_dependencies(
-            hass, config, platform_path, platform.DEPENDENCIES)
+        with startup_timeline.span(platform_path,
+                                   timeline.PHASE_DEPENDENCIES):
+            dep_success = yield from _async_process_dependencies(
+                hass, config, platform_path, platform.DEPENDENCIES)
 
         if not dep_success:
             log_error("Could not setup all dependencies.")
             return None
 
     if not hass.config.skip_pip and hasattr(platform, 'REQUIREMENTS'):
-        req_success = yield from _async_process_requirements(
-            hass, platform_path, platform.REQUIREMENTS)
+        with startup_timeline.span(platform_path,
+                                   timeline.PHASE_REQUIREMENTS):
+            req_success = yield from _async_process_requirements(
+                hass, platform_path, platform.REQUIREMENTS)
 
         if not req_success:
             log_error("Could not install all requirements.")
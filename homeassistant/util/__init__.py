@@ -1,4 +1,5 @@
 """Helper methods for various modules."""
+import asyncio
 from collections.abc import MutableSet
 from itertools import chain
 import threading
@@ -230,6 +231,31 @@ class OrderedSet(MutableSet):
         return set(self) == set(other)
 
 
+def _is_plain_function(method):
+    """Return True if method is a function and not a method of a class."""
+    # Different methods that can be passed in:
+    #  - a function
+    #  - an unbound function on a class
+    #  - a method (bound function on a class)
+
+    # We want to be able to differentiate between function and unbound
+    # methods (which are considered functions).
+    # All methods have the classname in their qualname seperated by a '.'
+    # Functions have a '.' in their qualname if defined inline, but will
+    # be prefixed by '.<locals>.' so we strip that out.
+    return (not hasattr(method, '__self__') and
+            '.' not in method.__qualname__.split('.<locals>.')[-1])
+
+
+def _throttle_host(method, is_func, wrapper, args):
+    """Return the object that holds the throttle state of a call."""
+    if hasattr(method, '__self__'):
+        return method.__self__
+    elif is_func:
+        return wrapper
+    return args[0] if args else wrapper
+
+
 class Throttle(object):
     """A class for throttling the execution of tasks.
 
@@ -258,18 +284,7 @@ class Throttle(object):
         if self.limit_no_throttle is not None:
             method = Throttle(self.limit_no_throttle)(method)
 
-        # Different methods that can be passed in:
-        #  - a function
-        #  - an unbound function on a class
-        #  - a method (bound function on a class)
-
-        # We want to be able to differentiate between function and unbound
-        # methods (which are considered functions).
-        # All methods have the classname in their qualname seperated by a '.'
-        # Functions have a '.' in their qualname if defined inline, but will
-        # be prefixed by '.<locals>.' so we strip that out.
-        is_func = (not hasattr(method, '__self__') and
-                   '.' not in method.__qualname__.split('.<locals>.')[-1])
+        is_func = _is_plain_function(method)
 
         @wraps(method)
         def wrapper(*args, **kwargs):
@@ -278,12 +293,7 @@ class Throttle(object):
             If we cannot acquire the lock, it is running so return None.
             """
             # pylint: disable=protected-access
-            if hasattr(method, '__self__'):
-                host = method.__self__
-            elif is_func:
-                host = wrapper
-            else:
-                host = args[0] if args else wrapper
+            host = _throttle_host(method, is_func, wrapper, args)
 
             if not hasattr(host, '_throttle'):
                 host._throttle = {}
@@ -309,3 +319,63 @@ class Throttle(object):
                 throttle[0].release()
 
         return wrapper
+
+
+class AsyncThrottle(object):
+    """A class for throttling and coalescing calls of a coroutine function.
+
+    The async counterpart of Throttle. A call within the timedelta interval
+    `min_time` after the last call returned gets the result of that call.
+    A call made while a call is in progress waits for it and gets the same
+    result. Exceptions are passed to all waiting callers and not cached.
+
+    Pass keyword argument `no_throttle=True` to the wrapped method to skip
+    the cached result.
+
+    Must be used from within the event loop.
+    """
+
+    def __init__(self, min_time):
+        """Initialize the throttle."""
+        self.min_time = min_time
+
+    def __call__(self, method):
+        """Caller for the throttle."""
+        is_func = _is_plain_function(method)
+
+        @wraps(method)
+        @asyncio.coroutine
+        def wrapper(*args, **kwargs):
+            """Wrap that calls wrapped only once per min_time."""
+            # pylint: disable=protected-access
+            host = _throttle_host(method, is_func, wrapper, args)
+
+            if not hasattr(host, '_throttle'):
+                host._throttle = {}
+
+            # In progress future, time of last result, last result
+            throttle = host._throttle.setdefault(id(self), [None, None, None])
+            force = kwargs.pop('no_throttle', False)
+
+            if throttle[0] is None:
+                if not force and throttle[1] is not None and \
+                        utcnow() - throttle[1] <= self.min_time:
+                    return throttle[2]
+
+                future = asyncio.ensure_future(method(*args, **kwargs))
+
+                def call_done(fut):
+                    """Store the result of the call."""
+                    throttle[0] = None
+
+                    if not fut.cancelled() and fut.exception() is None:
+                        throttle[1] = utcnow()
+                        throttle[2] = fut.result()
+
+                future.add_done_callback(call_done)
+                throttle[0] = future
+
+            result = yield from asyncio.shield(throttle[0])
+            return result
+
+        return wrapper
@@ -1,5 +1,6 @@
 """Helpers to install PyPi packages."""
 import asyncio
+import json
 import logging
 import os
 from subprocess import PIPE, Popen
@@ -8,7 +9,7 @@ import threading
 from urllib.parse import urlparse
 
 from pip.locations import running_under_virtualenv
-from typing import Optional
+from typing import Optional, Set, Iterable
 
 import pkg_resources
 
@@ -16,6 +17,9 @@ _LOGGER = logging.getLogger(__name__)
 
 INSTALL_LOCK = threading.Lock()
 
+# Scanning sys.path for distributions is slow, share it until an install
+_ENVIRONMENT = None  # type: Optional[pkg_resources.Environment]
+
 
 def install_package(package: str, upgrade: bool=True,
                     target: Optional[str]=None,
@@ -52,6 +56,7 @@ def install_package(package: str, upgrade: bool=True,
                           package, stderr.decode('utf-8').lstrip().strip())
             return False
 
+        _reset_environment()
         return True
 
 
@@ -67,10 +72,89 @@ def check_package_exists(package: str) -> bool:
         # This is a zip file
         req = pkg_resources.Requirement.parse(urlparse(package).fragment)
 
-    env = pkg_resources.Environment()
+    env = _get_environment()
     return any(dist in req for dist in env[req.project_name])
 
 
+def _get_environment() -> pkg_resources.Environment:
+    """Return the shared environment of the installed distributions."""
+    global _ENVIRONMENT  # pylint: disable=global-statement
+
+    if _ENVIRONMENT is None:
+        _ENVIRONMENT = pkg_resources.Environment()
+
+    return _ENVIRONMENT
+
+
+def _reset_environment() -> None:
+    """Rescan the installed distributions on the next check."""
+    global _ENVIRONMENT  # pylint: disable=global-statement
+    _ENVIRONMENT = None
+
+
+# Directories packages are installed in, including the deps dir
+LIBRARY_DIRS = ('site-packages', 'dist-packages')
+
+
+def _manifest_key(manifest_dir: str) -> list:
+    """Return the modification times of the library directories.
+
+    Installing or removing a package in any of them changes its mtime.
+    Other sys.path entries, like the config dir that holds the manifest,
+    change for unrelated reasons and are ignored.
+    """
+    key = []
+    for path in sys.path:
+        if os.path.basename(os.path.normpath(path)) not in LIBRARY_DIRS or \
+                os.path.abspath(path) == manifest_dir:
+            continue
+        try:
+            key.append([path, os.stat(path).st_mtime])
+        except OSError:
+            pass
+    return key
+
+
+def _manifest_dir(path: str) -> str:
+    """Return the directory a manifest is stored in."""
+    return os.path.dirname(os.path.abspath(path))
+
+
+def load_satisfied_requirements(path: str) -> Set[str]:
+    """Load the requirements known to be satisfied from a manifest.
+
+    Return an empty set if there is no manifest or if the installed
+    packages changed since it was written.
+    """
+    try:
+        with open(path) as fil:
+            manifest = json.load(fil)
+    except (OSError, ValueError):
+        return set()
+
+    if not isinstance(manifest, dict) or \
+            manifest.get('key') != _manifest_key(_manifest_dir(path)):
+        return set()
+
+    return set(manifest.get('requirements', []))
+
+
+def save_satisfied_requirements(path: str, requirements: Iterable[str]) \
+        -> None:
+    """Write a manifest of the requirements that are satisfied."""
+    manifest = {
+        'key': _manifest_key(_manifest_dir(path)),
+        'requirements': sorted(requirements),
+    }
+
+    try:
+        with open(path, 'w') as fil:
+            json.dump(manifest, fil)
+    except OSError as err:
+        _LOGGER.warning("Unable to write requirements manifest %s: %s",
+                        path, err)
+
+
 def _get_user_site(deps_dir: str) -> tuple:
     """Get arguments and environment for subprocess used in get_user_site."""
     env = os.environ.copy()
@@ -1,10 +1,13 @@
 """YAML utility functions."""
 import logging
 import os
+import pickle
 import sys
 import fnmatch
+import threading
+import time
 from collections import OrderedDict
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Set  # NOQA
 
 import yaml
 try:
@@ -19,6 +22,19 @@ _SECRET_NAMESPACE = 'homeassistant'
 _SECRET_YAML = 'secrets.yaml'
 __SECRET_CACHE = {}  # type: Dict
 
+# Parsed files by absolute path: (dependencies, pickled tree). The
+# dependencies map every file and directory used to the stat result.
+__YAML_CACHE = {}  # type: Dict
+_CACHE_VERSION = 1
+_CACHE_FILES_LOADED = set()  # type: Set[str]
+# Changes within this many seconds of a file being read might not change
+# its modification time, so recently modified files are not cached.
+_RACY_SECONDS = 2
+# Parsed files that were not written by save_cache yet
+_CACHE_DIRTY = set()  # type: Set[str]
+_CACHE_LOCK = threading.Lock()
+_LOADING = threading.local()
+
 
 class NodeListClass(list):
     """Wrapper class to be able to add attributes on a list."""
@@ -56,13 +72,73 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+if hasattr(yaml, 'CSafeLoader'):
+    # pylint: disable=too-many-ancestors
+    class FastSafeLoader(yaml.CSafeLoader):
+        """Loader class that uses libyaml to parse."""
+
+        def __init__(self, stream):
+            """Initialize the loader, keep the name like SafeLineLoader."""
+            super().__init__(stream)
+            self.stream = stream
+            self.name = getattr(stream, 'name', '<file>')
+
+    _LOADERS = (yaml.SafeLoader, FastSafeLoader)
+    _LOADER = FastSafeLoader
+else:
+    _LOADERS = (yaml.SafeLoader,)
+    _LOADER = SafeLineLoader
+
+
 def load_yaml(fname: str) -> Union[List, Dict]:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    The parsed file is cached until one of the files or directories it
+    was built from, including includes and secrets, changes.
+    """
+    path = os.path.abspath(fname)
+    stack = _loading_stack()
+    cached = __YAML_CACHE.get(path)
+
+    if cached is not None and _dependencies_unchanged(cached[0]):
+        if stack:
+            stack[-1]['dependencies'].update(cached[0])
+        return pickle.loads(cached[1])
+
+    loading = {'dependencies': {}, 'cacheable': True}
+    started = time.time()
+    stack.append(loading)
+    try:
+        _add_dependency(path)
+        result = _load_yaml(fname)
+    finally:
+        stack.pop()
+
+    if stack:
+        stack[-1]['dependencies'].update(loading['dependencies'])
+        stack[-1]['cacheable'] &= loading['cacheable']
+
+    if loading['cacheable'] and \
+            not _modified_since(loading['dependencies'],
+                                started - _RACY_SECONDS):
+        entry = (loading['dependencies'],
+                 pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        with _CACHE_LOCK:
+            __YAML_CACHE[path] = entry
+            _CACHE_DIRTY.add(path)
+
+    return result
+
+
+def _load_yaml(fname: str) -> Union[List, Dict]:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding='utf-8') as conf_file:
+            if not _is_real_file(conf_file):
+                _mark_uncacheable()
             # If configuration file is empty YAML returns None
             # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            return yaml.load(conf_file, Loader=_LOADER) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(exc)
         raise HomeAssistantError(exc)
@@ -71,6 +147,118 @@ def load_yaml(fname: str) -> Union[List, Dict]:
         raise HomeAssistantError(exc)
 
 
+def _is_real_file(stream) -> bool:
+    """Test if a stream reads from a file on disk."""
+    try:
+        stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return False
+    return True
+
+
+def _loading_stack() -> List:
+    """Return the files being loaded by this thread, innermost last."""
+    stack = getattr(_LOADING, 'stack', None)
+    if stack is None:
+        stack = _LOADING.stack = []
+    return stack
+
+
+def _add_dependency(path: str) -> None:
+    """Record that the file being loaded depends on path."""
+    stack = _loading_stack()
+    if stack:
+        stack[-1]['dependencies'][path] = _stat(path)
+
+
+def _mark_uncacheable() -> None:
+    """Do not cache the files being loaded, for example for env vars."""
+    for loading in _loading_stack():
+        loading['cacheable'] = False
+
+
+def _stat(path: str):
+    """Return the modification time and size of path, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dependencies_unchanged(dependencies: Dict) -> bool:
+    """Test if none of the dependencies changed since they were loaded."""
+    return all(_stat(path) == stat for path, stat in dependencies.items())
+
+
+def _modified_since(dependencies: Dict, timestamp: float) -> bool:
+    """Test if one of the dependencies was modified after timestamp."""
+    return any(stat is not None and stat[0] >= timestamp * 1e9
+               for stat in dependencies.values())
+
+
+def load_cache(path: str) -> None:
+    """Load the parsed files that were written by save_cache."""
+    if path in _CACHE_FILES_LOADED:
+        return
+    _CACHE_FILES_LOADED.add(path)
+
+    try:
+        with open(path, mode='rb') as cache_file:
+            data = pickle.load(cache_file)
+    except FileNotFoundError:
+        return
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning("Unable to read YAML cache %s", path)
+        return
+
+    if not isinstance(data, dict) or data.get('version') != _CACHE_VERSION:
+        return
+
+    with _CACHE_LOCK:
+        for fname, entry in data['entries'].items():
+            __YAML_CACHE.setdefault(fname, entry)
+
+
+def save_cache(path: str) -> None:
+    """Write the parsed files in the directory of path to path.
+
+    The cache contains resolved secrets, so only the owner can read it.
+    """
+    prefix = os.path.join(os.path.dirname(os.path.abspath(path)), '')
+
+    with _CACHE_LOCK:
+        dirty = set(fname for fname in _CACHE_DIRTY
+                    if fname.startswith(prefix))
+        if not dirty:
+            return
+        entries = {fname: entry for fname, entry in __YAML_CACHE.items()
+                   if fname.startswith(prefix)}
+        _CACHE_DIRTY.difference_update(dirty)
+
+    try:
+        cache_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                           0o600)
+        with os.fdopen(cache_fd, 'wb') as cache_file:
+            pickle.dump({'version': _CACHE_VERSION, 'entries': entries},
+                        cache_file, pickle.HIGHEST_PROTOCOL)
+    except OSError as err:
+        _LOGGER.warning("Unable to write YAML cache %s: %s", path, err)
+        with _CACHE_LOCK:
+            _CACHE_DIRTY.update(dirty)
+
+
+def clear_yaml_cache() -> None:
+    """Clear the cache of parsed files.
+
+    Async friendly.
+    """
+    with _CACHE_LOCK:
+        __YAML_CACHE.clear()
+        _CACHE_DIRTY.clear()
+    _CACHE_FILES_LOADED.clear()
+
+
 def dump(_dict: dict) -> str:
     """Dump YAML to a string and remove null."""
     return yaml.safe_dump(_dict, default_flow_style=False) \
@@ -103,7 +291,10 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str):
     """Recursively load files in a directory."""
+    # Adding or removing a file changes the mtime of its directory
+    _add_dependency(os.path.abspath(directory))
     for root, dirs, files in os.walk(directory, topdown=True):
+        _add_dependency(os.path.abspath(root))
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in files:
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -200,6 +391,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node):
 def _env_var_yaml(loader: SafeLineLoader,
                   node: yaml.nodes.Node):
     """Load environment variables and embed it into the configuration YAML."""
+    _mark_uncacheable()
     if node.value in os.environ:
         return os.environ[node.value]
     else:
@@ -236,6 +428,8 @@ def _secret_yaml(loader: SafeLineLoader,
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
+        _add_dependency(os.path.abspath(
+            os.path.join(secret_path, _SECRET_YAML)))
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
@@ -251,6 +445,8 @@ def _secret_yaml(loader: SafeLineLoader,
             break  # Somehow we got past the .homeassistant config folder
 
     if keyring:
+        # Secrets from the keyring are never cached
+        _mark_uncacheable()
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
         if pwd:
@@ -261,18 +457,20 @@ def _secret_yaml(loader: SafeLineLoader,
     raise HomeAssistantError(node.value)
 
 
-yaml.SafeLoader.add_constructor('!include', _include_yaml)
-yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-                                _ordered_dict)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
-yaml.SafeLoader.add_constructor('!env_var', _env_var_yaml)
-yaml.SafeLoader.add_constructor('!secret', _secret_yaml)
-yaml.SafeLoader.add_constructor('!include_dir_list', _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor('!include_dir_merge_list',
+for _loader_cls in _LOADERS:
+    _loader_cls.add_constructor('!include', _include_yaml)
+    _loader_cls.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+    _loader_cls.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+    _loader_cls.add_constructor('!env_var', _env_var_yaml)
+    _loader_cls.add_constructor('!secret', _secret_yaml)
+    _loader_cls.add_constructor('!include_dir_list', _include_dir_list_yaml)
+    _loader_cls.add_constructor('!include_dir_merge_list',
                                 _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor('!include_dir_named', _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor('!include_dir_merge_named',
+    _loader_cls.add_constructor('!include_dir_named',
+                                _include_dir_named_yaml)
+    _loader_cls.add_constructor('!include_dir_merge_named',
                                 _include_dir_merge_named_yaml)
 
 
@@ -4,12 +4,14 @@ from datetime import timedelta
 import unittest
 from unittest.mock import patch
 
-from homeassistant.core import State, CoreState
+from homeassistant.core import State, CoreState, callback
 from homeassistant.setup import setup_component, async_setup_component
 import homeassistant.components.automation as automation
 from homeassistant.const import (
-    ATTR_ENTITY_ID, STATE_ON, STATE_OFF, EVENT_HOMEASSISTANT_START)
+    ATTR_ENTITY_ID, STATE_ON, STATE_OFF, EVENT_HOMEASSISTANT_START,
+    EVENT_STATE_CHANGED)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import script
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -454,6 +456,48 @@ class TestAutomation(unittest.TestCase):
         assert len(self.calls) == 2
         assert self.calls[1].data.get('event') == 'test_event2'
 
+    def test_reload_config_service_unchanged(self):
+        """Test that reload only rebuilds the changed automations."""
+        config = {
+            automation.DOMAIN: [{
+                'id': 'hello',
+                'alias': 'hello',
+                'trigger': {
+                    'platform': 'event',
+                    'event_type': 'test_event',
+                },
+                'action': {'service': 'test.automation'}
+            }, {
+                'alias': 'bye',
+                'trigger': {
+                    'platform': 'event',
+                    'event_type': 'test_event2',
+                },
+                'action': {'service': 'test.automation'}
+            }]
+        }
+        assert setup_component(self.hass, automation.DOMAIN, config)
+        hello_state = self.hass.states.get('automation.hello')
+        bye_state = self.hass.states.get('automation.bye')
+
+        config[automation.DOMAIN][1]['trigger']['event_type'] = 'test_event3'
+
+        with patch('homeassistant.config.load_yaml_config_file', autospec=True,
+                   return_value=config):
+            automation.reload(self.hass)
+            self.hass.block_till_done()
+
+        assert self.hass.states.get('automation.hello') is hello_state
+        assert self.hass.states.get('automation.bye') is not bye_state
+        listeners = self.hass.bus.listeners
+        assert listeners.get('test_event') == 1
+        assert listeners.get('test_event2') is None
+        assert listeners.get('test_event3') == 1
+
+        self.hass.bus.fire('test_event3')
+        self.hass.block_till_done()
+        assert len(self.calls) == 1
+
     def test_reload_config_when_invalid_config(self):
         """Test the reload config service handling invalid config."""
         with assert_setup_component(1, automation.DOMAIN):
@@ -785,3 +829,143 @@ def test_automation_not_trigger_on_bootstrap(hass):
 
     assert len(calls) == 1
     assert ['hello.world'] == calls[0].data.get(ATTR_ENTITY_ID)
+
+
+@asyncio.coroutine
+def test_trigger_registry_shares_listeners(hass):
+    """Test that triggers share one listener per key."""
+    calls = async_mock_service(hass, 'test', 'automation')
+    listeners_before = hass.bus.async_listeners()
+
+    res = yield from async_setup_component(hass, automation.DOMAIN, {
+        automation.DOMAIN: [{
+            'alias': 'state_{}'.format(number),
+            'trigger': [{
+                'platform': 'state',
+                'entity_id': 'light.kitchen',
+                'to': 'on',
+            }, {
+                'platform': 'event',
+                'event_type': 'test_event',
+            }],
+            'action': {'service': 'test.automation'},
+        } for number in range(3)]
+    })
+    assert res
+
+    listeners = hass.bus.async_listeners()
+    assert listeners.get('test_event') == 1
+    assert listeners.get(EVENT_STATE_CHANGED, 0) == \
+        listeners_before.get(EVENT_STATE_CHANGED, 0) + 1
+
+    registry = automation.async_get_trigger_registry(hass)
+
+    hass.states.async_set('light.hallway', 'on')
+    hass.states.async_set('light.kitchen', 'off')
+    yield from hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.states.async_set('light.kitchen', 'on')
+    yield from hass.async_block_till_done()
+    assert len(calls) == 3
+
+    stats = [trigger for trigger in registry.async_stats()
+             if trigger['platform'] == 'state']
+    assert len(stats) == 3
+    assert all(trigger['key'] == 'light.kitchen' and
+               trigger['evaluations'] == 2 and trigger['matches'] == 1
+               for trigger in stats)
+
+    hass.bus.async_fire('test_event')
+    yield from hass.async_block_till_done()
+    assert len(calls) == 6
+
+    stats = [trigger for trigger in registry.async_stats()
+             if trigger['platform'] == 'event']
+    assert len(stats) == 3
+    assert all(trigger['key'] == 'test_event' and
+               trigger['evaluations'] == 1 and trigger['matches'] == 1
+               for trigger in stats)
+
+    yield from hass.services.async_call(
+        automation.DOMAIN, 'turn_off', blocking=True)
+
+    assert registry.async_stats() == []
+    assert 'test_event' not in hass.bus.async_listeners()
+
+
+@asyncio.coroutine
+def test_trigger_registry_isolates_errors(hass):
+    """Test that a failing trigger does not stop the others."""
+    registry = automation.async_get_trigger_registry(hass)
+    calls = []
+
+    @callback
+    def failing_action(*args):
+        """Raise an error."""
+        raise ValueError('Boom')
+
+    @callback
+    def action(*args):
+        """Record the call."""
+        calls.append(args)
+        return True
+
+    registry.async_track_event('event', 'test_event', failing_action)
+    registry.async_track_event('event', 'test_event', action)
+    registry.async_track_state_change(
+        'state', 'light.kitchen', failing_action)
+    registry.async_track_state_change('state', 'light.kitchen', action)
+
+    with patch('homeassistant.components.automation._LOGGER.exception') \
+            as mock_exception:
+        hass.bus.async_fire('test_event')
+        hass.states.async_set('light.kitchen', 'on')
+        yield from hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert mock_exception.call_count == 2
+    assert sorted(trigger['matches'] for trigger in registry.async_stats()) \
+        == [0, 0, 1, 1]
+
+
+@asyncio.coroutine
+def test_automation_traces(hass):
+    """Test that automation runs are traced."""
+    calls = async_mock_service(hass, 'test', 'automation')
+
+    assert (yield from async_setup_component(hass, automation.DOMAIN, {
+        automation.DOMAIN: {
+            'alias': 'hello',
+            'trigger': {
+                'platform': 'event',
+                'event_type': 'test_event',
+            },
+            'condition': {
+                'condition': 'template',
+                'value_template': '{{ trigger.event.data.run }}',
+            },
+            'action': {'service': 'test.automation'},
+        }
+    }))
+
+    hass.bus.async_fire('test_event', {'run': False})
+    hass.bus.async_fire('test_event', {'run': True})
+    yield from hass.async_block_till_done()
+    assert len(calls) == 1
+
+    traces = script.async_get_traces(hass)['automation.hello']
+    assert traces.run_count == 2
+
+    skipped, ran = traces.traces
+    assert skipped.result == script.RESULT_CONDITION_FAILED
+    assert skipped.condition_time is not None
+    assert skipped.action_latency is None
+
+    assert ran.result == script.RESULT_FINISHED
+    assert ran.action_latency is not None
+    assert [step['type'] for step in ran.steps] == ['service']
+
+    state = hass.states.get('automation.hello')
+    assert state.attributes.get('run_count') == 2
+    assert state.attributes.get('last_run_duration') is not None
@@ -0,0 +1,131 @@
+"""The tests for the static file handling of the HTTP component."""
+import asyncio
+import gzip
+
+import pytest
+from aiohttp import web
+
+from homeassistant.components.http.const import KEY_DEVELOPMENT
+from homeassistant.components.http.static import (
+    CachingStaticResource, StaticAssetCache, staticresource_middleware)
+
+
+@pytest.fixture
+def static_dir(tmpdir):
+    """Create a directory with static files."""
+    tmpdir.join('app.js').write('var hello = "world";\n' * 100)
+    tmpdir.join('image.png').write_binary(b'\x89PNG' + b'\x00' * 10)
+    tmpdir.mkdir('sub').join('page.html').write('<html></html>')
+    return tmpdir
+
+
+@pytest.fixture
+def asset_cache(static_dir):
+    """Return a built asset cache."""
+    cache = StaticAssetCache(str(static_dir))
+    cache.build()
+    return cache
+
+
+@pytest.fixture
+def mock_client(loop, test_client, static_dir, asset_cache):
+    """Start an app serving the static directory from the cache."""
+    app = web.Application(middlewares=[staticresource_middleware])
+    app[KEY_DEVELOPMENT] = False
+    app.router.register_resource(CachingStaticResource(
+        '/static', str(static_dir), asset_cache=asset_cache))
+    return loop.run_until_complete(test_client(app))
+
+
+def test_cache_build(asset_cache):
+    """Test that files are loaded with their variants."""
+    assert len(asset_cache) == 3
+
+    asset = asset_cache.get('app.js')
+    assert asset.content_type == 'application/javascript'
+    assert gzip.decompress(asset.gzip_body) == asset.body
+    assert asset.etag.startswith('"')
+
+    assert asset_cache.get('sub/page.html') is not None
+    # Not worth compressing
+    assert asset_cache.get('image.png').gzip_body is None
+
+
+def test_cache_bounded(static_dir):
+    """Test that the cache respects its limits."""
+    cache = StaticAssetCache(str(static_dir), max_file_size=100)
+    cache.build()
+    assert cache.get('app.js') is None
+    assert cache.get('image.png') is not None
+
+    cache = StaticAssetCache(str(static_dir), max_size=0)
+    cache.build()
+    assert len(cache) == 0
+
+
+def test_cache_uses_gz_sibling(static_dir):
+    """Test that an existing precompressed file is used."""
+    static_dir.join('app.js.gz').write_binary(
+        gzip.compress(static_dir.join('app.js').read_binary()))
+    cache = StaticAssetCache(str(static_dir))
+    cache.build()
+    assert cache.get('app.js.gz') is None
+    assert cache.get('app.js').gzip_body == \
+        static_dir.join('app.js.gz').read_binary()
+
+
+@asyncio.coroutine
+def test_serve_gzip(mock_client, asset_cache):
+    """Test serving the compressed variant."""
+    resp = yield from mock_client.get(
+        '/static/app.js', headers={'Accept-Encoding': 'gzip'})
+    assert resp.status == 200
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['ETag'] == asset_cache.get('app.js').etag
+    assert 'max-age' in resp.headers['Cache-Control']
+    body = yield from resp.read()
+    assert body == asset_cache.get('app.js').body
+
+
+@asyncio.coroutine
+def test_serve_gzip_refused(mock_client, asset_cache):
+    """Test that gzip is not served when its quality value is 0."""
+    for accept in ('gzip;q=0', 'deflate, gzip; q=0.0, *', 'identity'):
+        resp = yield from mock_client.get(
+            '/static/app.js', headers={'Accept-Encoding': accept})
+        assert resp.status == 200
+        assert 'Content-Encoding' not in resp.headers
+        body = yield from resp.read()
+        assert body == asset_cache.get('app.js').body
+
+    resp = yield from mock_client.get(
+        '/static/app.js', headers={'Accept-Encoding': 'br;q=1, *;q=0.5'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+
+
+@asyncio.coroutine
+def test_serve_fingerprinted(mock_client):
+    """Test that fingerprinted names are served from the cache."""
+    resp = yield from mock_client.get(
+        '/static/app-0123456789abcdef0123456789abcdef.js')
+    assert resp.status == 200
+    assert 'ETag' in resp.headers
+
+
+@asyncio.coroutine
+def test_not_modified(mock_client, asset_cache):
+    """Test that a matching ETag results in a 304."""
+    resp = yield from mock_client.get('/static/sub/page.html', headers={
+        'If-None-Match': asset_cache.get('sub/page.html').etag})
+    assert resp.status == 304
+
+
+@asyncio.coroutine
+def test_fallback_to_disk(mock_client, static_dir):
+    """Test that files not in the cache are served from disk."""
+    static_dir.join('new.txt').write('new')
+    resp = yield from mock_client.get('/static/new.txt')
+    assert resp.status == 200
+    assert 'ETag' not in resp.headers
+    body = yield from resp.text()
+    assert body == 'new'
@@ -1,6 +1,8 @@
 """The test for the Template sensor platform."""
 import asyncio
+from unittest.mock import patch
 
+from homeassistant.components.sensor import template
 from homeassistant.core import CoreState, State
 from homeassistant.setup import setup_component, async_setup_component
 from homeassistant.helpers.restore_state import DATA_RESTORE_CACHE
@@ -49,6 +51,34 @@ class TestTemplateSensor:
         state = self.hass.states.get('sensor.test_template_sensor')
         assert state.state == 'It Works.'
 
+    def test_template_domain_iteration(self):
+        """Test template iterating a domain tracks new entities."""
+        with assert_setup_component(1):
+            assert setup_component(self.hass, 'sensor', {
+                'sensor': {
+                    'platform': 'template',
+                    'sensors': {
+                        'lights_on': {
+                            'value_template':
+                                "{{ states.light | selectattr('state', 'eq', "
+                                "'on') | list | count }}"
+                        }
+                    }
+                }
+            })
+
+        self.hass.start()
+        self.hass.block_till_done()
+
+        state = self.hass.states.get('sensor.lights_on')
+        assert state.state == '0'
+
+        self.hass.states.set('light.kitchen', 'on')
+        self.hass.states.set('light.hallway', 'on')
+        self.hass.block_till_done()
+        state = self.hass.states.get('sensor.lights_on')
+        assert state.state == '2'
+
     def test_icon_template(self):
         """Test icon template."""
         with assert_setup_component(1):
@@ -221,3 +251,53 @@ def test_restore_state(hass):
 
     state = hass.states.get('sensor.test_template_sensor')
     assert state.state == 'It .'
+
+
+@asyncio.coroutine
+def test_rate_limit(hass):
+    """Test that renders are rate limited and cancelled on removal."""
+    sensors = []
+    sensor_template = template.SensorTemplate
+
+    def create_sensor(*args):
+        """Keep a reference to the created sensor."""
+        sensors.append(sensor_template(*args))
+        return sensors[-1]
+
+    with patch('homeassistant.components.sensor.template.SensorTemplate',
+               side_effect=create_sensor):
+        yield from async_setup_component(hass, 'sensor', {
+            'sensor': {
+                'platform': 'template',
+                'rate_limit': 60,
+                'sensors': {
+                    'test_template_sensor': {
+                        'value_template':
+                            "It {{ states.sensor.test_state.state }}."
+                    }
+                }
+            }
+        })
+
+    yield from hass.async_start()
+    yield from hass.async_block_till_done()
+
+    hass.states.async_set('sensor.test_state', 'one')
+    yield from hass.async_block_till_done()
+    assert hass.states.get('sensor.test_template_sensor').state == 'It one.'
+
+    hass.states.async_set('sensor.test_state', 'two')
+    yield from hass.async_block_till_done()
+    assert hass.states.get('sensor.test_template_sensor').state == 'It one.'
+
+    # pylint: disable=protected-access
+    update_job = sensors[0]._update_job
+    assert update_job._timer is not None
+
+    yield from sensors[0].async_remove()
+    assert update_job._timer is None
+    assert hass.states.get('sensor.test_template_sensor') is None
+
+    hass.states.async_set('sensor.test_state', 'three')
+    yield from hass.async_block_till_done()
+    assert hass.states.get('sensor.test_template_sensor') is None
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 import asyncio
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -242,6 +243,15 @@ def test_api_get_components(hass, mock_api_client):
     assert set(result) == hass.config.components
 
 
+@asyncio.coroutine
+def test_api_get_startup_timeline(hass, mock_api_client):
+    """Test the return of the startup timeline."""
+    resp = yield from mock_api_client.get(const.URL_API_STARTUP_TIMELINE)
+    result = yield from resp.json()
+    assert 'duration' in result
+    assert any(span['name'] == 'api' for span in result['spans'])
+
+
 @asyncio.coroutine
 def test_api_get_event_listeners(hass, mock_api_client):
     """Test if we can get the list of events being listened for."""
@@ -338,6 +348,74 @@ def test_api_template_error(hass, mock_api_client):
     assert resp.status == 400
 
 
+@asyncio.coroutine
+def test_api_set_states(hass, mock_api_client):
+    """Test setting the state of multiple entities in one request."""
+    hass.states.async_set('test.existing', 'off')
+
+    resp = yield from mock_api_client.post(const.URL_API_STATES, json=[
+        {'entity_id': 'test.existing', 'state': 'on'},
+        {'entity_id': 'test.new', 'state': 'on', 'attributes': {'a': 1}},
+        {'entity_id': 'test.no_state'},
+        {'entity_id': 'invalid', 'state': 'on'},
+        {'entity_id': 'test.list_attributes', 'state': 'on',
+         'attributes': ['a']},
+        {'entity_id': 'test.str_attributes', 'state': 'on',
+         'attributes': 'a'},
+    ])
+    assert resp.status == 200
+    results = yield from resp.json()
+
+    assert [result['status'] for result in results] == \
+        [200, 201, 400, 400, 400, 400]
+    assert results[1]['state']['attributes'] == {'a': 1}
+    assert hass.states.get('test.existing').state == 'on'
+    assert hass.states.get('test.new').attributes == {'a': 1}
+    assert hass.states.get('test.no_state') is None
+    assert hass.states.get('test.list_attributes') is None
+    assert hass.states.get('test.str_attributes') is None
+
+
+@asyncio.coroutine
+def test_api_set_states_invalid(hass, mock_api_client):
+    """Test setting multiple states with invalid data."""
+    resp = yield from mock_api_client.post(
+        const.URL_API_STATES, json={'entity_id': 'test.one', 'state': 'on'})
+    assert resp.status == 400
+
+
+@asyncio.coroutine
+def test_api_call_services_batch(hass, mock_api_client):
+    """Test calling multiple services in one request."""
+    calls = []
+
+    @ha.callback
+    def listener(service_call):
+        """Record the service call and change a state."""
+        calls.append(service_call)
+        hass.states.async_set('test.batch', len(calls))
+
+    hass.services.async_register('test_domain', 'test_service', listener)
+
+    resp = yield from mock_api_client.post(const.URL_API_SERVICES_BATCH, json=[
+        {'domain': 'test_domain', 'service': 'test_service'},
+        {'domain': 'test_domain', 'service': 'test_service',
+         'service_data': {'hello': 'world'}},
+        {'domain': 'test_domain', 'service': 'non_existing'},
+        {'domain': 'test_domain', 'service': 'test_service',
+         'service_data': 'invalid'},
+    ])
+    assert resp.status == 200
+    data = yield from resp.json()
+
+    assert [result['success'] for result in data['results']] == \
+        [True, True, False, False]
+    assert len(calls) == 2
+    assert calls[1].data == {'hello': 'world'}
+    assert [state['entity_id'] for state in data['changed_states']] == \
+        ['test.batch']
+
+
 @asyncio.coroutine
 def test_stream(hass, mock_api_client):
     """Test the stream."""
@@ -362,7 +440,8 @@ def test_stream_with_restricted(hass, mock_api_client):
     resp = yield from mock_api_client.get(
         '{}?restrict=test_event1,test_event3'.format(const.URL_API_STREAM))
     assert resp.status == 200
-    assert listen_count + 1 == _listen_count(hass)
+    # One listener per event type, including homeassistant_stop
+    assert listen_count + 3 == _listen_count(hass)
 
     hass.bus.async_fire('test_event1')
     data = yield from _stream_next_event(resp.content)
@@ -374,6 +453,55 @@ def test_stream_with_restricted(hass, mock_api_client):
     assert data['event_type'] == 'test_event3'
 
 
+@asyncio.coroutine
+def test_stream_with_entity_id(hass, mock_api_client):
+    """Test the stream filtered on entity ids."""
+    resp = yield from mock_api_client.get(
+        '{}?entity_id=light.kitchen'.format(const.URL_API_STREAM))
+    assert resp.status == 200
+
+    hass.states.async_set('light.living_room', 'on')
+    hass.bus.async_fire('test_event')
+    hass.states.async_set('light.kitchen', 'on')
+    data = yield from _stream_next_event(resp.content)
+    assert data['event_type'] == const.EVENT_STATE_CHANGED
+    assert data['data']['entity_id'] == 'light.kitchen'
+
+    hass.bus.async_fire('test_event', {'entity_id': ['light.living_room']})
+    hass.bus.async_fire('test_event', {'entity_id': [{'invalid': 1}]})
+    hass.bus.async_fire('test_event', {
+        'entity_id': ['light.living_room', 'light.kitchen']})
+    data = yield from _stream_next_event(resp.content)
+    assert data['event_type'] == 'test_event'
+    assert data['data']['entity_id'] == ['light.living_room', 'light.kitchen']
+
+    hass.bus.async_fire(const.EVENT_CALL_SERVICE, {
+        'domain': 'light', 'service': 'turn_on',
+        'service_data': {'entity_id': 'light.living_room'}})
+    hass.bus.async_fire(const.EVENT_CALL_SERVICE, {
+        'domain': 'light', 'service': 'turn_on',
+        'service_data': {'entity_id': ['light.kitchen']}})
+    data = yield from _stream_next_event(resp.content)
+    assert data['event_type'] == const.EVENT_CALL_SERVICE
+    assert data['data']['service_data'] == {'entity_id': ['light.kitchen']}
+
+
+@asyncio.coroutine
+def test_stream_shared_encoding(hass, mock_api_client):
+    """Test that the encoding of an event is shared between streams."""
+    resp1 = yield from mock_api_client.get(const.URL_API_STREAM)
+    resp2 = yield from mock_api_client.get(const.URL_API_STREAM)
+
+    with patch('homeassistant.components.api.json.dumps',
+               wraps=json.dumps) as mock_dumps:
+        hass.bus.async_fire('test_event')
+        data1 = yield from _stream_next_event(resp1.content)
+        data2 = yield from _stream_next_event(resp2.content)
+
+    assert data1 == data2
+    assert mock_dumps.call_count == 1
+
+
 @asyncio.coroutine
 def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
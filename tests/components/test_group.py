@@ -3,12 +3,12 @@
 import asyncio
 from collections import OrderedDict
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, PropertyMock
 
 from homeassistant.setup import setup_component, async_setup_component
 from homeassistant.const import (
     STATE_ON, STATE_OFF, STATE_HOME, STATE_UNKNOWN, ATTR_ICON, ATTR_HIDDEN,
-    ATTR_ASSUMED_STATE, STATE_NOT_HOME)
+    ATTR_ASSUMED_STATE, STATE_NOT_HOME, ATTR_ENTITY_ID)
 import homeassistant.components.group as group
 
 from tests.common import get_test_home_assistant, assert_setup_component
@@ -297,6 +297,88 @@ class TestComponentsGroup(unittest.TestCase):
             sorted(group.expand_entity_ids(self.hass,
                                            ['group.group_of_groups'])))
 
+    def test_expand_entity_ids_cached_until_members_change(self):
+        """Test that nested expansions are cached and invalidated."""
+        group.Group.create_group(
+            self.hass, 'light', ['light.test_1', 'light.test_2'])
+        self.hass.states.set('group.switch', STATE_OFF, {
+            ATTR_ENTITY_ID: ['switch.test_1', 'group.light']})
+        group.Group.create_group(
+            self.hass, 'all', ['group.switch', 'light.test_2'])
+
+        self.assertEqual(
+            ['switch.test_1', 'light.test_1', 'light.test_2'],
+            group.expand_entity_ids(self.hass, ['group.all']))
+
+        with patch('homeassistant.components.group._collect_group_members',
+                   side_effect=AssertionError) as mock_collect:
+            group.expand_entity_ids(self.hass, ['group.all'])
+        self.assertFalse(mock_collect.called)
+
+        self.hass.states.set('group.switch', STATE_OFF, {
+            ATTR_ENTITY_ID: ['switch.test_1', 'switch.test_2']})
+
+        self.assertEqual(
+            ['switch.test_1', 'switch.test_2', 'light.test_2'],
+            group.expand_entity_ids(self.hass, ['group.all']))
+
+    def test_expand_entity_ids_nested_cycle(self):
+        """Test that groups containing each other are expanded once."""
+        self.hass.states.set('group.first', STATE_OFF, {
+            ATTR_ENTITY_ID: ['light.bowl', 'group.second']})
+        self.hass.states.set('group.second', STATE_OFF, {
+            ATTR_ENTITY_ID: ['group.first', 'light.ceiling']})
+
+        self.assertEqual(
+            ['light.bowl', 'light.ceiling'],
+            group.expand_entity_ids(self.hass, ['group.first']))
+
+    def test_expand_cache_evicted_on_remove(self):
+        """Test that expansions built from a removed group are evicted."""
+        light_group = group.Group.create_group(
+            self.hass, 'light', ['light.test_1', 'light.test_2'])
+        group.Group.create_group(
+            self.hass, 'all', ['group.light', 'switch.test_1'])
+        group.Group.create_group(self.hass, 'switch', ['switch.test_1'])
+
+        group.expand_entity_ids(
+            self.hass, ['group.all', 'group.light', 'group.switch'])
+        cache = self.hass.data[group.DATA_EXPAND_CACHE]
+        self.assertEqual(
+            ['group.all', 'group.light', 'group.switch'], sorted(cache))
+
+        light_group.stop()
+        self.assertEqual(['group.switch'], sorted(cache))
+
+    def test_group_state_updated_incrementally(self):
+        """Test that member changes do not rescan all members."""
+        self.hass.states.set('light.Bowl', STATE_ON)
+        self.hass.states.set('light.Ceiling', STATE_OFF)
+        self.hass.states.set('light.Desk', STATE_OFF)
+        test_group = group.Group.create_group(
+            self.hass, 'init_group', ['light.Bowl', 'light.Ceiling',
+                                      'light.Desk'])
+
+        with patch('homeassistant.components.group.Group._tracking_states',
+                   new_callable=PropertyMock) as mock_states:
+            self.hass.states.set('light.Ceiling', STATE_ON)
+            self.hass.block_till_done()
+            self.hass.states.set('light.Bowl', STATE_OFF)
+            self.hass.block_till_done()
+            self.assertEqual(
+                STATE_ON, self.hass.states.get(test_group.entity_id).state)
+
+            self.hass.states.set('light.Desk', STATE_OFF, {
+                ATTR_ASSUMED_STATE: True
+            })
+            self.hass.states.remove('light.Ceiling')
+            self.hass.block_till_done()
+
+        self.assertFalse(mock_states.called)
+        state = self.hass.states.get(test_group.entity_id)
+        self.assertEqual(STATE_OFF, state.state)
+        self.assertTrue(state.attributes.get(ATTR_ASSUMED_STATE))
+
     def test_set_assumed_state_based_on_tracked(self):
         """Test assumed state."""
         self.hass.states.set('light.Bowl', STATE_ON)
@@ -352,6 +434,9 @@ class TestComponentsGroup(unittest.TestCase):
             ['group.empty_group', 'group.second_group', 'group.test_group']
         assert self.hass.bus.listeners['state_changed'] == 3
 
+        group.expand_entity_ids(self.hass, ['group.test_group'])
+        assert group.DATA_EXPAND_CACHE in self.hass.data
+
         with patch('homeassistant.config.load_yaml_config_file', return_value={
             'group': {
                 'hello': {
@@ -364,6 +449,7 @@ class TestComponentsGroup(unittest.TestCase):
 
         assert self.hass.states.entity_ids() == ['group.hello']
         assert self.hass.bus.listeners['state_changed'] == 1
+        assert group.DATA_EXPAND_CACHE not in self.hass.data
 
     def test_stopping_a_group(self):
         """Test that a group correctly removes itself."""
@@ -3,6 +3,7 @@
 import asyncio
 import unittest
 import logging
+from unittest.mock import patch
 
 from homeassistant.core import CoreState, State
 from homeassistant.setup import setup_component, async_setup_component
@@ -10,6 +11,7 @@ from homeassistant.components.input_boolean import (
     DOMAIN, is_on, toggle, turn_off, turn_on, CONF_INITIAL)
 from homeassistant.const import (
     STATE_ON, STATE_OFF, ATTR_ICON, ATTR_FRIENDLY_NAME)
+from homeassistant.helpers.entity import Entity
 
 from tests.common import (
     get_test_home_assistant, mock_component, mock_restore_cache)
@@ -73,6 +75,27 @@ class TestInputBoolean(unittest.TestCase):
 
         self.assertTrue(is_on(self.hass, entity_id))
 
+    def test_static_attributes_built_once(self):
+        """Test that toggling does not read the static attributes again."""
+        self.assertTrue(setup_component(self.hass, DOMAIN, {DOMAIN: {
+            'test_1': {'name': 'Hello', 'icon': 'mdi:work'},
+        }}))
+        entity_id = 'input_boolean.test_1'
+
+        with patch.object(Entity, '_async_build_static_attributes',
+                          autospec=True,
+                          side_effect=Entity._async_build_static_attributes) \
+                as mock_build:
+            for _ in range(3):
+                toggle(self.hass, entity_id)
+                self.hass.block_till_done()
+
+        assert mock_build.call_count == 0
+        state = self.hass.states.get(entity_id)
+        assert state.state == STATE_ON
+        assert state.attributes[ATTR_FRIENDLY_NAME] == 'Hello'
+        assert state.attributes[ATTR_ICON] == 'mdi:work'
+
     def test_config_options(self):
         """Test configuration options."""
         count_start = len(self.hass.states.entity_ids())
@@ -207,3 +207,40 @@ class TestScriptComponent(unittest.TestCase):
 
         assert self.hass.states.get("script.test2") is not None
         assert self.hass.services.has_service(script.DOMAIN, 'test2')
+
+    def test_reload_service_unchanged(self):
+        """Verify that reload keeps the scripts that did not change."""
+        config = {
+            'script': {
+                'test': {
+                    'sequence': [{
+                        'delay': {
+                            'seconds': 5
+                        }
+                    }]
+                },
+                'other': {
+                    'sequence': [{
+                        'event': 'test_event'
+                    }]
+                }
+            }
+        }
+        assert setup_component(self.hass, 'script', config)
+
+        script.turn_on(self.hass, ENTITY_ID)
+        self.hass.block_till_done()
+        assert script.is_on(self.hass, ENTITY_ID)
+        other_state = self.hass.states.get('script.other')
+
+        config['script']['other']['sequence'][0]['event'] = 'test_event2'
+
+        with patch('homeassistant.config.load_yaml_config_file',
+                   return_value=config):
+            script.reload(self.hass)
+            self.hass.block_till_done()
+
+        assert script.is_on(self.hass, ENTITY_ID)
+        assert self.hass.states.get('script.other') is not other_state
+        assert self.hass.services.has_service(script.DOMAIN, 'test')
+        assert self.hass.services.has_service(script.DOMAIN, 'other')
@@ -1,15 +1,22 @@
 """Tests for the Home Assistant Websocket API."""
 import asyncio
+from datetime import timedelta
+import logging
 from unittest.mock import patch
 
 from aiohttp import WSMsgType
 from async_timeout import timeout
 import pytest
 
+from homeassistant import loader
 from homeassistant.core import callback
-from homeassistant.components import websocket_api as wapi, frontend
+from homeassistant.components import (
+    automation, websocket_api as wapi, frontend)
+from homeassistant.helpers import script
+from homeassistant.helpers.entity_component import EntityComponent
 
-from tests.common import mock_http_component_app, mock_coro
+from tests.common import (
+    mock_http_component_app, mock_coro, MockPlatform, MockToggleDevice)
 
 API_PASSWORD = 'test1234'
 
@@ -303,6 +310,102 @@ def test_get_panels(hass, websocket_client):
     assert msg['result'] == hass.data[frontend.DATA_PANELS]
 
 
+@asyncio.coroutine
+def test_get_traces(hass, websocket_client):
+    """Test get_traces command."""
+    traces = script.async_get_traces(hass)
+    traces['script.one'] = script.TraceBuffer()
+    traces['script.one'].async_start().async_finish(script.RESULT_FINISHED)
+    traces['script.two'] = script.TraceBuffer()
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_GET_TRACES,
+        'entity_id': ['script.one', 'script.unknown'],
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert msg['type'] == wapi.TYPE_RESULT
+    assert msg['success']
+    assert list(msg['result']) == ['script.one']
+    assert msg['result']['script.one']['run_count'] == 1
+    assert msg['result']['script.one']['traces'][0]['result'] == \
+        script.RESULT_FINISHED
+
+    websocket_client.send_json({
+        'id': 6,
+        'type': wapi.TYPE_GET_TRACES,
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert sorted(msg['result']) == ['script.one', 'script.two']
+
+
+@asyncio.coroutine
+def test_get_polling_stats(hass, websocket_client):
+    """Test get_polling_stats command."""
+    def setup_platform(hass, config, add_devices, discovery_info=None):
+        """Set up a polled entity that does not change."""
+        add_devices([MockToggleDevice('polled', 'on')])
+
+    loader.set_component('test_domain.platform',
+                         MockPlatform(setup_platform=setup_platform))
+    component = EntityComponent(logging.getLogger(__name__), 'test_domain',
+                                hass)
+    yield from component.async_setup({
+        'test_domain': {
+            'platform': 'platform',
+            'scan_interval': timedelta(seconds=30),
+            'max_scan_interval': timedelta(seconds=120),
+        }
+    })
+    # pylint: disable=protected-access
+    for platform in component._platforms.values():
+        yield from platform._update_entity_states(None)
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_GET_POLLING_STATS,
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert msg['type'] == wapi.TYPE_RESULT
+    assert msg['success']
+    stats = {platform['platform']: platform
+             for platform in msg['result']['test_domain']}
+    assert stats['platform']['scan_interval'] == 30
+    assert stats['platform']['scan_count'] == 1
+    assert stats['platform']['poll_intervals'] == {
+        'test_domain.polled': 60}
+
+
+@asyncio.coroutine
+def test_get_trigger_stats(hass, websocket_client):
+    """Test get_trigger_stats command."""
+    registry = automation.async_get_trigger_registry(hass)
+    registry.async_track_event('event', 'test_event', lambda event: True)
+    hass.bus.async_fire('test_event')
+    yield from hass.async_block_till_done()
+
+    websocket_client.send_json({
+        'id': 5,
+        'type': wapi.TYPE_GET_TRIGGER_STATS,
+    })
+
+    msg = yield from websocket_client.receive_json()
+    assert msg['id'] == 5
+    assert msg['type'] == wapi.TYPE_RESULT
+    assert msg['success']
+    assert msg['result'] == [{
+        'platform': 'event',
+        'key': 'test_event',
+        'evaluations': 1,
+        'matches': 1,
+    }]
+
+
 @asyncio.coroutine
 def test_ping(websocket_client):
     """Test get_panels command."""
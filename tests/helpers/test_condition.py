@@ -70,6 +70,50 @@ class TestConditionHelper:
         self.hass.states.set('sensor.temperature', 100)
         assert test(self.hass)
 
+    def test_and_condition_evaluates_cheap_first(self):
+        """Test that cheap conditions are evaluated before templates."""
+        test = condition.from_config({
+            'condition': 'and',
+            'conditions': [
+                {
+                    'condition': 'template',
+                    'value_template':
+                        '{{ states.sensor.temperature.state == "100" }}',
+                }, {
+                    'condition': 'state',
+                    'entity_id': 'sensor.temperature',
+                    'state': '100',
+                }
+            ]
+        })
+
+        self.hass.states.set('sensor.temperature', 120)
+
+        with patch('homeassistant.helpers.condition.async_template',
+                   return_value=True) as mock_template:
+            assert not test(self.hass)
+
+        assert not mock_template.called
+
+        self.hass.states.set('sensor.temperature', 100)
+        assert test(self.hass)
+
+    def test_condition_cost(self):
+        """Test the estimated cost of conditions."""
+        state_cond = {'condition': 'state'}
+        template_cond = {'condition': 'template'}
+
+        assert condition.condition_cost(state_cond) < \
+            condition.condition_cost({'condition': 'sun'}) < \
+            condition.condition_cost(template_cond)
+        assert condition.condition_cost({
+            'condition': 'numeric_state', 'value_template': 'x'}) > \
+            condition.condition_cost(template_cond)
+        assert condition.condition_cost({
+            'condition': 'or', 'conditions': [state_cond, template_cond]
+        }) == condition.condition_cost(state_cond) + \
+            condition.condition_cost(template_cond)
+
     def test_or_condition(self):
         """Test the 'or' condition."""
         test = condition.from_config({
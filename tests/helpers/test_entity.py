@@ -191,3 +191,60 @@ def test_warn_slow_update_with_exception(hass):
         assert mock_call().cancel.called
 
         assert update_call
+
+
+@asyncio.coroutine
+def test_unchanged_state_not_written(hass):
+    """Test that an unchanged state is not written again."""
+    ent = entity.Entity()
+    ent.entity_id = 'test.unchanged'
+    ent.hass = hass
+
+    yield from ent.async_update_ha_state()
+
+    with patch.object(hass.states, 'async_set') as mock_set:
+        yield from ent.async_update_ha_state()
+
+    assert not mock_set.called
+
+    # The state was changed by someone else
+    hass.states.async_set('test.unchanged', 'other')
+    yield from ent.async_update_ha_state()
+    assert hass.states.get('test.unchanged').state == 'unknown'
+
+
+@asyncio.coroutine
+def test_cached_static_attributes(hass):
+    """Test that static attributes are read once until invalidated."""
+    class IconEntity(entity.Entity):
+        """Entity with an icon that counts reads."""
+
+        cache_static_attributes = True
+        entity_id = 'test.icon'
+
+        def __init__(self):
+            """Initialize the entity."""
+            self.icon_value = 'mdi:one'
+            self.reads = 0
+
+        @property
+        def icon(self):
+            """Return the icon."""
+            self.reads += 1
+            return self.icon_value
+
+    ent = IconEntity()
+    ent.hass = hass
+
+    yield from ent.async_update_ha_state()
+    ent.icon_value = 'mdi:two'
+    yield from ent.async_update_ha_state()
+
+    assert ent.reads == 1
+    assert hass.states.get('test.icon').attributes['icon'] == 'mdi:one'
+
+    ent.invalidate_static_attributes()
+    yield from ent.async_update_ha_state()
+
+    assert ent.reads == 2
+    assert hass.states.get('test.icon').attributes['icon'] == 'mdi:two'
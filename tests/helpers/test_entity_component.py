@@ -3,6 +3,7 @@
 import asyncio
 from collections import OrderedDict
 import logging
+import threading
 import unittest
 from unittest.mock import patch, Mock, MagicMock
 from datetime import timedelta
@@ -13,7 +14,8 @@ from homeassistant.exceptions import PlatformNotReady
 from homeassistant.components import group
 from homeassistant.helpers.entity import Entity, generate_entity_id
 from homeassistant.helpers.entity_component import (
-    EntityComponent, DEFAULT_SCAN_INTERVAL, SLOW_SETUP_WARNING)
+    EntityComponent, EntityPlatform, DEFAULT_SCAN_INTERVAL,
+    SLOW_SETUP_WARNING)
 from homeassistant.helpers import entity_component
 from homeassistant.setup import setup_component
 
@@ -578,3 +580,217 @@ def test_platform_not_ready(hass):
         yield from hass.async_block_till_done()
         assert len(platform1_setup.mock_calls) == 3
         assert 'test_domain.mod1' in hass.config.components
+
+
+@asyncio.coroutine
+def test_parallel_updates_sync_entities(hass):
+    """Test that sync entities are updated up to parallel_updates at once."""
+    barrier = threading.Barrier(2, timeout=5)
+    updated = []
+
+    class SyncEntity(EntityTest):
+        """Entity that waits for the other entity during update."""
+
+        def update(self):
+            """Wait until both entities are updating."""
+            barrier.wait()
+            updated.append(self)
+
+    def setup_platform(hass, config, add_devices, discovery_info=None):
+        """Set up two polled sync entities."""
+        add_devices([SyncEntity(should_poll=True),
+                     SyncEntity(should_poll=True)])
+
+    loader.set_component('test_domain.platform',
+                         MockPlatform(setup_platform=setup_platform))
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    yield from component.async_setup({
+        DOMAIN: {
+            'platform': 'platform',
+            'parallel_updates': 2,
+        }
+    })
+
+    entity_platform = component._platforms[
+        ('platform', DEFAULT_SCAN_INTERVAL, None, 2, None)]
+    assert entity_platform.parallel_updates == 2
+
+    yield from entity_platform._update_entity_states(None)
+
+    assert len(updated) == 2
+    stats = component.async_scan_stats()
+    assert len(stats) == 1
+    assert stats[0]['platform'] == 'platform'
+    assert stats[0]['scan_count'] == 1
+    assert stats[0]['last_scan_duration'] is not None
+
+
+@asyncio.coroutine
+def test_platforms_by_parallel_updates(hass):
+    """Test that configs differing in parallel_updates get own platforms."""
+    loader.set_component('test_domain.platform', MockPlatform())
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    yield from component.async_setup({
+        DOMAIN: [
+            {'platform': 'platform'},
+            {'platform': 'platform', 'parallel_updates': 3},
+        ]
+    })
+
+    assert sorted(platform.parallel_updates for key, platform
+                  in component._platforms.items() if key != 'core') == [1, 3]
+
+
+@asyncio.coroutine
+def test_adaptive_polling(hass):
+    """Test that entities that do not change are polled less often."""
+    class CountingEntity(EntityTest):
+        """Entity that counts its updates."""
+
+        def __init__(self, change, **values):
+            """Initialize the entity."""
+            super().__init__(**values)
+            self.change = change
+            self.updates = 0
+            self.count = 0
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self.count
+
+        def update(self):
+            """Update the entity."""
+            self.updates += 1
+            if self.change:
+                self.count += 1
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entity_platform = EntityPlatform(
+        component, 'platform', timedelta(seconds=10), None,
+        max_scan_interval=timedelta(seconds=40))
+    static = CountingEntity(False, should_poll=True, entity_id='test.static')
+    active = CountingEntity(True, should_poll=True, entity_id='test.active')
+
+    with patch('homeassistant.helpers.entity_component.random.uniform',
+               return_value=5) as mock_uniform:
+        yield from entity_platform.async_add_entities([static, active])
+
+    assert mock_uniform.called
+
+    for _ in range(7):
+        yield from entity_platform._update_entity_states(None)
+
+    assert static.updates == 3
+    assert active.updates == 7
+    assert entity_platform.async_poll_intervals() == {
+        'test.static': 40,
+        'test.active': 10,
+    }
+
+
+@asyncio.coroutine
+def test_adaptive_polling_force_update(hass):
+    """Test that entities with force_update back off when unchanged."""
+    class ForcedEntity(EntityTest):
+        """Entity that writes its state on every update."""
+
+        @property
+        def force_update(self):
+            """Write the state even if it did not change."""
+            return True
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entity_platform = EntityPlatform(
+        component, 'platform', timedelta(seconds=10), None,
+        max_scan_interval=timedelta(seconds=40))
+    entity = ForcedEntity(should_poll=True, entity_id='test.forced')
+    yield from entity_platform.async_add_entities([entity])
+
+    for _ in range(3):
+        yield from entity_platform._update_entity_states(None)
+
+    assert entity_platform.async_poll_intervals() == {'test.forced': 40}
+
+
+@asyncio.coroutine
+def test_call_entity_service_concurrently(hass):
+    """Test that a service method is called on all entities at once."""
+    started = []
+    release = asyncio.Event(loop=hass.loop)
+
+    class AsyncEntity(EntityTest):
+        """Entity that waits until all entities were called."""
+
+        @asyncio.coroutine
+        def async_update(self):
+            """Update the entity."""
+            pass
+
+        @asyncio.coroutine
+        def async_turn_on(self, brightness=None):
+            """Wait for the other entities."""
+            started.append((self.entity_id, brightness))
+            if len(started) == 3:
+                release.set()
+            yield from release.wait()
+
+    class FailingEntity(AsyncEntity):
+        """Entity that fails to turn on."""
+
+        @asyncio.coroutine
+        def async_turn_on(self, brightness=None):
+            """Fail after the other entities were called."""
+            yield from super().async_turn_on(brightness)
+            raise ValueError('device offline')
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entities = [AsyncEntity(name='one'), AsyncEntity(name='two'),
+                FailingEntity(name='three')]
+    yield from component.async_add_entities(entities)
+
+    with patch.object(component.logger, 'error') as mock_error:
+        yield from asyncio.wait_for(component.async_call_entity_service(
+            entities, 'async_turn_on', brightness=100), 5, loop=hass.loop)
+
+    assert sorted(started) == [('test_domain.one', 100),
+                               ('test_domain.three', 100),
+                               ('test_domain.two', 100)]
+    assert mock_error.call_count == 1
+    assert mock_error.call_args[0][2:4] == (1, 3)
+    assert 'test_domain.three: device offline' in mock_error.call_args[0][4]
+
+
+@asyncio.coroutine
+def test_call_entity_service_batch(hass):
+    """Test that platforms can handle a service method in one batch."""
+    batches = []
+
+    @asyncio.coroutine
+    def async_batch_turn_on(hass, entities, **kwargs):
+        """Turn on all entities at once."""
+        batches.append(([entity.entity_id for entity in entities], kwargs))
+
+    def setup_platform(hass, config, add_devices, discovery_info=None):
+        """Set up two entities."""
+        add_devices([EntityTest(name='one'), EntityTest(name='two')])
+
+    platform = MockPlatform(setup_platform=setup_platform)
+    platform.async_batch_turn_on = async_batch_turn_on
+    loader.set_component('test_domain.platform', platform)
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    yield from component.async_setup({
+        DOMAIN: {
+            'platform': 'platform',
+        }
+    })
+
+    yield from component.async_call_entity_service(
+        list(component.entities.values()), 'async_turn_on', brightness=50)
+
+    assert len(batches) == 1
+    assert sorted(batches[0][0]) == ['test_domain.one', 'test_domain.two']
+    assert batches[0][1] == {'brightness': 50}
@@ -19,8 +19,10 @@ from homeassistant.helpers.event import (
     track_template,
     track_sunrise,
     track_sunset,
+    RateLimitedJob,
 )
 from homeassistant.helpers.template import Template
+from homeassistant.util.async import run_callback_threadsafe
 from homeassistant.components import sun
 import homeassistant.util.dt as dt_util
 
@@ -262,6 +264,114 @@ class TestEventHelpers(unittest.TestCase):
         self.assertEqual(2, len(wildcard_runs))
         self.assertEqual(2, len(wildercard_runs))
 
+    def test_track_template_tracks_read_states(self):
+        """Test that only states read by the template are tracked."""
+        runs = []
+        tpl = Template(
+            "{{ is_state('switch.first', 'on') and "
+            "is_state('switch.second', 'on') }}", self.hass)
+
+        self.hass.states.set('switch.first', 'off')
+        self.hass.states.set('switch.second', 'on')
+
+        track_template(self.hass, tpl, lambda *args: runs.append(args))
+
+        with patch.object(tpl, 'async_render_to_info',
+                          wraps=tpl.async_render_to_info) as mock_render:
+            # Not read as the first switch is off
+            self.hass.states.set('switch.second', 'off')
+            self.hass.states.set('light.kitchen', 'on')
+            self.hass.block_till_done()
+            self.assertEqual(0, mock_render.call_count)
+
+            self.hass.states.set('switch.first', 'on')
+            self.hass.block_till_done()
+            self.assertEqual(1, mock_render.call_count)
+            self.assertEqual(0, len(runs))
+
+            # Now the second switch has been read
+            self.hass.states.set('switch.second', 'on')
+            self.hass.block_till_done()
+            self.assertEqual(2, mock_render.call_count)
+            self.assertEqual(1, len(runs))
+
+    def test_track_template_rate_limited(self):
+        """Test that templates reading a domain are rate limited."""
+        runs = []
+        tpl = Template(
+            "{{ states.light | selectattr('state', 'eq', 'on') | list "
+            "| count > 1 }}", self.hass)
+
+        track_template(self.hass, tpl, lambda *args: runs.append(args))
+
+        with patch.object(tpl, 'async_render_to_info',
+                          wraps=tpl.async_render_to_info) as mock_render:
+            self.hass.states.set('light.kitchen', 'on')
+            self.hass.block_till_done()
+            self.assertEqual(1, mock_render.call_count)
+
+            # Within the rate limit, collapsed into one pending render
+            self.hass.states.set('light.hallway', 'on')
+            self.hass.states.set('light.bedroom', 'on')
+            self.hass.block_till_done()
+            self.assertEqual(1, mock_render.call_count)
+            self.assertEqual(0, len(runs))
+
+    def test_rate_limited_job(self):
+        """Test that a rate limited job collapses requests."""
+        runs = []
+
+        @ha.callback
+        def job():
+            """Record a run."""
+            runs.append(1)
+
+        rate_limited = RateLimitedJob(self.hass, job, timedelta(seconds=10))
+
+        def schedule():
+            """Request runs from within the event loop."""
+            rate_limited.async_schedule()
+            rate_limited.async_schedule()
+
+        run_callback_threadsafe(self.hass.loop, schedule).result()
+        self.assertEqual(1, len(runs))
+
+        # Second request is pending till the interval has passed
+        run_callback_threadsafe(self.hass.loop, schedule).result()
+        self.assertEqual(1, len(runs))
+
+        run_callback_threadsafe(
+            self.hass.loop, rate_limited.async_cancel).result()
+
+        run_callback_threadsafe(
+            self.hass.loop, rate_limited.async_schedule,
+            timedelta(0)).result()
+        self.assertEqual(2, len(runs))
+
+    def test_rate_limited_coroutine_job(self):
+        """Test that pending coroutine jobs are collapsed."""
+        runs = []
+
+        @asyncio.coroutine
+        def job():
+            """Record a run."""
+            runs.append(1)
+
+        rate_limited = RateLimitedJob(self.hass, job)
+
+        def schedule():
+            """Request runs from within the event loop."""
+            rate_limited.async_schedule()
+            rate_limited.async_schedule()
+
+        run_callback_threadsafe(self.hass.loop, schedule).result()
+        self.hass.block_till_done()
+        self.assertEqual(1, len(runs))
+
+        run_callback_threadsafe(self.hass.loop, schedule).result()
+        self.hass.block_till_done()
+        self.assertEqual(2, len(runs))
+
     def test_track_time_interval(self):
         """Test tracking time interval."""
         specific_runs = []
@@ -1,9 +1,11 @@
 """Test component helpers."""
 # pylint: disable=protected-access
 from collections import OrderedDict
+from datetime import timedelta
 import unittest
 
 from homeassistant import helpers
+from homeassistant.helpers.template import Template
 
 from tests.common import get_test_home_assistant
 
@@ -48,3 +50,19 @@ class TestHelpers(unittest.TestCase):
             (None, 1),
             ('hello 2', config['zone Hallo'][1]),
         ] == list(helpers.config_per_platform(config, 'zone'))
+
+    def test_config_hash(self):
+        """Test hashing of validated config."""
+        def config(template, delay=5):
+            """Return a config block."""
+            return {
+                'value_template': Template(template),
+                'delay': timedelta(seconds=delay),
+            }
+
+        assert helpers.config_hash(config('{{ 1 }}')) == \
+            helpers.config_hash(config('{{ 1 }}'))
+        assert helpers.config_hash(config('{{ 1 }}')) != \
+            helpers.config_hash(config('{{ 2 }}'))
+        assert helpers.config_hash(config('{{ 1 }}')) != \
+            helpers.config_hash(config('{{ 1 }}', 6))
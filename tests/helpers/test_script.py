@@ -1,5 +1,6 @@
 """The tests for the Script component."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import timedelta
 from unittest import mock
 import unittest
@@ -145,6 +146,48 @@ class TestScriptHelper(unittest.TestCase):
         assert not script_obj.is_running
         assert len(events) == 2
 
+    def test_trace(self):
+        """Test that runs are traced step by step."""
+        event = 'test_event'
+        self.hass.services.register('test', 'script', lambda call: None)
+
+        script_obj = script.Script(self.hass, cv.SCRIPT_SCHEMA([
+            {'event': event, 'alias': 'Fire'},
+            {'service': 'test.script'},
+            {'delay': {'seconds': 5}},
+            {'condition': 'template', 'value_template': '{{ false }}'},
+            {'event': event}]), trace_length=1)
+
+        script_obj.run()
+        self.hass.block_till_done()
+
+        assert script_obj.traces.run_count == 1
+        trace = script_obj.traces.traces[-1]
+        assert trace.result is None
+        assert trace.action_latency is not None
+        assert [(step['index'], step['type'], step['alias'])
+                for step in trace.steps] == [
+                    (0, 'event', 'Fire'), (1, 'service', None)]
+
+        future = dt_util.utcnow() + timedelta(seconds=5)
+        fire_time_changed(self.hass, future)
+        self.hass.block_till_done()
+
+        assert [step['type'] for step in trace.steps] == [
+            'event', 'service', 'delay', 'condition']
+        assert trace.result == script.RESULT_CONDITION_FAILED
+        assert trace.duration is not None
+        assert script_obj.traces.last_duration is not None
+
+        script_obj.run()
+        self.hass.block_till_done()
+        script_obj.stop()
+
+        assert script_obj.traces.run_count == 2
+        assert len(script_obj.traces.traces) == 1
+        assert script_obj.traces.traces[-1].result == script.RESULT_STOPPED
+        assert script_obj.traces.as_dict()['run_count'] == 2
+
     def test_delay_template(self):
         """Test the delay as a template."""
         event = 'test_evnt'
@@ -503,3 +546,65 @@ class TestScriptHelper(unittest.TestCase):
             self.hass.block_till_done()
 
         assert script_obj.last_triggered == time
+
+
+@asyncio.coroutine
+def test_parallel_block(hass, caplog):
+    """Test that the steps of a parallel block run concurrently."""
+    started = []
+    events = []
+    release = asyncio.Event(loop=hass.loop)
+
+    @asyncio.coroutine
+    def slow_service(call):
+        """Wait until both calls have been started."""
+        started.append(call.data['name'])
+        if len(started) == 2:
+            release.set()
+        yield from release.wait()
+
+    hass.services.async_register('test', 'slow', slow_service)
+    hass.bus.async_listen('test_done', events.append)
+
+    script_obj = script.Script(hass, cv.SCRIPT_SCHEMA([
+        {'parallel': [
+            {'service': 'test.slow', 'data': {'name': 'a'}},
+            {'service': 'test.slow', 'data': {'name': 'b'}},
+            {'alias': 'Broken', 'service': 'test.slow',
+             'data_template': {'name': '{{ undefined.attr }}'}},
+        ]},
+        {'event': 'test_done'}]))
+
+    yield from asyncio.wait_for(script_obj.async_run(), 1, loop=hass.loop)
+    yield from hass.async_block_till_done()
+
+    assert sorted(started) == ['a', 'b']
+    assert len(events) == 1
+    assert 'Error executing step Broken of parallel' in caplog.text
+    assert [step['type'] for step in script_obj.traces.traces[-1].steps] \
+        == ['parallel', 'event']
+
+
+@asyncio.coroutine
+def test_non_blocking_service(hass):
+    """Test that a non-blocking service call does not wait."""
+    release = asyncio.Event(loop=hass.loop)
+    events = []
+
+    @asyncio.coroutine
+    def slow_service(call):
+        """Wait until released."""
+        yield from release.wait()
+
+    hass.services.async_register('test', 'slow', slow_service)
+    hass.bus.async_listen('test_done', events.append)
+
+    script_obj = script.Script(hass, cv.SCRIPT_SCHEMA([
+        {'service': 'test.slow', 'blocking': False},
+        {'event': 'test_done'}]))
+
+    yield from asyncio.wait_for(script_obj.async_run(), 1, loop=hass.loop)
+    release.set()
+    yield from hass.async_block_till_done()
+
+    assert len(events) == 1
@@ -225,3 +225,15 @@ class TestSun(unittest.TestCase):
             datetime(2016, 7, 26, 22, 19, 1, tzinfo=dt_util.UTC)
         assert sun.get_astral_event_date(self.hass, 'sunrise', june) is None
         assert sun.get_astral_event_date(self.hass, 'sunset', june) is None
+
+    def test_date_events_cached(self):
+        """Test that events for a date are only calculated once."""
+        date = datetime(2016, 11, 1).date()
+        location = sun.get_astral_location(self.hass)
+        sunrise = sun.get_astral_event_date(self.hass, 'sunrise', date)
+
+        with patch.object(location, 'sunrise') as mock_sunrise:
+            self.assertEqual(sunrise, sun.get_astral_event_date(
+                self.hass, 'sunrise', date))
+
+        self.assertFalse(mock_sunrise.called)
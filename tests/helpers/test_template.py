@@ -308,6 +308,29 @@ class TestHelpersTemplate(unittest.TestCase):
         with self.assertRaises(TemplateError):
             template.Template('{{ invalid_syntax').ensure_valid()
 
+    def test_compiled_template_shared(self):
+        """Test that templates with the same source share compilation."""
+        tpl1 = template.Template('{{ value_json.temperature }}', self.hass)
+        tpl2 = template.Template('{{ value_json.temperature }}', self.hass)
+
+        self.assertEqual(
+            '21', tpl1.render_with_possible_json_value('{"temperature": 21}'))
+        self.assertEqual(
+            '22', tpl2.render_with_possible_json_value('{"temperature": 22}'))
+
+        self.assertIs(tpl1._compiled_code, tpl2._compiled_code)
+        self.assertIs(tpl1._compiled, tpl2._compiled)
+
+    def test_template_globals_shared(self):
+        """Test that the template globals are created once per instance."""
+        tpl1 = template.Template('{{ states | count }}', self.hass)
+        tpl2 = template.Template('{{ states.sensor | count }}', self.hass)
+        tpl1.render()
+        tpl2.render()
+
+        self.assertIs(tpl1._compiled.globals['states'],
+                      tpl2._compiled.globals['states'])
+
     def test_if_state_exists(self):
         """Test if state exists works."""
         self.hass.states.set('test.object', 'available')
@@ -750,3 +773,69 @@ is_state_attr('device_tracker.phone_2', 'battery', 40)
                 " > (states('input_slider.luftfeuchtigkeit') | int +1.5)"
                 " %}true{% endif %}"
             )))
+
+    def test_render_to_info_entities(self):
+        """Test that the entities read during a render are recorded."""
+        info = template.Template("""
+{% if is_state('device_tracker.phone_1', 'home') %}
+    {{ states.sensor.temperature.state }}
+{% else %}
+    {{ states('sensor.humidity') }}
+{% endif %}
+            """, self.hass).async_render_to_info()
+
+        self.assertIsNone(info.exception)
+        self.assertEqual({'device_tracker.phone_1', 'sensor.humidity'},
+                         info.entities)
+        self.assertFalse(info.all_states)
+        self.assertTrue(info.filter('sensor.humidity'))
+        self.assertFalse(info.filter('sensor.temperature'))
+
+    def test_render_to_info_domains(self):
+        """Test that iterating a domain or all states is recorded."""
+        self.hass.states.set('sensor.one', 'on')
+
+        info = template.Template(
+            '{{ states.sensor | selectattr("state", "eq", "on") | list '
+            '| count }}', self.hass).async_render_to_info()
+
+        self.assertEqual('1', info.result)
+        self.assertEqual({'sensor'}, info.domains)
+        self.assertTrue(info.filter('sensor.two'))
+        self.assertFalse(info.filter('light.kitchen'))
+
+        info = template.Template(
+            '{{ states | count }}', self.hass).async_render_to_info()
+        self.assertTrue(info.all_states)
+        self.assertTrue(info.filter('light.kitchen'))
+
+    def test_render_to_info_closest(self):
+        """Test that closest records the states it looked at."""
+        self.hass.states.set('test_domain.object', 'happy', {
+            'latitude': self.hass.config.latitude + 0.1,
+            'longitude': self.hass.config.longitude + 0.1,
+        })
+
+        info = template.Template(
+            '{{ closest(states.test_domain).entity_id }}',
+            self.hass).async_render_to_info()
+
+        self.assertEqual('test_domain.object', info.result)
+        self.assertEqual({'test_domain'}, info.domains)
+
+    def test_render_to_info_no_states(self):
+        """Test that templates not reading states match every change."""
+        info = template.Template(
+            '{{ now().hour > 25 }}', self.hass).async_render_to_info()
+
+        self.assertEqual('False', info.result)
+        self.assertTrue(info.filter('light.kitchen'))
+
+    def test_render_to_info_exception(self):
+        """Test that errors are stored on the render info."""
+        info = template.Template(
+            '{{ states.sensor.missing.state | round }}',
+            self.hass).async_render_to_info()
+
+        self.assertIsNotNone(info.exception)
+        self.assertEqual({'sensor.missing'}, info.entities)
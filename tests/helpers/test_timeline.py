@@ -0,0 +1,122 @@
+"""Test the startup timeline helper."""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+from homeassistant import loader, setup
+from homeassistant.helpers import timeline
+
+from tests.common import MockModule
+
+
+def test_span_and_as_dict():
+    """Test recording spans."""
+    startup_timeline = timeline.Timeline()
+
+    with startup_timeline.span('light', timeline.PHASE_SETUP):
+        pass
+    startup_timeline.add('light.hue', timeline.PHASE_IMPORT,
+                         startup_timeline.start - 1, startup_timeline.start)
+
+    data = startup_timeline.as_dict()
+    assert data['duration'] is None
+    assert [(span['name'], span['phase']) for span in data['spans']] == [
+        ('light.hue', timeline.PHASE_IMPORT),
+        ('light', timeline.PHASE_SETUP),
+    ]
+    assert data['spans'][0]['start'] == -1
+    assert data['spans'][0]['duration'] == 1
+
+    startup_timeline.finish()
+    assert startup_timeline.as_dict()['duration'] >= 0
+
+
+def test_save_and_load(tmpdir):
+    """Test writing a timeline and reading it back."""
+    path = str(tmpdir.join(timeline.TIMELINE_FILENAME))
+    startup_timeline = timeline.Timeline()
+    startup_timeline.add('light', timeline.PHASE_SETUP,
+                         startup_timeline.start)
+    startup_timeline.finish()
+
+    timeline.save_timeline(path, startup_timeline.as_dict())
+
+    assert timeline.load_timeline(path) == startup_timeline.as_dict()
+
+
+def test_oldest_spans_dropped():
+    """Test that the newest spans are kept once the timeline is full."""
+    with patch('homeassistant.helpers.timeline.MAX_SPANS', 2):
+        startup_timeline = timeline.Timeline()
+
+    for name in ('first', 'second', 'third'):
+        startup_timeline.add(name, timeline.PHASE_SETUP,
+                             startup_timeline.start)
+
+    assert [span['name'] for span in startup_timeline.as_dict()['spans']] \
+        == ['second', 'third']
+
+
+@asyncio.coroutine
+def test_setup_component_records_phases(hass):
+    """Test that setting up a component records its phases."""
+    loader.set_component('comp_dep', MockModule('comp_dep'))
+    loader.set_component('comp', MockModule('comp', ['comp_dep']))
+
+    yield from setup.async_setup_component(hass, 'comp', {})
+
+    phases = [span['phase'] for span
+              in timeline.async_get_timeline(hass).as_dict()['spans']
+              if span['name'] == 'comp']
+    assert phases == [timeline.PHASE_CONFIG, timeline.PHASE_DEPENDENCIES,
+                      timeline.PHASE_SETUP]
+
+
+@asyncio.coroutine
+def test_setup_components_records_import_and_dependencies(hass):
+    """Test the spans of imports and waiting for dependencies."""
+    @asyncio.coroutine
+    def async_setup_slow(hass, config):
+        """Take a while to set up."""
+        yield from asyncio.sleep(0.05, loop=hass.loop)
+        return True
+
+    def import_slowly(path):
+        """Take a while to import a component."""
+        time.sleep(0.05)
+        module = MockModule('slow_import')
+        module.__spec__ = MagicMock(origin=path)
+        return module
+
+    loader.set_component('slow_dep', MockModule(
+        'slow_dep', async_setup=async_setup_slow))
+    loader.set_component('comp', MockModule('comp', ['slow_dep']))
+
+    with patch('homeassistant.loader.importlib.import_module',
+               side_effect=import_slowly), \
+            patch('homeassistant.loader.AVAILABLE_COMPONENTS',
+                  ['homeassistant.components.slow_import']):
+        yield from setup.async_setup_components(
+            hass, ['comp', 'slow_import'], {})
+
+    spans = {(span['name'], span['phase']): span['duration'] for span
+             in timeline.async_get_timeline(hass).as_dict()['spans']}
+    assert spans[('slow_import', timeline.PHASE_IMPORT)] >= 0.04
+    assert spans[('comp', timeline.PHASE_DEPENDENCIES)] >= 0.04
+    assert ('comp', timeline.PHASE_IMPORT) not in spans
+
+
+@asyncio.coroutine
+def test_setup_components_records_first_components(hass):
+    """Test that waiting for the first components is its own phase."""
+    loader.set_component('comp_first', MockModule('comp_first'))
+    loader.set_component('comp', MockModule('comp'))
+
+    yield from setup.async_setup_components(
+        hass, ['comp', 'comp_first'], {}, first=['comp_first'])
+
+    spans = [(span['name'], span['phase']) for span
+             in timeline.async_get_timeline(hass).as_dict()['spans']]
+    assert ('comp', timeline.PHASE_FIRST) in spans
+    assert ('comp', timeline.PHASE_DEPENDENCIES) not in spans
+    assert ('comp_first', timeline.PHASE_FIRST) not in spans
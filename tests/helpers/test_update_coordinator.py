@@ -0,0 +1,110 @@
+"""Tests for the update coordinator helper."""
+import asyncio
+from datetime import timedelta
+import logging
+
+from homeassistant.core import callback
+from homeassistant.exceptions import UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+INTERVAL = timedelta(seconds=10)
+
+
+@asyncio.coroutine
+def test_refresh_notifies_listeners(hass):
+    """Test that all listeners are notified by one fetch."""
+    fetches = []
+    updates = []
+
+    @asyncio.coroutine
+    def fetch():
+        """Fetch the data."""
+        fetches.append(None)
+        return len(fetches)
+
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, 'test', fetch,
+                                        INTERVAL)
+    coordinator.async_add_listener(callback(lambda: updates.append(1)))
+    remove = coordinator.async_add_listener(
+        callback(lambda: updates.append(2)))
+
+    yield from coordinator.async_refresh()
+    assert coordinator.data == 1
+    assert sorted(updates) == [1, 2]
+
+    remove()
+    async_fire_time_changed(hass, dt_util.utcnow() + INTERVAL)
+    yield from hass.async_block_till_done()
+
+    assert coordinator.data == 2
+    assert sorted(updates) == [1, 1, 2]
+
+
+@asyncio.coroutine
+def test_concurrent_refresh_collapsed(hass):
+    """Test that concurrent refreshes share one fetch."""
+    fetches = []
+    release = asyncio.Event(loop=hass.loop)
+
+    @asyncio.coroutine
+    def fetch():
+        """Fetch the data after being released."""
+        fetches.append(None)
+        yield from release.wait()
+        return 'data'
+
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, 'test', fetch,
+                                        INTERVAL)
+
+    refreshes = [hass.async_add_job(coordinator.async_refresh())
+                 for _ in range(3)]
+    yield from asyncio.sleep(0, loop=hass.loop)
+    release.set()
+    yield from asyncio.wait(refreshes, loop=hass.loop)
+
+    assert len(fetches) == 1
+    assert coordinator.data == 'data'
+
+
+@asyncio.coroutine
+def test_failed_fetch_backs_off(hass):
+    """Test that failed fetches keep the data and back off."""
+    results = ['data', UpdateFailed('broken')]
+    updates = []
+
+    def fetch():
+        """Fetch the data in the executor."""
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    coordinator = DataUpdateCoordinator(hass, _LOGGER, 'test', fetch,
+                                        INTERVAL)
+    coordinator.async_add_listener(callback(lambda: updates.append(None)))
+
+    yield from coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+    yield from coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.failures == 1
+    assert coordinator.data == 'data'
+    assert len(updates) == 2
+
+    results.append('new data')
+
+    # The next fetch is scheduled after twice the interval
+    async_fire_time_changed(hass, dt_util.utcnow() + INTERVAL)
+    yield from hass.async_block_till_done()
+    assert coordinator.data == 'data'
+
+    async_fire_time_changed(hass, dt_util.utcnow() + INTERVAL * 2)
+    yield from hass.async_block_till_done()
+    assert coordinator.data == 'new data'
+    assert coordinator.failures == 0
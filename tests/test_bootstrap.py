@@ -6,10 +6,10 @@ from unittest.mock import Mock, patch
 import logging
 
 import homeassistant.config as config_util
-from homeassistant import bootstrap
+from homeassistant import bootstrap, loader
 import homeassistant.util.dt as dt_util
 
-from tests.common import patch_yaml_files, get_test_config_dir
+from tests.common import patch_yaml_files, get_test_config_dir, MockModule
 
 ORIG_TIMEZONE = dt_util.DEFAULT_TIME_ZONE
 VERSION_PATH = os.path.join(get_test_config_dir(), config_util.VERSION_FILE)
@@ -27,7 +27,9 @@ _LOGGER = logging.getLogger(__name__)
 @patch('os.access', Mock(return_value=True))
 @patch('homeassistant.bootstrap.async_enable_logging',
        Mock(return_value=True))
-def test_from_config_file(hass):
+@patch('homeassistant.bootstrap.load_cache')
+@patch('homeassistant.bootstrap.save_cache')
+def test_from_config_file(mock_save_cache, mock_load_cache, hass):
     """Test with configuration file."""
     components = set(['browser', 'conversation', 'script'])
     files = {
@@ -39,6 +41,10 @@ def test_from_config_file(hass):
 
     assert components == hass.config.components
 
+    cache_path = hass.config.path(config_util.YAML_CACHE_FILE)
+    mock_load_cache.assert_called_once_with(cache_path)
+    mock_save_cache.assert_called_once_with(cache_path)
+
 
 @asyncio.coroutine
 @patch('homeassistant.bootstrap.async_enable_logging', Mock())
@@ -52,3 +58,49 @@ def test_home_assistant_core_config_validation(hass):
         }
     }, hass)
     assert result is None
+
+
+@asyncio.coroutine
+@patch(
+    'homeassistant.bootstrap.conf_util.process_ha_config_upgrade', Mock())
+@patch('homeassistant.util.location.detect_location_info',
+       Mock(return_value=None))
+@patch('homeassistant.bootstrap.async_enable_logging', Mock())
+@patch('homeassistant.bootstrap.async_register_signal_handling', Mock())
+def test_slow_setup_jobs_do_not_block_startup(hass):
+    """Test jobs started by a component do not block startup forever."""
+    release = asyncio.Event(loop=hass.loop)
+
+    @asyncio.coroutine
+    def slow_job():
+        """Wait until the test releases the job."""
+        yield from release.wait()
+
+    @asyncio.coroutine
+    def setup_comp(hass, config):
+        """Start a tracked job that outlives the setup."""
+        hass.async_add_job(slow_job())
+        return True
+
+    loader.set_component('comp_slow_job', MockModule(
+        'comp_slow_job', async_setup=setup_comp))
+
+    with patch('homeassistant.bootstrap.COMPONENT_SETUP_TIMEOUT', 0.01), \
+            patch('homeassistant.bootstrap._LOGGER.warning') as mock_warn:
+        result = yield from bootstrap.async_from_config_dict({
+            'homeassistant': {},
+            'comp_slow_job': {},
+        }, hass)
+
+    assert result is hass
+    assert 'comp_slow_job' in hass.config.components
+    assert any('Jobs started during setup' in call[0][0]
+               for call in mock_warn.call_args_list)
+    assert not release.is_set()
+
+    # The job is no longer tracked, so firing start does not wait for it
+    assert not hass._pending_tasks
+    yield from hass.async_block_till_done()
+    assert not release.is_set()
+
+    release.set()
@@ -13,7 +13,8 @@ import pytest
 
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
-from homeassistant.util.async import run_coroutine_threadsafe
+from homeassistant.util.async import (
+    run_callback_threadsafe, run_coroutine_threadsafe)
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import (METRIC_SYSTEM)
 from homeassistant.const import (
@@ -112,6 +113,33 @@ def test_stage_shutdown():
     assert len(test_all) == 1
 
 
+@asyncio.coroutine
+def test_async_block_till_done_timeout(hass):
+    """Test that tasks still running after the timeout are untracked."""
+    release = asyncio.Event(loop=hass.loop)
+
+    @asyncio.coroutine
+    def slow_job():
+        """Wait until the test releases the job."""
+        yield from release.wait()
+
+    @asyncio.coroutine
+    def fast_job():
+        """Finish right away."""
+        pass
+
+    hass.async_add_job(fast_job())
+    assert (yield from hass.async_block_till_done(0.01))
+
+    task = hass.async_add_job(slow_job())
+    assert not (yield from hass.async_block_till_done(0.01))
+    assert not task.done()
+    assert not hass._pending_tasks
+
+    release.set()
+    yield from task
+
+
 class TestHomeAssistant(unittest.TestCase):
     """Test the Home Assistant core classes."""
 
@@ -513,6 +541,49 @@ class TestStateMachine(unittest.TestCase):
         self.assertEqual(1, len(ent_ids))
         self.assertTrue('light.bowl' in ent_ids)
 
+    def test_domain_index(self):
+        """Test the domain index is kept up to date."""
+        self.states.set('light.Kitchen', 'on')
+        self.states.set('light.attic', 'on')
+        self.states.set('light.kitchen', 'off')
+
+        self.assertEqual(['light.attic', 'light.bowl', 'light.kitchen'],
+                         self.states.entity_ids('light'))
+        self.assertEqual(['light', 'switch'],
+                         run_callback_threadsafe(
+                             self.hass.loop, self.states.async_domains
+                         ).result())
+
+        self.states.remove('light.bowl')
+        self.states.remove('switch.ac')
+
+        self.assertEqual(['light.attic', 'light.kitchen'],
+                         self.states.entity_ids('light'))
+        self.assertEqual([], self.states.entity_ids('switch'))
+        self.assertEqual(['light'],
+                         run_callback_threadsafe(
+                             self.hass.loop, self.states.async_domains
+                         ).result())
+
+    def test_async_sorted(self):
+        """Test getting the states sorted by entity id."""
+        self.states.set('light_extra.hallway', 'on')
+        self.states.set('light.attic', 'on')
+        self.states.set('alarm.house', 'armed')
+
+        states = run_callback_threadsafe(
+            self.hass.loop, self.states.async_sorted).result()
+        self.assertEqual(
+            ['alarm.house', 'light.attic', 'light.bowl',
+             'light_extra.hallway', 'switch.ac'],
+            [state.entity_id for state in states])
+
+        states = run_callback_threadsafe(
+            self.hass.loop, self.states.async_sorted, 'light').result()
+        self.assertEqual(
+            ['light.attic', 'light.bowl'],
+            [state.entity_id for state in states])
+
     def test_all(self):
         """Test everything."""
         states = sorted(state.entity_id for state in self.states.all())
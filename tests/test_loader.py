@@ -59,6 +59,21 @@ class TestLoader(unittest.TestCase):
         # Try to get load order for non-existing component
         self.assertEqual([], loader.load_order_component('mod1'))
 
+    def test_dependency_graph(self):
+        """Test the dependency graph of a set of components."""
+        loader.set_component('mod1', MockModule('mod1', ['config']))
+        loader.set_component('mod2', MockModule('mod2', ['mod1']))
+        loader.set_component('mod3', MockModule('mod3', ['mod1', 'mod2']))
+        loader.set_component('mod4', MockModule('mod4', ['nonexisting']))
+
+        graph = loader.dependency_graph(['mod3', 'mod4'])
+
+        self.assertEqual(['mod1', 'mod2', 'mod3', 'mod4'], list(graph))
+        self.assertEqual([], graph['mod1'])
+        self.assertEqual(['mod1'], graph['mod2'])
+        self.assertEqual(['mod1', 'mod2'], graph['mod3'])
+        self.assertEqual([], graph['mod4'])
+
 
 def test_component_loader(hass):
     """Test loading components."""
@@ -4,7 +4,10 @@ import unittest
 
 from homeassistant import remote, setup, core as ha
 import homeassistant.components.http as http
-from homeassistant.const import HTTP_HEADER_HA_AUTH, EVENT_STATE_CHANGED
+from homeassistant.const import (
+    HTTP_HEADER_HA_AUTH, EVENT_STATE_CHANGED, URL_API)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.async import run_coroutine_threadsafe
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -73,6 +76,33 @@ class TestRemoteMethods(unittest.TestCase):
         self.assertEqual(
             remote.APIStatus.CANNOT_CONNECT, remote.validate_api(broken_api))
 
+    def test_session_reused(self):
+        """Test that the API keeps using the same session."""
+        api = remote.API('127.0.0.1', API_PASSWORD, MASTER_PORT, pool_size=2)
+        session = api.session
+
+        self.assertEqual(remote.APIStatus.OK, remote.validate_api(api))
+        self.assertEqual(remote.APIStatus.OK,
+                         remote.validate_api(api, force_validate=True))
+        self.assertIs(session, api.session)
+        self.assertEqual(
+            2, session.get_adapter(HTTP_BASE_URL)._pool_maxsize)
+
+        api.close()
+        self.assertIsNot(session, api.session)
+
+    def test_async_call(self):
+        """Test calling the API from within the event loop."""
+        req = run_coroutine_threadsafe(
+            master_api.async_call(hass, remote.METHOD_GET, URL_API),
+            hass.loop).result()
+        self.assertEqual(200, req.status)
+
+        with self.assertRaises(HomeAssistantError):
+            run_coroutine_threadsafe(
+                broken_api.async_call(hass, remote.METHOD_GET, URL_API),
+                hass.loop).result()
+
     def test_get_event_listeners(self):
         """Test Python API get_event_listeners."""
         local_data = hass.bus.listeners
@@ -150,6 +180,23 @@ class TestRemoteMethods(unittest.TestCase):
         hass.block_till_done()
         self.assertEqual(2, len(events))
 
+    def test_set_states(self):
+        """Test Python API set_states."""
+        self.assertEqual([True, True, False], remote.set_states(master_api, [
+            {'entity_id': 'test.batch_1', 'state': 'on'},
+            {'entity_id': 'test.batch_2', 'state': 'off',
+             'attributes': {'hello': 'world'}},
+            {'entity_id': 'invalid', 'state': 'on'},
+        ]))
+
+        self.assertEqual('on', hass.states.get('test.batch_1').state)
+        state = hass.states.get('test.batch_2')
+        self.assertEqual('off', state.state)
+        self.assertEqual('world', state.attributes['hello'])
+
+        self.assertEqual([False], remote.set_states(broken_api, [
+            {'entity_id': 'test.batch_1', 'state': 'on'}]))
+
     def test_is_state(self):
         """Test Python API is_state."""
         self.assertTrue(
@@ -191,6 +238,32 @@ class TestRemoteMethods(unittest.TestCase):
         # Should not raise an exception
         remote.call_service(broken_api, "test_domain", "test_service")
 
+    def test_call_services(self):
+        """Test Python API call_services."""
+        calls = []
+
+        @ha.callback
+        def listener(service_call):
+            """Helper method that will verify that our service got called."""
+            calls.append(service_call)
+
+        hass.services.register("test_domain", "test_batch", listener)
+
+        self.assertEqual([True, True, False], remote.call_services(
+            master_api, [
+                {'domain': 'test_domain', 'service': 'test_batch'},
+                {'domain': 'test_domain', 'service': 'test_batch',
+                 'service_data': {'hello': 'world'}},
+                {'domain': 'test_domain', 'service': 'non_existing'},
+            ]))
+
+        hass.block_till_done()
+
+        self.assertEqual(2, len(calls))
+
+        self.assertEqual([False], remote.call_services(
+            broken_api, [{'domain': 'test_domain', 'service': 'test_batch'}]))
+
     def test_json_encoder(self):
         """Test the JSON Encoder."""
         ha_json_enc = remote.JSONEncoder()
@@ -41,6 +41,10 @@ class TestSetup:
         """Clean up."""
         self.hass.stop()
 
+        manifest = self.hass.config.path(setup.REQUIREMENTS_MANIFEST)
+        if os.path.isfile(manifest):
+            os.remove(manifest)
+
         # if os.path.isfile(VERSION_PATH):
         #     os.remove(VERSION_PATH)
 
@@ -240,6 +244,27 @@ class TestSetup:
             'package==0.0.1', target=self.hass.config.path('deps'),
             constraints=os.path.join('ha_package_path', CONSTRAINT_FILE))
 
+    @mock.patch('homeassistant.util.package.install_package',
+                return_value=True)
+    def test_satisfied_requirements_not_installed_again(self, mock_install):
+        """Test that satisfied requirements are remembered."""
+        self.hass.config.skip_pip = False
+        loader.set_component(
+            'comp', MockModule('comp', requirements=['package==0.0.1']))
+        loader.set_component(
+            'comp2', MockModule('comp2', requirements=['package==0.0.1']))
+
+        assert setup.setup_component(self.hass, 'comp')
+        assert setup.setup_component(self.hass, 'comp2')
+        assert mock_install.call_count == 1
+
+        self.hass.data.pop(setup.DATA_REQUIREMENTS)
+        loader.set_component(
+            'comp3', MockModule('comp3', requirements=['package==0.0.1']))
+
+        assert setup.setup_component(self.hass, 'comp3')
+        assert mock_install.call_count == 1
+
     def test_component_not_setup_twice_if_loaded_during_other_setup(self):
         """Test component setup while waiting for lock is not setup twice."""
         result = []
@@ -464,3 +489,91 @@ def test_component_warn_slow_setup(hass):
         assert logger_method == setup._LOGGER.warning
 
         assert mock_call().cancel.called
+
+
+@asyncio.coroutine
+def test_setup_components_dependencies_first(hass):
+    """Test that components start once their dependencies are set up."""
+    call_order = []
+
+    def track_setup(domain):
+        """Return a setup that records the order of the setups."""
+        def setup_component(hass, config):
+            """Track the setup."""
+            call_order.append(domain)
+            return True
+        return setup_component
+
+    loader.set_component('comp_first', MockModule(
+        'comp_first', setup=track_setup('comp_first')))
+    loader.set_component('comp_dep', MockModule(
+        'comp_dep', setup=track_setup('comp_dep')))
+    loader.set_component('comp_main', MockModule(
+        'comp_main', ['comp_dep'], setup=track_setup('comp_main')))
+
+    yield from setup.async_setup_components(
+        hass, ['comp_main', 'comp_first'], {}, first=['comp_first'])
+
+    assert call_order == ['comp_first', 'comp_dep', 'comp_main']
+    assert 'comp_main' in hass.config.components
+
+
+@asyncio.coroutine
+def test_setup_components_slow_component(hass):
+    """Test that a slow component is not waited for."""
+    release = asyncio.Event(loop=hass.loop)
+
+    @asyncio.coroutine
+    def slow_setup(hass, config):
+        """Wait until the test releases the setup."""
+        yield from release.wait()
+        return True
+
+    loader.set_component('comp_slow', MockModule(
+        'comp_slow', async_setup=slow_setup))
+    loader.set_component('comp_after_slow', MockModule(
+        'comp_after_slow', ['comp_slow']))
+    loader.set_component('comp_fast', MockModule('comp_fast'))
+
+    with mock.patch.object(setup, 'COMPONENT_SETUP_TIMEOUT', 0.01):
+        yield from setup.async_setup_components(
+            hass, ['comp_after_slow', 'comp_fast'], {})
+
+    assert 'comp_fast' in hass.config.components
+    assert 'comp_slow' not in hass.config.components
+    assert 'comp_after_slow' not in hass.config.components
+
+    release.set()
+    yield from setup.async_setup_component(hass, 'comp_after_slow', {})
+
+    assert 'comp_slow' in hass.config.components
+    assert 'comp_after_slow' in hass.config.components
+
+
+@asyncio.coroutine
+def test_setup_component_tracked(hass):
+    """Test that setups outside the startup scheduler are tracked."""
+    module = MockModule('comp_sync')
+    loader.set_component('comp_sync', module)
+
+    with mock.patch.object(hass, 'async_add_job',
+                           wraps=hass.async_add_job) as mock_add_job:
+        assert (yield from setup.async_setup_component(hass, 'comp_sync', {}))
+
+    targets = [call[0][0] for call in mock_add_job.call_args_list]
+    assert module.setup in targets
+
+
+@asyncio.coroutine
+def test_setup_components_untracked(hass):
+    """Test that the startup scheduler does not track setups."""
+    module = MockModule('comp_sync')
+    loader.set_component('comp_sync', module)
+
+    with mock.patch.object(hass, 'async_add_job',
+                           wraps=hass.async_add_job) as mock_add_job:
+        yield from setup.async_setup_components(hass, ['comp_sync'], {})
+
+    assert 'comp_sync' in hass.config.components
+    targets = [call[0][0] for call in mock_add_job.call_args_list]
+    assert module.setup not in targets
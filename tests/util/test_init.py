@@ -1,4 +1,5 @@
 """Test Home Assistant util methods."""
+import asyncio
 import unittest
 from unittest.mock import patch
 from datetime import datetime, timedelta
@@ -266,3 +267,55 @@ class TestUtil(unittest.TestCase):
 
         self.assertTrue(tester.hello())
         self.assertTrue(tester.goodbye())
+
+
+def test_async_throttle(loop):
+    """Test that the async throttle coalesces and caches calls."""
+    calls = []
+
+    @util.AsyncThrottle(timedelta(seconds=4))
+    @asyncio.coroutine
+    def fetch():
+        """Return the number of calls."""
+        calls.append(1)
+        yield from asyncio.sleep(0, loop=loop)
+        return len(calls)
+
+    # Concurrent calls share one call
+    assert loop.run_until_complete(asyncio.gather(
+        fetch(), fetch(), loop=loop)) == [1, 1]
+
+    # Calls within min_time get the cached result
+    assert loop.run_until_complete(fetch()) == 1
+    assert loop.run_until_complete(fetch(no_throttle=True)) == 2
+
+    plus5 = dt_util.utcnow() + timedelta(seconds=5)
+    with patch('homeassistant.util.utcnow', return_value=plus5):
+        assert loop.run_until_complete(fetch()) == 3
+
+
+def test_async_throttle_exception(loop):
+    """Test that exceptions reach all callers and are not cached."""
+    calls = []
+
+    class Tester(object):
+        """A tester class for the throttle."""
+
+        @util.AsyncThrottle(timedelta(seconds=4))
+        @asyncio.coroutine
+        def fetch(self):
+            """Fail the first call."""
+            calls.append(1)
+            yield from asyncio.sleep(0, loop=loop)
+            if len(calls) == 1:
+                raise ValueError()
+            return True
+
+    tester = Tester()
+    results = loop.run_until_complete(asyncio.gather(
+        tester.fetch(), tester.fetch(), loop=loop, return_exceptions=True))
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert loop.run_until_complete(tester.fetch())
+    assert loop.run_until_complete(Tester().fetch())
+    assert len(calls) == 3
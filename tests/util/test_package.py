@@ -1,4 +1,5 @@
 """Test Home Assistant package util methods."""
+# pylint: disable=protected-access
 import asyncio
 import logging
 import os
@@ -201,6 +202,46 @@ def test_check_package_zip():
     assert not package.check_package_exists(TEST_ZIP_REQ)
 
 
+def test_check_package_shares_environment():
+    """Test that the installed packages are only scanned once."""
+    package._reset_environment()
+    with patch('homeassistant.util.package.pkg_resources.Environment',
+               wraps=pkg_resources.Environment) as mock_env:
+        assert package.check_package_exists(TEST_EXIST_REQ)
+        assert package.check_package_exists(TEST_EXIST_REQ)
+
+    assert mock_env.call_count == 1
+
+
+def test_satisfied_requirements_manifest(tmpdir):
+    """Test the manifest of satisfied requirements."""
+    path = str(tmpdir.join('manifest.json'))
+    assert package.load_satisfied_requirements(path) == set()
+
+    package.save_satisfied_requirements(path, [TEST_EXIST_REQ])
+    assert package.load_satisfied_requirements(path) == {TEST_EXIST_REQ}
+
+    with patch('homeassistant.util.package._manifest_key',
+               return_value=[['/deps', 1]]):
+        assert package.load_satisfied_requirements(path) == set()
+
+
+def test_satisfied_requirements_manifest_dir_on_path(tmpdir):
+    """Test that changes next to the manifest do not invalidate it."""
+    path = str(tmpdir.join('manifest.json'))
+    lib_dir = tmpdir.mkdir('deps').mkdir('site-packages')
+
+    with patch('homeassistant.util.package.sys.path',
+               [str(tmpdir), str(lib_dir)] + sys.path):
+        package.save_satisfied_requirements(path, [TEST_EXIST_REQ])
+        tmpdir.join('home-assistant_v2.db-journal').write('')
+        assert package.load_satisfied_requirements(path) == {TEST_EXIST_REQ}
+
+        lib_dir.mkdir('new_package')
+        os.utime(str(lib_dir), (0, 0))
+        assert package.load_satisfied_requirements(path) == set()
+
+
 def test_get_user_site(deps_dir, lib_dir, mock_popen, mock_env_copy):
     """Test get user site directory."""
     env = mock_env_copy()
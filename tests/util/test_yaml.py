@@ -1,6 +1,8 @@
 """Test Home Assistant yaml loader."""
 import io
 import os
+import tempfile
+import time
 import unittest
 from unittest.mock import patch
 
@@ -387,6 +389,112 @@ class TestSecrets(unittest.TestCase):
             "Expected an error about logger: value"
 
 
+class TestYamlCache(unittest.TestCase):
+    """Test the cache of parsed yaml files."""
+
+    # pylint: disable=invalid-name
+
+    def setUp(self):
+        """Create a directory with configuration files."""
+        yaml.clear_yaml_cache()
+        self._tmp = tempfile.TemporaryDirectory()
+        self._dir = self._tmp.name
+        self._write('configuration.yaml',
+                    'key: !include included.yaml\nlist:\n- 1\n')
+        self._write('included.yaml', 'value: 1\n')
+
+    def tearDown(self):
+        """Remove the directory and clear the cache."""
+        yaml.clear_yaml_cache()
+        self._tmp.cleanup()
+
+    def _write(self, fname, content, age=60):
+        """Write a file that was last modified age seconds ago."""
+        path = os.path.join(self._dir, fname)
+        with open(path, 'w') as fil:
+            fil.write(content)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        os.utime(self._dir, (mtime, mtime))
+        return path
+
+    def _load(self):
+        """Load the configuration, return the result and parse count."""
+        with patch('homeassistant.util.yaml.yaml.load',
+                   wraps=yaml.yaml.load) as mock_load:
+            conf = yaml.load_yaml(
+                os.path.join(self._dir, 'configuration.yaml'))
+        return conf, mock_load.call_count
+
+    def test_cached_until_include_changes(self):
+        """Test that files are parsed again when an include changes."""
+        conf, parsed = self._load()
+        assert parsed == 2
+        assert conf == {'key': {'value': 1}, 'list': [1]}
+
+        conf, parsed = self._load()
+        assert parsed == 0
+        assert conf == {'key': {'value': 1}, 'list': [1]}
+        assert conf['list'].__line__ == 2
+        assert conf['list'].__config_file__.endswith('configuration.yaml')
+
+        # Callers get their own copy to modify
+        conf['key']['value'] = 2
+        assert self._load()[0]['key'] == {'value': 1}
+
+        self._write('included.yaml', 'value: 10\n', age=30)
+        conf, parsed = self._load()
+        assert parsed == 2
+        assert conf['key'] == {'value': 10}
+
+    def test_recently_modified_not_cached(self):
+        """Test that files modified while loading are parsed again."""
+        self._write('included.yaml', 'value: 1\n', age=0)
+        self._load()
+        assert self._load()[1] == 2
+
+    def test_env_var_not_cached(self):
+        """Test that files with environment variables are not cached."""
+        self._write('included.yaml', 'value: !env_var YAML_CACHE_TEST\n')
+        with patch.dict(os.environ, {'YAML_CACHE_TEST': 'first'}):
+            assert self._load()[0]['key'] == {'value': 'first'}
+        with patch.dict(os.environ, {'YAML_CACHE_TEST': 'second'}):
+            conf, parsed = self._load()
+        assert parsed == 2
+        assert conf['key'] == {'value': 'second'}
+
+    def test_save_and_load_cache(self):
+        """Test that the cache is kept between startups."""
+        cache_path = os.path.join(self._dir, '.yaml_cache')
+        self._load()
+        yaml.save_cache(cache_path)
+        assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+        yaml.clear_yaml_cache()
+        yaml.load_cache(cache_path)
+        conf, parsed = self._load()
+        assert parsed == 0
+        assert conf == {'key': {'value': 1}, 'list': [1]}
+
+    def test_save_cache_per_directory(self):
+        """Test that saving one directory keeps others to be saved."""
+        other = tempfile.TemporaryDirectory()
+        self.addCleanup(other.cleanup)
+        other_path = os.path.join(other.name, 'other.yaml')
+        with open(other_path, 'w') as fil:
+            fil.write('other: 1\n')
+        mtime = time.time() - 60
+        os.utime(other_path, (mtime, mtime))
+
+        self._load()
+        yaml.load_yaml(other_path)
+        yaml.save_cache(os.path.join(self._dir, '.yaml_cache'))
+
+        other_cache = os.path.join(other.name, '.yaml_cache')
+        yaml.save_cache(other_cache)
+        assert os.path.isfile(other_cache)
+
+
 def test_representing_yaml_loaded_data():
     """Test we can represent YAML loaded data."""
     files = {YAML_CONFIG_FILE: 'key: [1, "2", 3]'}